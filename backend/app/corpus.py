@@ -0,0 +1,255 @@
+import json
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .models import JobAnalysis, JobPosting
+from .scoring import CorpusStats, terms
+from .skills import tokenize
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL UNIQUE,
+    url TEXT NOT NULL,
+    title TEXT NOT NULL,
+    company TEXT NOT NULL,
+    location TEXT,
+    work_type TEXT,
+    skills TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs (company COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_jobs_last_seen ON jobs (last_seen);
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+    title, company, location, work_type, skills, description, tokenize = 'porter unicode61'
+);
+CREATE TABLE IF NOT EXISTS fits (
+    resume_id TEXT NOT NULL,
+    job_id TEXT NOT NULL,
+    taxonomy TEXT NOT NULL,
+    fit_score REAL NOT NULL,
+    analysis TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (resume_id, job_id)
+);
+CREATE TABLE IF NOT EXISTS job_terms (
+    job_id TEXT PRIMARY KEY,
+    length INTEGER NOT NULL,
+    terms TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS term_df (
+    term TEXT PRIMARY KEY,
+    df INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS text_totals (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    docs INTEGER NOT NULL,
+    length INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO text_totals (id, docs, length) VALUES (1, 0, 0);
+"""
+
+# bm25() column weights for jobs_fts, in declaration order.
+_WEIGHTS = (10.0, 6.0, 3.0, 2.0, 8.0, 1.0)
+
+
+def fts_query(text: str) -> str:
+    """Free text -> FTS5 AND query; every token is quoted so user input can never be FTS syntax."""
+    quoted = [f'"{token}"' for token in tokenize(text)]
+    if quoted:
+        quoted[-1] += "*"  # prefix match on the last word, for search-as-you-type
+    return " ".join(quoted)
+
+
+class JobCorpus:
+    """
+    Every parsed JobPosting, kept in SQLite next to saved applications.
+
+    An FTS5 table is the inverted index over title, company, location, work type, skills and description;
+    search ranks with bm25 weighted towards title and skills and filters on the plain columns. Document
+    frequencies of description terms are kept alongside (`text_stats`), so fit-score IDF depends only on
+    what is indexed, not on request order or process lifetime.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._conn().executescript(_SCHEMA)
+        self._backfill_terms()
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def upsert(self, job: JobPosting) -> None:
+        now = datetime.now(timezone.utc).isoformat()
+        skills = "|" + "|".join(skill.lower() for skill in job.required_skills) + "|"
+        conn = self._conn()
+        with self._write_lock, conn:
+            conn.execute(
+                "INSERT INTO jobs (id, url, title, company, location, work_type, skills, first_seen, last_seen, record) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET url = excluded.url, title = excluded.title, company = excluded.company, "
+                "location = excluded.location, work_type = excluded.work_type, skills = excluded.skills, "
+                "last_seen = excluded.last_seen, record = excluded.record",
+                (job.id, job.url, job.title, job.company, job.location, job.work_type, skills, now, now,
+                 job.model_dump_json()),
+            )
+            seq = conn.execute("SELECT seq FROM jobs WHERE id = ?", (job.id,)).fetchone()[0]
+            conn.execute("DELETE FROM jobs_fts WHERE rowid = ?", (seq,))
+            conn.execute(
+                "INSERT INTO jobs_fts (rowid, title, company, location, work_type, skills, description) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (seq, job.title, job.company, job.location or "", job.work_type or "",
+                 " ".join(job.required_skills), job.description),
+            )
+            self._index_terms(conn, job)
+
+    def _index_terms(self, conn: sqlite3.Connection, job: JobPosting) -> None:
+        """
+        Swap the job's previous description terms for the current ones in term_df and text_totals. Partial
+        (CSV-only) postings contribute nothing, so their stub text never stands in for the real description.
+        """
+        counts = terms(job.description)
+        new_terms = sorted(counts)
+        length = sum(counts.values())
+        row = conn.execute("SELECT length, terms FROM job_terms WHERE job_id = ?", (job.id,)).fetchone()
+        old_length, old_terms = (row[0], json.loads(row[1])) if row else (0, [])
+        if job.partial:
+            if row:
+                conn.executemany("UPDATE term_df SET df = df - 1 WHERE term = ?", [(term,) for term in old_terms])
+                conn.execute("DELETE FROM term_df WHERE df <= 0")
+                conn.execute("DELETE FROM job_terms WHERE job_id = ?", (job.id,))
+                conn.execute("UPDATE text_totals SET docs = docs - 1, length = length - ? WHERE id = 1", (old_length,))
+            return
+        if row and old_length == length and old_terms == new_terms:
+            return
+        conn.executemany("UPDATE term_df SET df = df - 1 WHERE term = ?", [(term,) for term in old_terms])
+        conn.executemany(
+            "INSERT INTO term_df (term, df) VALUES (?, 1) ON CONFLICT(term) DO UPDATE SET df = df + 1",
+            [(term,) for term in new_terms],
+        )
+        conn.execute("DELETE FROM term_df WHERE df <= 0")
+        conn.execute(
+            "INSERT OR REPLACE INTO job_terms (job_id, length, terms) VALUES (?, ?, ?)",
+            (job.id, length, json.dumps(new_terms)),
+        )
+        conn.execute(
+            "UPDATE text_totals SET docs = docs + ?, length = length + ? WHERE id = 1",
+            (0 if row else 1, length - old_length),
+        )
+
+    def _backfill_terms(self) -> None:
+        # One-time: jobs indexed before term statistics were kept.
+        conn = self._conn()
+        rows = conn.execute(
+            "SELECT record FROM jobs WHERE id NOT IN (SELECT job_id FROM job_terms) ORDER BY seq"
+        ).fetchall()
+        if not rows:
+            return
+        with self._write_lock, conn:
+            for row in rows:
+                self._index_terms(conn, JobPosting.model_validate_json(row[0]))
+
+    def text_stats(self, vocabulary: Set[str]) -> CorpusStats:
+        """Indexed description count, average length and document frequency of each term in `vocabulary`."""
+        conn = self._conn()
+        docs, length = conn.execute("SELECT docs, length FROM text_totals WHERE id = 1").fetchone()
+        df: Dict[str, int] = {}
+        words = list(vocabulary)
+        for start in range(0, len(words), 500):
+            chunk = words[start:start + 500]
+            df.update(conn.execute(f"SELECT term, df FROM term_df WHERE term IN ({', '.join('?' * len(chunk))})", chunk))
+        return CorpusStats(docs=docs, avg_length=length / docs if docs else 0.0, df=df)
+
+    def get_many(self, job_ids: Iterable[str]) -> Dict[str, JobPosting]:
+        ids = list(job_ids)
+        jobs: Dict[str, JobPosting] = {}
+        conn = self._conn()
+        for start in range(0, len(ids), 500):  # stay under SQLite's bound-parameter limit
+            chunk = ids[start:start + 500]
+            rows = conn.execute(
+                f"SELECT id, record FROM jobs WHERE id IN ({', '.join('?' * len(chunk))})", chunk
+            )
+            jobs.update((row[0], JobPosting.model_validate_json(row[1])) for row in rows)
+        return jobs
+
+    def record_fits(self, resume_id: str, taxonomy: str, analyses: Iterable[JobAnalysis]) -> None:
+        """
+        Remember the last analysis of each job for a resume so later rescoring can diff against it. Unscored
+        (partial) analyses are skipped.
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        rows = [
+            (resume_id, analysis.job.id, taxonomy, analysis.fit_score, analysis.model_dump_json(exclude={"job"}), now)
+            for analysis in analyses
+            if analysis.fit_score is not None
+        ]
+        conn = self._conn()
+        with self._write_lock, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO fits (resume_id, job_id, taxonomy, fit_score, analysis, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def fits(self, resume_id: str) -> Dict[str, Tuple[str, dict]]:
+        """job_id -> (taxonomy version, analysis fields without the posting) for every job scored for a resume."""
+        rows = self._conn().execute("SELECT job_id, taxonomy, analysis FROM fits WHERE resume_id = ?", (resume_id,))
+        return {row[0]: (row[1], json.loads(row[2])) for row in rows}
+
+    def count(self) -> int:
+        return self._conn().execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def search(
+        self,
+        query: str = "",
+        company: Optional[str] = None,
+        location: Optional[str] = None,
+        work_type: Optional[str] = None,
+        skill: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> Tuple[int, List[JobPosting]]:
+        """(total matches, one page of postings): best bm25 rank first, or most recently seen without a query."""
+        clauses: List[str] = []
+        params: List[object] = []
+        match = fts_query(query)
+        if match:
+            clauses.append("jobs_fts MATCH ?")
+            params.append(match)
+        if company:
+            clauses.append("j.company LIKE ?")
+            params.append(f"%{company}%")
+        if location:
+            clauses.append("j.location LIKE ?")
+            params.append(f"%{location}%")
+        if work_type:
+            clauses.append("j.work_type LIKE ?")
+            params.append(work_type)
+        if skill:
+            clauses.append("j.skills LIKE ?")
+            params.append(f"%|{skill.lower()}|%")
+        source = "jobs j JOIN jobs_fts ON jobs_fts.rowid = j.seq" if match else "jobs j"
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        order = f"bm25(jobs_fts, {', '.join(str(weight) for weight in _WEIGHTS)})" if match else "j.last_seen DESC"
+        conn = self._conn()
+        total = conn.execute(f"SELECT COUNT(*) FROM {source}{where}", params).fetchone()[0]
+        rows = conn.execute(
+            f"SELECT j.record FROM {source}{where} ORDER BY {order} LIMIT ? OFFSET ?",
+            params + [limit, offset],
+        )
+        return total, [JobPosting.model_validate_json(row[0]) for row in rows]
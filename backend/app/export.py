@@ -0,0 +1,102 @@
+import csv
+import io
+from typing import Any, Callable, Dict, Iterable, Iterator, List
+
+from .models import SavedRecord
+
+
+EXPORT_BATCH_ROWS = 1000  # rows per CSV chunk / Arrow record batch
+
+# Column name -> value for one saved application. List values become "a|b" in CSV and list<string> columns
+# in Parquet/Arrow.
+EXPORT_COLUMNS: Dict[str, Callable[[SavedRecord], Any]] = {
+    "id": lambda record: record.id,
+    "job_id": lambda record: record.job.id,
+    "job_title": lambda record: record.job.title,
+    "company": lambda record: record.job.company,
+    "location": lambda record: record.job.location,
+    "work_type": lambda record: record.job.work_type,
+    "salary": lambda record: record.job.salary,
+    "fit_score": lambda record: record.fit_score,
+    "missing_skills": lambda record: record.missing_skills,
+    "required_skills": lambda record: record.job.required_skills,
+    "linkedin_url": lambda record: record.job.url,
+    "timestamp": lambda record: record.timestamp,
+    "has_generated": lambda record: record.has_generated,
+}
+DEFAULT_EXPORT_COLUMNS = ["job_title", "company", "fit_score", "missing_skills", "linkedin_url", "timestamp", "has_generated"]
+COLUMNAR_FORMATS = {"parquet": ".parquet", "arrow": ".arrow"}
+
+
+class ExportUnavailable(Exception):
+    """Raised when a columnar export is requested but pyarrow is not installed."""
+
+
+def parse_columns(columns: str) -> List[str]:
+    """Comma-separated column names -> validated list (duplicates dropped); raises ValueError on unknown names."""
+    names = list(dict.fromkeys(name.strip() for name in columns.split(",") if name.strip()))
+    unknown = [name for name in names if name not in EXPORT_COLUMNS]
+    if unknown:
+        raise ValueError(f"Unknown column(s): {', '.join(unknown)}; choose from {', '.join(EXPORT_COLUMNS)}")
+    return names or list(DEFAULT_EXPORT_COLUMNS)
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, list):
+        return "|".join(value)
+    return "" if value is None else value
+
+
+def iter_csv(records: Iterable[SavedRecord], columns: List[str]) -> Iterator[str]:
+    """CSV text in chunks of EXPORT_BATCH_ROWS rows, quoted by the csv module; memory stays at one chunk."""
+    getters = [EXPORT_COLUMNS[name] for name in columns]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    rows = 0
+    for record in records:
+        writer.writerow([_csv_value(getter(record)) for getter in getters])
+        rows += 1
+        if rows % EXPORT_BATCH_ROWS == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def write_columnar(records: Iterable[SavedRecord], columns: List[str], fmt: str, path: str) -> int:
+    """
+    Write records to `path` as Parquet or an Arrow IPC file, one record batch at a time. Returns the row
+    count. pyarrow is optional and only imported here.
+    """
+    try:
+        import pyarrow as pa  # type: ignore
+        import pyarrow.parquet as pq  # type: ignore
+    except ImportError as exc:
+        raise ExportUnavailable("Parquet/Arrow export needs pyarrow: pip install pyarrow") from exc
+
+    types = {"fit_score": pa.float64(), "has_generated": pa.bool_()}
+    types.update({name: pa.list_(pa.string()) for name in ("missing_skills", "required_skills")})
+    schema = pa.schema([(name, types.get(name, pa.string())) for name in columns])
+    getters = [EXPORT_COLUMNS[name] for name in columns]
+
+    writer = pq.ParquetWriter(path, schema) if fmt == "parquet" else pa.ipc.new_file(path, schema)
+    rows = 0
+    batch: List[SavedRecord] = []
+
+    def flush() -> None:
+        arrays = [[getter(record) for record in batch] for getter in getters]
+        writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+        batch.clear()
+
+    try:
+        for record in records:
+            batch.append(record)
+            rows += 1
+            if len(batch) == EXPORT_BATCH_ROWS:
+                flush()
+        if batch or not rows:
+            flush()
+    finally:
+        writer.close()
+    return rows
@@ -0,0 +1,317 @@
+"""
+Single-pass field extraction for LinkedIn job pages.
+
+The page is tokenized once; visible text, the few tags we read (meta, time, title, guest top-card
+elements) and the embedded JSON blobs (voyager <code> payloads, JSON-LD) are collected in that walk.
+"""
+
+import json
+import re
+from datetime import datetime, timezone
+from html import unescape
+from typing import Any, Dict, Iterator, List, Optional
+
+from pydantic import BaseModel
+
+
+# One alternation walks the whole document: raw-text blocks, comments/doctype, opening and closing tags.
+_TOKEN_RE = re.compile(
+    r"<(?P<raw>script|style|code)\b(?P<raw_attrs>[^>]*)>(?P<raw_body>.*?)</(?P=raw)\s*>"
+    r"|<!--.*?-->|<![^>]*>"
+    r"|<(?P<tag>[a-zA-Z][\w:-]*)(?P<attrs>[^>]*)>"
+    r"|</(?P<close>[a-zA-Z][\w:-]*)\s*>",
+    flags=re.IGNORECASE | re.DOTALL,
+)
+_ATTR_RE = re.compile(r'([\w:-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\')')
+_WS_RE = re.compile(r"\s+")
+_SALARY_RE = re.compile(r"\$[^$\n]{1,40}?-\s*\$[^$\n]{1,40}?yr", flags=re.IGNORECASE)
+_APPLICANTS_RE = re.compile(r"((?:over\s+)?\d[\d,]*\s+(?:people clicked apply|applicants?))", flags=re.IGNORECASE)
+_WORK_TYPE_RE = re.compile(r"\b(Hybrid|Remote|On[- ]?site)\b", flags=re.IGNORECASE)
+_MESSAGE_RE = re.compile(r"^Message\s+(.+)$", flags=re.IGNORECASE)
+
+_VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+
+# Guest (logged-out) job pages render the top card as plain markup; map its classes to fields.
+_CLASS_FIELDS = [
+    ("top-card-layout__title", "title"),
+    ("topcard__title", "title"),
+    ("top-card-layout__company-url", "company"),
+    ("topcard__org-name-link", "company"),
+    ("num-applicants__caption", "applicants"),  # also carries topcard__flavor--bullet
+    ("topcard__flavor--bullet", "location"),
+    ("show-more-less-html__markup", "description"),
+    ("compensation__salary", "salary"),
+]
+
+_JOB_ENTITY_MARKER = "voyager.dash.jobs.JobPosting"
+
+# What a streamed guest page must have shown before the rest (similar jobs, footer) can be skipped.
+_GUEST_SECTIONS = {
+    "title": ("top-card-layout__title", "topcard__title"),
+    "company": ("top-card-layout__company-url", "topcard__org-name-link"),
+    "description": ("show-more-less-html__markup",),
+}
+_CRITERIA_MARKER = "description__job-criteria-list"
+_CRITERIA_END = "</ul>"
+_OVERLAP = max(len(marker) for marker in (_CRITERIA_MARKER, *sum(_GUEST_SECTIONS.values(), ())))
+
+
+class ExtractedFields(BaseModel):
+    title: Optional[str] = None
+    company: Optional[str] = None
+    description: Optional[str] = None
+    location: Optional[str] = None
+    salary: Optional[str] = None
+    work_type: Optional[str] = None
+    contact_person: Optional[str] = None
+    posted_at: Optional[str] = None
+    applicants: Optional[str] = None
+    page_text: str = ""
+
+
+def _collapse(text: str) -> str:
+    return _WS_RE.sub(" ", unescape(text)).strip()
+
+
+def _attrs(raw: str) -> Dict[str, str]:
+    return {name.lower(): unescape(dq if dq is not None else sq) for name, dq, sq in _ATTR_RE.findall(raw)}
+
+
+def _text_of(value: Any) -> Optional[str]:
+    # Voyager text fields are either plain strings or {"text": ...} view models.
+    if isinstance(value, dict):
+        value = value.get("text")
+    if isinstance(value, str) and value.strip():
+        return value.strip()
+    return None
+
+
+def _walk(value: Any) -> Iterator[dict]:
+    if isinstance(value, dict):
+        yield value
+        for child in value.values():
+            yield from _walk(child)
+    elif isinstance(value, list):
+        for child in value:
+            yield from _walk(child)
+
+
+def _set(fields: Dict[str, Optional[str]], key: str, value: Optional[str]) -> None:
+    if value and not fields.get(key):
+        fields[key] = value
+
+
+def _apply_voyager(fields: Dict[str, Optional[str]], payloads: List[dict]) -> None:
+    entities: Dict[str, dict] = {}
+    for payload in payloads:
+        for entity in payload.get("included") or []:
+            urn = entity.get("entityUrn")
+            if urn:
+                entities.setdefault(urn, {}).update({k: v for k, v in entity.items() if v is not None})
+
+    for entity in entities.values():
+        kind = entity.get("$type", "")
+        if kind.endswith("jobs.JobPosting"):
+            _set(fields, "title", _text_of(entity.get("title")))
+            _set(fields, "description", _text_of(entity.get("description")))
+            _set(fields, "company", _text_of((entity.get("companyDetails") or {}).get("name")))
+            geo = entities.get(entity.get("*location") or "")
+            if geo:
+                _set(fields, "location", geo.get("defaultLocalizedName"))
+            listed = entity.get("listedAt") or entity.get("originalListedAt")
+            if isinstance(listed, (int, float)):
+                posted = datetime.fromtimestamp(listed / 1000, tz=timezone.utc)
+                _set(fields, "posted_at", posted.date().isoformat())
+        elif kind.endswith("jobs.JobPostingCard"):
+            _set(fields, "title", _text_of(entity.get("jobPostingTitle")) or _text_of(entity.get("title")))
+            _set(fields, "company", _text_of(entity.get("primaryDescription")))
+            subtitle = _text_of(entity.get("navigationBarSubtitle"))
+            if subtitle and "·" in subtitle:
+                place = subtitle.split("·", 1)[1]
+                work_type = _WORK_TYPE_RE.search(place)
+                _set(fields, "work_type", work_type.group(1) if work_type else None)
+                _set(fields, "location", re.sub(r"\s*\([^)]*\)\s*$", "", place).strip())
+            tertiary = _text_of(entity.get("tertiaryDescription")) or ""
+            applicants = _APPLICANTS_RE.search(tertiary)
+            _set(fields, "applicants", applicants.group(1) if applicants else None)
+            for node in _walk(entity.get("jobInsightsV2ResolutionResults")):
+                text = _text_of(node)
+                if text:
+                    salary = _SALARY_RE.search(text)
+                    _set(fields, "salary", salary.group(0) if salary else None)
+        elif kind.endswith("jobs.WorkplaceType"):
+            _set(fields, "work_type", entity.get("localizedName"))
+        elif kind.endswith("organization.Company"):
+            _set(fields, "company", entity.get("name"))
+
+
+def _apply_json_ld(fields: Dict[str, Optional[str]], documents: List[Any]) -> None:
+    for node in (n for doc in documents for n in _walk(doc)):
+        if node.get("@type") != "JobPosting":
+            continue
+        _set(fields, "title", node.get("title"))
+        _set(fields, "company", (node.get("hiringOrganization") or {}).get("name"))
+        description = node.get("description")
+        if isinstance(description, str):
+            _set(fields, "description", clean_html_fragment(description))
+        _set(fields, "posted_at", node.get("datePosted"))
+        locations = node.get("jobLocation") or []
+        for place in locations if isinstance(locations, list) else [locations]:
+            address = (place or {}).get("address") or {}
+            parts = [address.get(key) for key in ("addressLocality", "addressRegion", "addressCountry")]
+            _set(fields, "location", ", ".join(p for p in parts if isinstance(p, str) and p) or None)
+        if node.get("jobLocationType") == "TELECOMMUTE":
+            _set(fields, "work_type", "Remote")
+
+
+class SectionWatcher:
+    """
+    Watches a page as it streams in and reports when everything extract_job_fields reads from a guest
+    page has arrived: top-card title and company, the description, and the job criteria list after it.
+
+    Only new text (plus a marker-sized overlap) is scanned per chunk. Logged-in pages keep their data in
+    voyager payloads near the end of the document, so they never complete early.
+    """
+
+    def __init__(self) -> None:
+        self._seen: set = set()
+        self._criteria = False
+        self._tail = ""
+        self.complete = False
+
+    def feed(self, chunk: str) -> bool:
+        if self.complete:
+            return True
+        window = self._tail + chunk
+        for section, markers in _GUEST_SECTIONS.items():
+            if section not in self._seen and any(marker in window for marker in markers):
+                self._seen.add(section)
+        start = window.rfind(_CRITERIA_MARKER)
+        if start >= 0:
+            self._criteria = True
+        elif self._criteria:
+            start = 0
+        if self._criteria and _CRITERIA_END in window[start:] and len(self._seen) == len(_GUEST_SECTIONS):
+            self.complete = True
+        self._tail = window[-_OVERLAP:]
+        return self.complete
+
+
+def clean_html_fragment(fragment: str) -> str:
+    # Small fragments only (JSON-LD descriptions); whole pages go through extract_job_fields.
+    return _collapse(re.sub(r"<[^>]+>", " ", unescape(fragment)))
+
+
+def extract_job_fields(html: str) -> ExtractedFields:
+    fields: Dict[str, Optional[str]] = {}
+    meta: Dict[str, str] = {}
+    voyager: List[dict] = []
+    json_ld: List[Any] = []
+    text_parts: List[str] = []
+    captures: List[Dict[str, Any]] = []  # open top-card elements whose text we are collecting
+    text_end: Optional[int] = None  # guest pages: visible text stops after the job criteria list
+    page_title: Optional[str] = None
+    in_title = False
+    last = 0
+
+    for match in _TOKEN_RE.finditer(html):
+        chunk = html[last:match.start()]
+        last = match.end()
+        if chunk and not chunk.isspace():
+            text_parts.append(chunk)
+            for capture in captures:
+                capture["parts"].append(chunk)
+            if in_title:
+                page_title = _collapse(chunk)
+
+        raw = match.group("raw")
+        if raw:
+            body = match.group("raw_body")
+            raw_lower = raw.lower()
+            if raw_lower == "code" and _JOB_ENTITY_MARKER in body:
+                try:
+                    voyager.append(json.loads(unescape(body)))
+                except ValueError:
+                    pass
+            elif raw_lower == "script" and "ld+json" in match.group("raw_attrs").lower():
+                try:
+                    json_ld.append(json.loads(body))
+                except ValueError:
+                    pass
+            continue
+
+        tag = match.group("tag")
+        if tag:
+            tag = tag.lower()
+            attrs_raw = match.group("attrs")
+            self_closing = attrs_raw.rstrip().endswith("/") or tag in _VOID_TAGS
+            for capture in captures:
+                if capture["tag"] == tag and not self_closing:
+                    capture["depth"] += 1
+            if tag == "title":
+                in_title = True
+            if not attrs_raw.strip():
+                continue
+            attrs = _attrs(attrs_raw)
+            if tag == "meta":
+                key = (attrs.get("property") or attrs.get("name") or "").lower()
+                if key and "content" in attrs:
+                    meta.setdefault(key, attrs["content"])
+            elif tag == "time" and "datetime" in attrs:
+                _set(fields, "posted_at", attrs["datetime"])
+            label = _MESSAGE_RE.match(attrs.get("aria-label", "").strip())
+            if label:
+                _set(fields, "contact_person", label.group(1).strip())
+            _set(fields, "company", attrs.get("data-company-name"))
+            css = attrs.get("class", "")
+            if css and not self_closing:
+                for marker, field in _CLASS_FIELDS:
+                    if marker in css:
+                        captures.append({"field": field, "tag": tag, "depth": 1, "parts": []})
+                        break
+                if text_end is None and _CRITERIA_MARKER in css:
+                    captures.append({"field": None, "tag": tag, "depth": 1, "parts": []})
+            continue
+
+        closed = (match.group("close") or "").lower()
+        if closed == "title":
+            in_title = False
+        for capture in list(captures):
+            if capture["tag"] == closed:
+                capture["depth"] -= 1
+                if capture["depth"] == 0:
+                    captures.remove(capture)
+                    if capture["field"] is None:
+                        text_end = len(text_parts)
+                    else:
+                        _set(fields, capture["field"], _collapse(" ".join(capture["parts"])) or None)
+
+    tail = html[last:]
+    if tail and not tail.isspace():
+        text_parts.append(tail)
+
+    # Structured sources first: voyager payloads are the logged-in page, JSON-LD the guest page.
+    structured: Dict[str, Optional[str]] = {}
+    _apply_voyager(structured, voyager)
+    _apply_json_ld(structured, json_ld)
+    for key, value in structured.items():
+        if value:
+            fields[key] = value
+
+    # Similar jobs and the footer follow the criteria list; their text would leak skills and salaries
+    # from other postings, and an early-stopped read (SectionWatcher) never sees it anyway.
+    page_text = _collapse(" ".join(text_parts[:text_end]))
+    _set(fields, "title", meta.get("og:title"))
+    _set(fields, "title", page_title)
+    _set(fields, "description", meta.get("description") or meta.get("og:description"))
+    if not fields.get("salary"):
+        salary = _SALARY_RE.search(page_text)
+        _set(fields, "salary", salary.group(0) if salary else None)
+    if not fields.get("work_type"):
+        work_type = _WORK_TYPE_RE.search(page_text)
+        _set(fields, "work_type", work_type.group(1) if work_type else None)
+
+    for key, value in fields.items():
+        if value:
+            fields[key] = _WS_RE.sub(" ", value).strip()
+    return ExtractedFields(page_text=page_text, **fields)
@@ -0,0 +1,224 @@
+import asyncio
+import logging
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import httpx
+
+from .extractor import SectionWatcher
+from .metrics import CACHE_LOOKUPS, FETCH_RESPONSES, stage
+from .page_cache import CachedPage, PageCache, page_key
+from .parsing import job_id_from_url
+
+
+FETCH_CONCURRENCY = int(os.getenv("FETCH_CONCURRENCY", "8"))
+FETCH_HOST_RATE = float(os.getenv("FETCH_HOST_RATE", "4"))  # requests per second per host; 0 disables
+FETCH_TIMEOUT = float(os.getenv("FETCH_TIMEOUT", "10"))
+FETCH_MAX_BYTES = int(os.getenv("FETCH_MAX_BYTES", str(4 * 1024 * 1024)))  # stop reading a page past this; 0 disables
+FETCH_STOP_EARLY = os.getenv("FETCH_STOP_EARLY", "1") != "0"  # stop once a guest page's job sections are in
+FETCH_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36",
+}
+
+_TRACKING_PARAMS = {"trk", "trackingid", "refid", "eborigin", "ebp", "lipi", "midtoken", "midsig", "originalsubdomain"}
+
+logger = logging.getLogger("hiresignal")
+
+
+class HostRateLimiter:
+    """Spaces out request starts so each host sees at most `rate` requests per second."""
+
+    def __init__(self, rate: float) -> None:
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_slot: Dict[str, float] = {}
+        self._lock = asyncio.Lock()
+
+    async def wait(self, host: str) -> None:
+        if not self.interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, 0.0))
+            self._next_slot[host] = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def canonical_job_url(url: str) -> Optional[str]:
+    """
+    One spelling per posting so duplicates collapse before anything is fetched: LinkedIn URLs become
+    https://www.linkedin.com/jobs/view/<id>/; other http(s) URLs lose fragments, tracking parameters and
+    trailing slashes. Returns None for anything that is not an http(s) URL.
+    """
+    url = url.strip()
+    job_id = job_id_from_url(url)
+    if job_id:
+        return f"https://www.linkedin.com/jobs/view/{job_id}/"
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return None
+    if parts.scheme.lower() not in ("http", "https") or not parts.hostname:
+        return None
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in _TRACKING_PARAMS and not key.lower().startswith("utm_")
+    ]
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/") or "/", urlencode(query), ""))
+
+
+def _cache_lookup(cache: Optional[PageCache], url: str) -> Tuple[str, Optional[CachedPage], Optional[str]]:
+    key = page_key(job_id_from_url(url), url)
+    cached = cache.get(key) if cache else None
+    if cached:
+        return key, cached[0], cached[1]
+    return key, None, None
+
+
+class PageReader:
+    """
+    Collects a streamed page body chunk by chunk. `feed` returns True when reading can stop: the job
+    sections are complete (SectionWatcher, with `stop_early`) or `max_bytes` have come over the wire.
+    Leaving the stream early closes the connection, so the rest of the page is never downloaded.
+    A page cut off at `max_bytes` is flagged `truncated` so it is not cached as if complete.
+    """
+
+    def __init__(self, max_bytes: int = FETCH_MAX_BYTES, stop_early: bool = FETCH_STOP_EARLY) -> None:
+        self.max_bytes = max_bytes
+        self.watcher = SectionWatcher() if stop_early else None
+        self.truncated = False
+        self._parts: List[str] = []
+
+    def feed(self, chunk: str, downloaded: int) -> bool:
+        self._parts.append(chunk)
+        if self.watcher and self.watcher.feed(chunk):
+            return True
+        return bool(self.max_bytes) and downloaded >= self.max_bytes
+
+    def finish(self, url: str, downloaded: int, stopped: bool) -> str:
+        if stopped and self.watcher and self.watcher.complete:
+            logger.info("Stopped reading %s after %d KB: job sections complete", url, downloaded // 1024)
+        elif stopped:
+            self.truncated = True
+            logger.warning("Stopped reading %s at the %d KB cap", url, self.max_bytes // 1024)
+        html = "".join(self._parts)
+        self._parts = []
+        return html
+
+
+async def read_page_async(resp: httpx.Response, url: str) -> Tuple[str, bool]:
+    reader = PageReader()
+    stopped = False
+    async for chunk in resp.aiter_text():
+        stopped = reader.feed(chunk, resp.num_bytes_downloaded)
+        if stopped:
+            break
+    return reader.finish(url, resp.num_bytes_downloaded, stopped), reader.truncated
+
+
+def _serve_cached(cache: Optional[PageCache], page: Optional[CachedPage], html: Optional[str]) -> bool:
+    fresh = bool(page and html is not None and cache and cache.is_fresh(page))
+    if cache:
+        CACHE_LOOKUPS.inc(cache="page", result="hit" if fresh else "stale" if page else "miss")
+    return fresh
+
+
+def _cache_store(
+    cache: Optional[PageCache],
+    key: str,
+    url: str,
+    page: Optional[CachedPage],
+    stale_html: Optional[str],
+    resp: httpx.Response,
+    body: Optional[str],
+    truncated: bool = False,
+) -> str:
+    if resp.status_code == 304 and page and stale_html is not None:
+        if cache:
+            cache.refresh(page)
+        logger.info("Revalidated cached page for %s", url)
+        return stale_html
+    resp.raise_for_status()
+    html = body or ""
+    if truncated:
+        logger.info("Not caching truncated page for %s", url)
+    elif cache:
+        try:
+            cache.put(key, url, html, etag=resp.headers.get("etag"), last_modified=resp.headers.get("last-modified"))
+        except Exception as exc:  # pragma: no cover - best effort
+            logger.warning("Failed to cache page for %s: %s", url, exc)
+    return html
+
+
+class AsyncFetcher:
+    """Shared AsyncClient with a global concurrency cap, a per-host rate limit and an on-disk page cache."""
+
+    def __init__(
+        self,
+        concurrency: int = FETCH_CONCURRENCY,
+        host_rate: float = FETCH_HOST_RATE,
+        timeout: float = FETCH_TIMEOUT,
+        cache: Optional[PageCache] = None,
+    ) -> None:
+        self.concurrency = max(1, concurrency)
+        self.cache = cache
+        self.client = httpx.AsyncClient(
+            headers=FETCH_HEADERS,
+            timeout=timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency),
+        )
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._limiter = HostRateLimiter(host_rate)
+
+    async def fetch(self, url: str) -> Optional[str]:
+        key, page, html = await asyncio.to_thread(_cache_lookup, self.cache, url)
+        if _serve_cached(self.cache, page, html):
+            return html
+        headers = self.cache.conditional_headers(page) if page and self.cache else {}
+        async with self._semaphore:
+            await self._limiter.wait(urlsplit(url).netloc.lower())
+            status = "error"
+            try:
+                with stage("fetch"):
+                    async with self.client.stream("GET", url, headers=headers) as resp:
+                        status = str(resp.status_code)
+                        body, truncated = await read_page_async(resp, url) if resp.is_success else (None, False)
+                return await asyncio.to_thread(_cache_store, self.cache, key, url, page, html, resp, body, truncated)
+            except Exception as exc:
+                logger.warning("Fetch failed for %s: %s", url, exc)
+                return html  # serve the stale copy if we have one
+            finally:
+                FETCH_RESPONSES.inc(status=status)
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+
+_fetcher: Optional[AsyncFetcher] = None
+_page_cache: Optional[PageCache] = None
+
+
+def get_fetcher() -> AsyncFetcher:
+    global _fetcher
+    if _fetcher is None:
+        _fetcher = AsyncFetcher(cache=get_page_cache())
+    return _fetcher
+
+
+def get_page_cache() -> PageCache:
+    global _page_cache
+    if _page_cache is None:
+        _page_cache = PageCache()
+    return _page_cache
+
+
+async def close_fetcher() -> None:
+    global _fetcher
+    if _fetcher is not None:
+        await _fetcher.aclose()
+        _fetcher = None
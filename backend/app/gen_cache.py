@@ -0,0 +1,105 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Optional
+
+
+GEN_CACHE_TTL = float(os.getenv("GEN_CACHE_TTL", str(7 * 24 * 3600)))  # seconds a generation is reused
+GEN_CACHE_MAX_MB = float(os.getenv("GEN_CACHE_MAX_MB", "64"))
+
+logger = logging.getLogger("hiresignal")
+
+
+def generation_key(
+    kind: str,
+    model: str,
+    filled_template: str,
+    description: str,
+    matched_skills: List[str],
+    resume_id: str,
+) -> str:
+    """Content address of one generation: any change to its inputs yields a new key."""
+    material = json.dumps(
+        [kind, model, filled_template, description, sorted(matched_skills), resume_id],
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class GenerationCache:
+    """
+    AI-generated text on local disk, one `<key>.json` per generation.
+
+    Entries expire after `ttl` seconds. Total size is bounded and the least recently used entries are
+    evicted first; file mtime is the LRU clock so the order survives restarts.
+    """
+
+    def __init__(self, directory: Path, ttl: float = GEN_CACHE_TTL, max_mb: float = GEN_CACHE_MAX_MB):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self._lock = threading.Lock()
+        self._sizes: "OrderedDict[str, int]" = OrderedDict()
+        self._total = 0
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for path in sorted(self.directory.glob("*.json"), key=lambda path: path.stat().st_mtime):
+            size = path.stat().st_size
+            self._sizes[path.stem] = size
+            self._total += size
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except Exception as exc:
+            logger.warning("Dropping unreadable generation %s: %s", key, exc)
+            self._remove(key)
+            return None
+        if time.time() - entry.get("created_at", 0) >= self.ttl:
+            self._remove(key)
+            return None
+        with self._lock:
+            if key in self._sizes:
+                self._sizes.move_to_end(key)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry.get("text")
+
+    def put(self, key: str, kind: str, model: str, text: str) -> None:
+        body = json.dumps({"kind": kind, "model": model, "created_at": time.time(), "text": text}).encode("utf-8")
+        tmp = self.directory / f"{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+        tmp.write_bytes(body)
+        os.replace(tmp, self._path(key))
+        with self._lock:
+            self._total += len(body) - self._sizes.pop(key, 0)
+            self._sizes[key] = len(body)
+            evict = []
+            while self._total > self.max_bytes and len(self._sizes) > 1:
+                old_key, old_size = self._sizes.popitem(last=False)
+                self._total -= old_size
+                evict.append(old_key)
+        for old_key in evict:
+            self._unlink(old_key)
+
+    def _remove(self, key: str) -> None:
+        with self._lock:
+            self._total -= self._sizes.pop(key, 0)
+        self._unlink(key)
+
+    def _unlink(self, key: str) -> None:
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,79 @@
+import json
+import logging
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from .models import JobPosting
+
+
+PARSED_CACHE_SIZE = int(os.getenv("PARSED_CACHE_SIZE", "512"))
+
+logger = logging.getLogger("hiresignal")
+
+
+class ParsedJobCache:
+    """
+    Parsed JobPosting records keyed by job key under a parser-version directory.
+
+    Each record carries the fingerprint of the page and CSV overrides it was parsed from, so a changed page
+    is re-parsed. Bumping `version` (derived from the extraction code) starts an empty directory and the
+    old ones are removed.
+    """
+
+    def __init__(self, directory: Path, version: str, max_entries: int = PARSED_CACHE_SIZE):
+        self.root = directory
+        self.version = version
+        self.directory = directory / version
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for stale in self.root.iterdir():
+            if stale.is_dir() and stale.name != version:
+                shutil.rmtree(stale, ignore_errors=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _remember(self, key: str, fingerprint: str, job: JobPosting) -> None:
+        with self._lock:
+            self._entries[key] = (fingerprint, job)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, key: str, fingerprint: str) -> Optional[JobPosting]:
+        entry = self._entry(key)
+        if not entry:
+            return None
+        cached_fingerprint, job = entry
+        return job if cached_fingerprint == fingerprint else None
+
+    def _entry(self, key: str) -> Optional[tuple]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry:
+                self._entries.move_to_end(key)
+        if not entry:
+            try:
+                stored = json.loads(self._path(key).read_text(encoding="utf-8"))
+                entry = (stored["fingerprint"], JobPosting.model_validate(stored["job"]))
+            except FileNotFoundError:
+                return None
+            except Exception as exc:
+                logger.warning("Ignoring unreadable parsed job %s: %s", key, exc)
+                return None
+            self._remember(key, *entry)
+        return entry
+
+    def put(self, key: str, fingerprint: str, job: JobPosting) -> None:
+        self._remember(key, fingerprint, job)
+        try:
+            payload = {"fingerprint": fingerprint, "job": job.model_dump()}
+            self._path(key).write_text(json.dumps(payload), encoding="utf-8")
+        except Exception as exc:  # pragma: no cover - best effort
+            logger.warning("Failed to persist parsed job %s: %s", key, exc)
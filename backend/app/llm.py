@@ -0,0 +1,152 @@
+import asyncio
+import logging
+import os
+import random
+import time
+from typing import Optional
+
+import httpx
+
+from .metrics import LLM_REQUESTS, LLM_TOKENS, stage
+
+
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1").rstrip("/")
+OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "2"))
+OPENAI_BACKOFF = float(os.getenv("OPENAI_BACKOFF", "0.5"))  # seconds, doubled per retry
+OPENAI_CONCURRENCY = int(os.getenv("OPENAI_CONCURRENCY", "8"))
+OPENAI_TPM = int(os.getenv("OPENAI_TPM", "0"))  # tokens per minute across all calls; 0 disables
+
+_RETRY_STATUSES = {408, 409, 429, 500, 502, 503, 504}
+
+logger = logging.getLogger("hiresignal")
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def estimate_tokens(text: str) -> int:
+    # ~4 characters per token for English prose; only used for budgeting, never for truncation.
+    return len(text) // 4 + 1
+
+
+class TokenBudget:
+    """Token bucket that refills `tokens_per_minute` evenly; callers wait until their estimate fits."""
+
+    def __init__(self, tokens_per_minute: int) -> None:
+        self.capacity = float(tokens_per_minute)
+        self.rate = tokens_per_minute / 60.0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: int) -> None:
+        if self.rate <= 0:
+            return
+        tokens = min(float(tokens), self.capacity)
+        # Holding the lock while sleeping keeps waiters in FIFO order.
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+
+
+class LLMError(Exception):
+    """Raised when a chat completion could not be produced after all retries."""
+
+
+class LLMClient:
+    """
+    Long-lived AsyncClient for the chat completions API.
+
+    Connections are pooled and kept alive (HTTP/2 when `h2` is installed), so concurrent generations share
+    one TLS session instead of handshaking per call. At most `concurrency` requests are in flight and, when
+    `tokens_per_minute` is set, each call first reserves its estimated prompt + completion tokens.
+    Timeouts, connection errors and retryable statuses (429/5xx) are retried with jittered exponential
+    backoff, honouring Retry-After when the server sends it.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        base_url: str = OPENAI_BASE_URL,
+        timeout: float = 15.0,
+        max_retries: int = OPENAI_MAX_RETRIES,
+        backoff: float = OPENAI_BACKOFF,
+        concurrency: int = OPENAI_CONCURRENCY,
+        tokens_per_minute: int = OPENAI_TPM,
+    ) -> None:
+        self.model = model
+        self.base_url = base_url.rstrip("/")
+        self.max_retries = max(0, max_retries)
+        self.backoff = backoff
+        self.concurrency = max(1, concurrency)
+        self.budget = TokenBudget(tokens_per_minute)
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self.client = httpx.AsyncClient(
+            headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"},
+            timeout=timeout,
+            http2=_http2_available(),
+            limits=httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency),
+        )
+
+    def _delay(self, attempt: int, resp: Optional[httpx.Response]) -> float:
+        retry_after = resp.headers.get("retry-after") if resp is not None else None
+        if retry_after:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                pass
+        return self.backoff * (2 ** attempt) * (0.5 + random.random() / 2)
+
+    async def chat(self, system: str, prompt: str, max_tokens: int = 900, temperature: float = 0.4) -> str:
+        payload = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system},
+                {"role": "user", "content": prompt},
+            ],
+            "temperature": temperature,
+            "max_completion_tokens": max_tokens,
+        }
+        url = f"{self.base_url}/chat/completions"
+        estimate = estimate_tokens(system) + estimate_tokens(prompt) + max_tokens
+        for attempt in range(self.max_retries + 1):
+            resp: Optional[httpx.Response] = None
+            await self.budget.acquire(estimate)
+            try:
+                async with self._semaphore:
+                    with stage("llm"):
+                        resp = await self.client.post(url, json=payload)
+            except (httpx.TimeoutException, httpx.TransportError) as exc:
+                LLM_REQUESTS.inc(status="error")
+                error = f"{type(exc).__name__}: {exc}"
+            else:
+                LLM_REQUESTS.inc(status=str(resp.status_code))
+                if resp.status_code < 400:
+                    data = resp.json()
+                    for kind in ("prompt_tokens", "completion_tokens"):
+                        LLM_TOKENS.inc((data.get("usage") or {}).get(kind) or 0, kind=kind[: -len("_tokens")])
+                    return data["choices"][0]["message"]["content"].strip()
+                error = f"HTTP {resp.status_code}: {resp.text[:200]}"
+                if resp.status_code not in _RETRY_STATUSES:
+                    raise LLMError(error)
+            if attempt == self.max_retries:
+                raise LLMError(error)
+            delay = self._delay(attempt, resp)
+            logger.warning("OpenAI request failed (%s), retrying in %.2fs", error, delay)
+            await asyncio.sleep(delay)
+        raise LLMError("unreachable")  # pragma: no cover
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
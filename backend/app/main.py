@@ -1,145 +1,84 @@
+import asyncio
 import csv
+import hashlib
+import inspect
 import io
 import json
 import os
 import re
+import tempfile
 import uuid
-from datetime import datetime
-from html import unescape
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-from typing import List, Optional
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Tuple
 
-import httpx
 import logging
-from fastapi import Body, FastAPI, File, Form, HTTPException, UploadFile
+from fastapi import Body, FastAPI, File, Form, HTTPException, Query, Response, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
-from pydantic import BaseModel
+from fastapi.responses import FileResponse, PlainTextResponse, StreamingResponse
+from starlette.background import BackgroundTask
+
+from . import extractor as extractor_module
+from . import metrics
+from . import parsing as parsing_module
+from . import skills as skills_module
+from .corpus import JobCorpus
+from .export import COLUMNAR_FORMATS, EXPORT_COLUMNS, ExportUnavailable, iter_csv, parse_columns, write_columnar
+from .gen_cache import GenerationCache, generation_key
+from .fetcher import canonical_job_url, close_fetcher, get_fetcher
+from .job_cache import ParsedJobCache
+from .llm import OPENAI_CONCURRENCY, LLMClient, LLMError
+from .models import (
+    GeneratedMaterials,
+    JobAnalysis,
+    JobPosting,
+    RescoreChange,
+    RescoreResult,
+    RunItemResult,
+    RunStatus,
+    SavedRecord,
+    SavePayload,
+)
+from .page_cache import page_key
+from .parse_pool import close_parse_pool, get_parse_pool
+from .parsing import (
+    SKILL_ALIASES,
+    SKILL_KEYWORDS,
+    extract_resume_text,
+    extract_skills,
+    format_salary_to_k,
+    job_id_from_url,
+    parse_job_timed,
+    stable_job_id,
+)
+from .profiler import PROFILE_ID_RE, PROFILING, ProfileMiddleware, profile_path
+from .prompts import PROMPT_JOB_TOKENS, PROMPT_RESUME_TOKENS, select_excerpts
+from .resumes import ResumeCache, ResumeProfile, resume_handle
+from .runs import BatchRunner, RunItem, RunStore
+from .scoring import TextScorer, blend, terms
+from .storage import SavedStore
 
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 ROOT_DIR = BASE_DIR.parent
-DB_PATH = BASE_DIR / "db.json"
+DB_PATH = BASE_DIR / "db.json"  # legacy JSON store, migrated into SAVED_DB_PATH on startup
+SAVED_DB_PATH = BASE_DIR / "hiresignal.db"
 INMAIL_TEMPLATE = ROOT_DIR / "templates" / "emails" / "inmail.md"
 COVER_TEMPLATE = ROOT_DIR / "templates" / "cover_letters" / "cover_letter.md"
 FETCHED_DIR = BASE_DIR / "fetched_pages"
+RESUME_DIR = BASE_DIR / "resumes"
+PARSED_DIR = BASE_DIR / "parsed_jobs"
+GENERATED_DIR = BASE_DIR / "generated"
 SAMPLE_CSV = ROOT_DIR / "templates" / "linked_in_csv" / "linkedin_jobs.csv"
 OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-5.2")
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 OPENAI_TIMEOUT = float(os.getenv("OPENAI_TIMEOUT", "15"))
 MAX_INPUT_CHARS = int(os.getenv("OPENAI_MAX_INPUT", "12000"))
+CSV_REPORT_LIMIT = 100  # example rows listed per problem kind in the /upload/csv report
 
-
-# Simple keyword list for the MVP; extend in later iterations.
-SKILL_KEYWORDS = [
-    "python",
-    "javascript",
-    "typescript",
-    "react",
-    "node",
-    "fastapi",
-    "aws",
-    "gcp",
-    "azure",
-    "sql",
-    "postgres",
-    "docker",
-    "kubernetes",
-    "ci",
-    "cd",
-    "ml",
-    "ai",
-    "llm",
-    "nlp",
-    "data",
-    "analytics",
-    "django",
-    "flask",
-    "tailwind",
-    "css",
-    "html",
-    "api",
-    "graphql",
-    "devops",
-    "governance",
-    "audit",
-    "lifecycle management",
-    "modeling",
-    "taxonomy",
-    "chatbot",
-    "voice assistant",
-    "agentic system",
-    "agent",
-    "ux",
-    "consulting",
-    "prompting",
-    "prompt engineering",
-    "workflow design",
-    "risk management",
-    "business intelligence",
-    "advanced analytics",
-    "data science",
-    "team building",
-    "project management",
-    "data visualization",
-    "data model",
-    "etl",
-    "data lake",
-    "data warehouse",
-    "data quality",
-    "data management",
-    "process engineering",
-    "automation",
-    "solution design",
-    "change management",
-    "lean operations",
-    "agile",
-    "finance",
-    "financial reporting",
-    "dashboard",
-    "product strategy",
-    "product management",
-    "customer engagement",
-    "research",
-    "vendor",
-    "statistics",
-    "hugging face",
-    "anthropic",
-    "langchain",
-    "tableau",
-    "power bi",
-    "looker",
-    "gcp",
-    "google cloud",
-    "aws",
-    "bigquery",
-    "vertex ai",
-    "airflow",
-    "snowflake",
-    "plotly",
-    "qlik",
-    "dbeaver",
-    "elastic",
-    "mongo",
-    "apache",
-    "spark",
-    "azure",
-    "git",
-    "jira",
-    "saas",
-    "databricks",
-    "streamlit",
-    "loveable",
-    "deep learning",
-    "credit lending",
-    "marketing strategy",
-    "customer analytics",
-    "site reliability engineering",
-    "sagemaker",
-    "RAG",
-    "compliance",
-    "orchestration"
-]
+SKILL_SET = frozenset(SKILL_KEYWORDS)
+# Stored fit scores carry this so rescoring knows which postings were scored under an older taxonomy.
+TAXONOMY_VERSION = hashlib.sha256(json.dumps([SKILL_KEYWORDS, SKILL_ALIASES]).encode("utf-8")).hexdigest()[:16]
 
 # Mock job records we can fall back to if fetching real content fails.
 MOCK_JOBS = [
@@ -164,46 +103,6 @@ MOCK_JOBS = [
 ]
 
 
-class JobPosting(BaseModel):
-    id: str
-    url: str
-    title: str
-    company: str
-    description: str
-    required_skills: List[str]
-    location: Optional[str] = None
-    salary: Optional[str] = None
-    work_type: Optional[str] = None
-    contact_person: Optional[str] = None
-    posted_at: Optional[str] = None
-    applicants: Optional[str] = None
-
-
-class JobAnalysis(BaseModel):
-    job: JobPosting
-    fit_score: float
-    matched_skills: List[str]
-    missing_skills: List[str]
-
-
-class GeneratedMaterials(BaseModel):
-    inmail: str
-    cover_letter: str
-
-
-class SavePayload(BaseModel):
-    job: JobPosting
-    fit_score: float
-    missing_skills: List[str]
-    generated: Optional[GeneratedMaterials] = None
-    timestamp: str
-
-
-class SavedRecord(SavePayload):
-    id: str
-    has_generated: bool = False
-
-
 app = FastAPI(title="HireSignal MVP API")
 
 logging.basicConfig(level=logging.INFO)
@@ -215,12 +114,14 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Profile-Id", "X-Total-Count"],
 )
+if PROFILING:
+    app.add_middleware(ProfileMiddleware)
 
 
 def init_db() -> None:
-    if not DB_PATH.exists():
-        DB_PATH.write_text("[]", encoding="utf-8")
+    get_saved_store()
     if not FETCHED_DIR.exists():
         FETCHED_DIR.mkdir(parents=True, exist_ok=True)
     if not INMAIL_TEMPLATE.exists():
@@ -229,95 +130,68 @@ def init_db() -> None:
         COVER_TEMPLATE.parent.mkdir(parents=True, exist_ok=True)
 
 
-def normalize_text(raw: bytes, filename: str) -> str:
-    name_lower = filename.lower()
-    text: Optional[str] = None
-
-    # PDF extraction
-    if name_lower.endswith(".pdf"):
-        try:
-            import PyPDF2  # type: ignore
-
-            reader = PyPDF2.PdfReader(io.BytesIO(raw))
-            pages = [page.extract_text() or "" for page in reader.pages]
-            text = "\n".join(pages)
-        except Exception as exc:
-            logger.warning("PDF parse failed for %s: %s", filename, exc)
-
-    # DOCX extraction
-    if text is None and name_lower.endswith(".docx"):
-        try:
-            import docx  # type: ignore
-
-            doc = docx.Document(io.BytesIO(raw))
-            text = "\n".join(paragraph.text for paragraph in doc.paragraphs)
-        except Exception as exc:
-            logger.warning("DOCX parse failed for %s: %s", filename, exc)
-
-    # Fallback to plain decode
-    if text is None:
-        text = raw.decode(errors="ignore")
-
-    # Basic cleanup to trim noisy whitespace
-    text = re.sub(r"\s+", " ", text)
-    if not text.strip():
+async def normalize_text(raw: bytes, filename: str) -> str:
+    # PDF/DOCX decoding is CPU-bound; run it in the parse pool.
+    text = await get_parse_pool().run(extract_resume_text, raw, filename)
+    if not text:
         raise HTTPException(status_code=400, detail=f"Could not parse text from {filename}")
-    return text.strip()
+    return text
 
 
-def parse_csv(file_bytes: bytes) -> List[str]:
-    decoded = file_bytes.decode(errors="ignore").splitlines()
-    reader = csv.DictReader(decoded)
+def parse_csv(lines: Iterable[str]) -> Tuple[List[dict], dict]:
+    """
+    Stream CSV rows into (rows, report). Rows are read one at a time, URLs are canonicalized and
+    deduplicated, and the report counts duplicate and invalid rows (with the first CSV_REPORT_LIMIT examples).
+    """
+    reader = csv.DictReader(lines)
     if not reader.fieldnames:
         raise HTTPException(status_code=400, detail="CSV must include a 'url' header")
 
     # Normalize headers for case-insensitive matching
-    field_map = {name.lower(): name for name in reader.fieldnames}
+    field_map = {name.strip().lower(): name for name in reader.fieldnames if name}
     url_key = field_map.get("url")
     if not url_key:
         raise HTTPException(status_code=400, detail="CSV must include a 'url' header")
 
-    benefits_key = field_map.get("benefits")
-    workplace_key = field_map.get("workplace type")
+    # Bookmarklet export columns -> row keys; anything missing comes back as "".
+    columns = {
+        "benefits": field_map.get("benefits"),
+        "workplace_type": field_map.get("workplace type"),
+        "title": field_map.get("job title") or field_map.get("title"),
+        "company": field_map.get("company"),
+        "location": field_map.get("location"),
+        "insight": field_map.get("job insight"),
+        "chips": field_map.get("footer chips"),
+    }
 
     rows = []
-    for row in reader:
-        if not row.get(url_key):
+    seen: dict = {}
+    report = {"rows": 0, "accepted": 0, "duplicates": 0, "invalid": 0, "duplicate_rows": [], "invalid_rows": []}
+    for line_number, row in enumerate(reader, start=2):  # header is line 1
+        report["rows"] += 1
+        raw_url = (row.get(url_key) or "").strip()
+        url = canonical_job_url(raw_url) if raw_url else None
+        if not url:
+            report["invalid"] += 1
+            if len(report["invalid_rows"]) < CSV_REPORT_LIMIT:
+                reason = "invalid url" if raw_url else "missing url"
+                report["invalid_rows"].append({"row": line_number, "url": raw_url[:200], "reason": reason})
             continue
-        rows.append(
-            {
-                "url": row.get(url_key, "").strip(),
-                "benefits": (row.get(benefits_key, "") if benefits_key else "").strip(),
-                "workplace_type": (row.get(workplace_key, "") if workplace_key else "").strip(),
-            }
-        )
+        if url in seen:
+            report["duplicates"] += 1
+            if len(report["duplicate_rows"]) < CSV_REPORT_LIMIT:
+                report["duplicate_rows"].append({"row": line_number, "url": raw_url[:200], "duplicate_of": seen[url]})
+            continue
+        seen[url] = line_number
+        entry = {"url": url}
+        for name, key in columns.items():
+            entry[name] = ((row.get(key) or "") if key else "").strip()
+        rows.append(entry)
+    report["accepted"] = len(rows)
 
     if not rows:
         raise HTTPException(status_code=400, detail="CSV must include at least one URL")
-    return rows
-
-
-def extract_skills(text: str) -> List[str]:
-    lowered = text.lower()
-    found = {skill for skill in SKILL_KEYWORDS if skill in lowered}
-    return sorted(found)
-
-
-def clean_html_to_text(html: str) -> str:
-    # Remove scripts/styles and collapse whitespace for a rough text extraction.
-    html = re.sub(r"(?s)<(script|style).*?>.*?(</\\1>)", " ", html, flags=re.IGNORECASE)
-    text = re.sub(r"<[^>]+>", " ", html)
-    text = re.sub(r"&nbsp;?", " ", text)
-    text = re.sub(r"\s+", " ", text)
-    return text.strip()
-
-
-def extract_first(patterns: list[str], text: str) -> Optional[str]:
-    for pattern in patterns:
-        match = re.search(pattern, text, flags=re.IGNORECASE | re.MULTILINE | re.DOTALL)
-        if match:
-            return unescape(match.group(1)).strip()
-    return None
+    return rows, report
 
 
 def get_salutation(job: JobPosting) -> str:
@@ -333,63 +207,69 @@ def load_template(path: Path) -> str:
         return ""
 
 
-def call_openai(prompt: str, max_tokens: int = 900) -> str:
+_llm_client: Optional[LLMClient] = None
+
+
+def get_llm_client() -> LLMClient:
+    global _llm_client
+    if _llm_client is None:
+        _llm_client = LLMClient(OPENAI_API_KEY, OPENAI_MODEL, timeout=OPENAI_TIMEOUT)
+    return _llm_client
+
+
+GEN_CACHE = GenerationCache(GENERATED_DIR)
+
+
+async def cached_generation(
+    kind: str,
+    filled_template: str,
+    job: JobPosting,
+    resume_text: str,
+    matched_skills: List[str],
+    prompt: str,
+    max_tokens: int,
+    force: bool = False,
+) -> str:
+    """call_openai behind GEN_CACHE; `force` skips the lookup but still stores the fresh text."""
+    key = generation_key(kind, OPENAI_MODEL, filled_template, job.description, matched_skills, resume_handle(resume_text))
+    if not force:
+        text = await asyncio.to_thread(GEN_CACHE.get, key)
+        metrics.CACHE_LOOKUPS.inc(cache="generation", result="hit" if text else "miss")
+        if text:
+            logger.info("Reusing cached %s for %s", kind, job.url)
+            return text
+    text = await call_openai(prompt, max_tokens=max_tokens)
+    if text:
+        try:
+            await asyncio.to_thread(GEN_CACHE.put, key, kind, OPENAI_MODEL, text)
+        except Exception as exc:  # pragma: no cover - best effort
+            logger.warning("Failed to cache %s: %s", kind, exc)
+    return text
+
+
+async def close_llm_client() -> None:
+    global _llm_client
+    if _llm_client is not None:
+        await _llm_client.aclose()
+        _llm_client = None
+
+
+async def call_openai(prompt: str, max_tokens: int = 900) -> str:
     if not OPENAI_API_KEY:
         raise HTTPException(status_code=500, detail="OPENAI_API_KEY not configured")
     prompt = prompt[:MAX_INPUT_CHARS]
-    headers = {
-        "Authorization": f"Bearer {OPENAI_API_KEY}",
-        "Content-Type": "application/json",
-    }
-    payload = {
-        "model": OPENAI_MODEL,
-        "messages": [
-            {"role": "system", "content": "You are a career advisor and professional resume writer."},
-            {"role": "user", "content": prompt},
-        ],
-        "temperature": 0.4,
-        "max_completion_tokens": max_tokens,
-    }
     try:
-        with httpx.Client(timeout=OPENAI_TIMEOUT) as client:
-            resp = client.post("https://api.openai.com/v1/chat/completions", headers=headers, json=payload)
-            if resp.status_code >= 400:
-                logger.warning("OpenAI error %s: %s", resp.status_code, resp.text)
-                raise HTTPException(status_code=502, detail="AI generation failed")
-            data = resp.json()
-            return data["choices"][0]["message"]["content"].strip()
-    except HTTPException:
-        raise
+        return await get_llm_client().chat(
+            "You are a career advisor and professional resume writer.", prompt, max_tokens=max_tokens
+        )
+    except LLMError as exc:
+        logger.warning("OpenAI request failed: %s", exc)
+        raise HTTPException(status_code=502, detail="AI generation failed")
     except Exception as exc:  # pragma: no cover
         logger.warning("OpenAI request failed: %s", exc)
         raise HTTPException(status_code=502, detail="AI generation failed")
 
 
-def format_salary_to_k(value: str) -> str:
-    """
-    Attempt to normalize salary strings like "$265,000.00/yr" or "$265,000 - $275,000/yr" to "$265K/yr".
-    If parsing fails, return the original string.
-    """
-    try:
-        numbers = re.findall(r"\$?\s*([0-9][0-9,\.]+)", value)
-        if not numbers:
-            return value
-
-        def fmt(num_str: str) -> str:
-            num = float(num_str.replace(",", ""))
-            k_val = int(round(num / 1000))
-            return f"${k_val}K"
-
-        suffix_part = "/yr" if "yr" in value.lower() else ""
-        if len(numbers) >= 2:
-            first, second = fmt(numbers[0]), fmt(numbers[1])
-            return f"{first}{suffix_part} - {second}{suffix_part}"
-        else:
-            return f"{fmt(numbers[0])}{suffix_part}"
-    except Exception:
-        return value
-
-
 def clean_job_title(title: str) -> str:
     """Strip company/location phrases from scraped job titles for messaging."""
     t = title.strip()
@@ -408,186 +288,123 @@ def clean_job_title(title: str) -> str:
     return t.strip(" ,")
 
 
-def sanitize_description(text: str) -> str:
-    # Remove noisy "Posted HH:MM:SS AM/PM" and LinkedIn boilerplate.
-    text = re.sub(r"Posted\s+\d{1,2}:\d{2}:\d{2}\s+(AM|PM)\.?\s*", "", text, flags=re.IGNORECASE)
-    text = re.sub(r"See this and similar jobs on LinkedIn\.?", "", text, flags=re.IGNORECASE)
-    return text.strip()
+def persist_fetched_html(url: str, html: str) -> None:
+    # Persist fetched HTML for debugging/comparison
+    try:
+        safe_name = url.replace("://", "_").replace("/", "_")
+        (FETCHED_DIR / f"{safe_name}.html").write_text(html, encoding="utf-8", errors="ignore")
+    except Exception as exc:  # pragma: no cover - best effort
+        logger.warning("Failed to persist fetched HTML for %s: %s", url, exc)
 
 
-def fetch_job_from_linkedin(
+async def fetch_job_from_linkedin_async(
     url: str,
     salary_override: Optional[str] = None,
     workplace_override: Optional[str] = None,
 ) -> Optional[JobPosting]:
-    headers = {
-        "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36",
-    }
-    try:
-        resp = httpx.get(url, headers=headers, timeout=10.0)
-        resp.raise_for_status()
-    except Exception as exc:
-        logger.warning("Fetch failed for %s: %s", url, exc)
+    html = await get_fetcher().fetch(url)
+    if html is None:
         return None
+    key, fingerprint, cached = await asyncio.to_thread(
+        _persist_and_lookup, url, html, salary_override, workplace_override
+    )
+    if cached:
+        return cached
+    # Parsing a ~1.5 MB page is CPU-bound; a worker process keeps it off the event loop and off the GIL.
+    job, timings = await get_parse_pool().run(parse_job_timed, url, html, salary_override, workplace_override)
+    metrics.record_stages(timings)
+    if job:
+        await asyncio.to_thread(remember_job, key, fingerprint, job)
+    return job
 
-    html = resp.text
-    # Persist fetched HTML for debugging/comparison
+
+def _persist_and_lookup(
+    url: str,
+    html: str,
+    salary_override: Optional[str],
+    workplace_override: Optional[str],
+) -> Tuple[str, str, Optional[JobPosting]]:
+    persist_fetched_html(url, html)
+    key, fingerprint = job_cache_key(url, html, salary_override, workplace_override)
+    return key, fingerprint, cached_job(url, key, fingerprint)
+
+
+def job_cache_key(
+    url: str,
+    html: str,
+    salary_override: Optional[str] = None,
+    workplace_override: Optional[str] = None,
+) -> Tuple[str, str]:
+    """(job key, fingerprint of the page plus CSV overrides) under which JOB_CACHE memoizes a parse."""
+    fingerprint = hashlib.sha256(html.encode("utf-8", errors="ignore"))
+    fingerprint.update(f"\0{salary_override or ''}\0{workplace_override or ''}".encode("utf-8"))
+    return page_key(job_id_from_url(url), url), fingerprint.hexdigest()
+
+
+def cached_job(url: str, key: str, fingerprint: str) -> Optional[JobPosting]:
+    cached = JOB_CACHE.get(key, fingerprint)
+    metrics.CACHE_LOOKUPS.inc(cache="parsed_job", result="hit" if cached else "miss")
+    if cached:
+        logger.info("Parsed job cache hit for %s", url)
+        index_job(cached)
+    return cached
+
+
+def remember_job(key: str, fingerprint: str, job: JobPosting) -> None:
+    JOB_CACHE.put(key, fingerprint, job)
+    index_job(job)
+
+
+def index_job(job: JobPosting) -> None:
     try:
-        safe_name = url.replace("://", "_").replace("/", "_")
-        (FETCHED_DIR / f"{safe_name}.html").write_text(html, encoding="utf-8", errors="ignore")
+        with metrics.stage("db_write"):
+            get_job_corpus().upsert(job)
     except Exception as exc:  # pragma: no cover - best effort
-        logger.warning("Failed to persist fetched HTML for %s: %s", url, exc)
-    title_patterns = [
-        r'"title"\s*:\s*"([^"]+)"',
-        r'\\"title\\":\\"([^"\\]+)',
-        r'<meta property="og:title"\s+content="([^"]+)"',
-        r'<h1[^>]*class="[^"]*top-card-layout__title[^"]*"[^>]*>([^<]+)</h1>',
-        r'<h1[^>]*class="[^"]*topcard__title[^"]*"[^>]*>([^<]+)</h1>',
-        r"<title>([^<]+)</title>",
-    ]
-    company_patterns = [
-        r'"companyName"\s*:\s*"([^"]+)"',
-        r'\\"companyName\\":\\"([^"\\]+)',
-        r'data-company-name="([^"]+)"',
-        r'"companyUniversalName"\s*:\s*"([^"]+)"',
-        r'"decoratedCompany"\s*:\s*{"name":"([^"]+)"',
-        r'<a[^>]*class="[^"]*top-card-layout__company-url[^"]*"[^>]*>([^<]+)</a>',
-        r'<a[^>]*class="[^"]*topcard__org-name-link[^"]*"[^>]*>([^<]+)</a>',
-        r'<span[^>]*class="[^"]*topcard__flavor[^"]*"[^>]*>([^<]+)</span>',
-    ]
-
-    title = extract_first(title_patterns, html)
-    if title and "|" in title:
-        title = title.split("|")[0].strip()
-
-    company = extract_first(company_patterns, html)
-    if not company and title:
-        company_tag = re.search(r"at\s+([^|<]+)\|", title or "", flags=re.IGNORECASE)
-        if company_tag:
-            company = company_tag.group(1).strip()
-
-    description_match = extract_first(
-        [
-            r'"description"\s*:\s*"(.+?)"',
-            r'\\"description\\":\\"(.+?)\\"',
-            r'<div class="show-more-less-html__markup[^"]*">(.+?)</div>',
-            r'<meta name="description"\s+content="([^"]+)"',
-            r'<meta property="og:description"\s+content="([^"]+)"',
-        ],
-        html,
-    )
-    description_text = description_match if description_match else html
-    description = sanitize_description(clean_html_to_text(description_text))
+        logger.warning("Failed to index job %s: %s", job.id, exc)
 
-    if not title or not company:
-        logger.info("Missing parsed title/company for %s; falling back to mock", url)
-        return None
 
-    # Extract skills from both the cleaned description and the full HTML to avoid missing context.
-    required_skills = sorted(
-        set(extract_skills(description)) | set(extract_skills(clean_html_to_text(html)))
-    )
+def parser_version() -> str:
+    """Hash of the extraction code and skill taxonomy; any change invalidates parsed-job records."""
+    digest = hashlib.sha256(json.dumps([SKILL_KEYWORDS, SKILL_ALIASES]).encode("utf-8"))
+    for source in (extractor_module, skills_module, parsing_module):
+        try:
+            digest.update(inspect.getsource(source).encode("utf-8"))
+        except (OSError, TypeError):  # pragma: no cover - source unavailable (frozen builds)
+            digest.update(getattr(source, "__name__", "").encode("utf-8"))
+    return digest.hexdigest()[:12]
 
-    posted_at = extract_first(
-        [
-            r'<time[^>]*datetime="([^"]+)"',
-        ],
-        html,
-    )
 
-    contact_person = extract_first(
-        [
-            r'aria-label="Message\s+([^"]+)"',
-            r"aria-label='Message\s+([^']+)'",
-            r'Message\s+([A-Za-z][A-Za-z\\s\\-\\\']+)</',
-        ],
-        html,
-    )
+JOB_CACHE = ParsedJobCache(PARSED_DIR, parser_version())
 
-    applicants = extract_first(
-        [
-            r'<span[^>]*class="[^"]*num-applicants__caption[^"]*"[^>]*>([^<]+)</span>',
-            r'<div[^>]*class="[^"]*num-applicants__caption[^"]*"[^>]*>([^<]+)</div>',
-            r'<figcaption[^>]*class="[^"]*num-applicants__caption[^"]*"[^>]*>([^<]+)</figcaption>',
-        ],
-        html,
-    )
 
-    location = extract_first(
-        [
-            r'"formattedLocation"\s*:\s*"([^"]+)"',
-            r'"jobLocation"\s*:\s*"([^"]+)"',
-            r'"formattedLocation"\s*:\s*\\"([^"\\]+)',
-            r'<span[^>]*class="[^"]*topcard__flavor--bullet[^"]*"[^>]*>([^<]+)</span>',
-            r'<span[^>]*class="[^"]*topcard__flavor[^"]*"[^>]*>([^<]+)</span>',
-            r'NavigationBarSubtitle&quot;:&quot;[^·]+·\s*([^(&]+)',
-            r'&quot;navigationBarSubtitle&quot;:&quot;[^·]+·\s*([^(&]+)',
-        ],
-        html,
-    )
+class JobUnavailable(Exception):
+    """The posting could not be fetched or parsed; raised instead of a mock when the caller can retry."""
 
-    # Simple salary extraction: look for "$... - $...yr" patterns; if none, fallback to override or unavailable
-    salary_range_match = re.search(r"\$[^$\\n]{1,40}?-\s*\$[^$\\n]{1,40}?yr", html, flags=re.IGNORECASE)
-    raw_salary = salary_range_match.group(0).strip() if salary_range_match else (salary_override or "Unavailable")
-    salary = format_salary_to_k(raw_salary) if raw_salary.lower() != "unavailable" else "Unavailable"
-
-    # Work type: prefer override from CSV, else detect hybrid/remote in html, else unavailable
-    raw_work_type = None
-    work_type_match = re.search(r"\b(Hybrid|Remote|On[- ]?site)\b", html, flags=re.IGNORECASE)
-    if work_type_match:
-        raw_work_type = work_type_match.group(1)
-
-    html_lower = html.lower()
-    hybrid_found = "hybrid" in html_lower
-    normalized_work_type = workplace_override or None
-    if normalized_work_type:
-        normalized_work_type = normalized_work_type.capitalize()
-    else:
-        if hybrid_found:
-            normalized_work_type = "Hybrid"
-        elif "remote" in html_lower:
-            normalized_work_type = "Remote"
-        else:
-            normalized_work_type = "Unavailable"
 
-    logger.info(
-        "Parsed LinkedIn job for %s -> %s @ %s | location=%r salary=%r work_type_raw=%r work_type=%r",
-        url,
-        title,
-        company,
-        location,
-        salary,
-        raw_work_type,
-        normalized_work_type,
-    )
-    return JobPosting(
-        id=str(uuid.uuid4()),
-        url=url,
-        title=title,
-        company=company,
-        description=description,
-        required_skills=required_skills,
-        location=location,
-        salary=salary,
-        work_type=normalized_work_type,
-        contact_person=contact_person,
-        posted_at=posted_at,
-        applicants=applicants,
+async def get_job_async(
+    url: str,
+    salary_override: Optional[str] = None,
+    workplace_override: Optional[str] = None,
+    strict: bool = False,
+) -> JobPosting:
+    fetched = await fetch_job_from_linkedin_async(
+        url, salary_override=salary_override, workplace_override=workplace_override
     )
-
-
-def get_job(url: str, salary_override: Optional[str] = None, workplace_override: Optional[str] = None) -> JobPosting:
-    fetched = fetch_job_from_linkedin(url, salary_override=salary_override, workplace_override=workplace_override)
     if fetched:
         return fetched
+    if strict:
+        raise JobUnavailable(f"Could not fetch or parse {url}")
+    return mock_job(url, salary_override=salary_override, workplace_override=workplace_override)
 
+
+def mock_job(url: str, salary_override: Optional[str] = None, workplace_override: Optional[str] = None) -> JobPosting:
     # Fallback to mocks if fetch/parsing fails.
     logger.info("Using mock fallback for %s", url)
     mock = MOCK_JOBS[len(url) % len(MOCK_JOBS)]
     slug = url.rstrip("/").split("/")[-1] or "listing"
     generated_title = f"{mock['title']} ({slug})"
     return JobPosting(
-        id=str(uuid.uuid4()),
+        id=stable_job_id(url),
         url=url,
         title=generated_title,
         company=mock["company"],
@@ -599,13 +416,88 @@ def get_job(url: str, salary_override: Optional[str] = None, workplace_override:
     )
 
 
-def compute_fit(job: JobPosting, resume_text: str) -> JobAnalysis:
-    resume_skills = extract_skills(resume_text)
+def dedupe_repeated_title(title: str) -> str:
+    # Bookmarklet titles repeat the visible and screen-reader text: "Data Engineer Data Engineer with verification".
+    words = title.split()
+    for size in range(len(words) // 2, 0, -1):
+        if words[:size] == words[size:2 * size]:
+            return " ".join(words[:size])
+    return title
+
+
+def csv_job(url: str, meta: dict) -> JobPosting:
+    """Partial JobPosting from bookmarklet CSV columns alone; the page is fetched later, on demand."""
+    title = dedupe_repeated_title(meta.get("title") or "") or "Untitled role"
+    benefits = meta.get("benefits") or ""
+    workplace = meta.get("workplace_type") or ""
+    details = [value for value in (title, meta.get("insight"), meta.get("chips")) if value]
+    return JobPosting(
+        id=stable_job_id(url),
+        url=url,
+        title=title,
+        company=meta.get("company") or "Unknown company",
+        description="\n".join(details),
+        required_skills=extract_skills(title),
+        location=meta.get("location") or None,
+        salary=format_salary_to_k(benefits) if "$" in benefits else "Unavailable",
+        work_type=workplace.capitalize() if workplace else "Unavailable",
+        partial=True,
+    )
+
+
+def build_resume_profile(text: str) -> ResumeProfile:
+    skills = extract_skills(text)
+    return ResumeProfile(
+        id=resume_handle(text),
+        text=text,
+        skills=skills,
+        skill_set=frozenset(skills),
+        term_counts=dict(terms(text)),
+    )
+
+
+RESUME_CACHE = ResumeCache(RESUME_DIR, build_resume_profile)
+
+
+def resolve_resume(resume_id: Optional[str], resume_text: Optional[str]) -> ResumeProfile:
+    """Look up a resume handle from /upload/resume, or profile raw text sent by older clients."""
+    if resume_id:
+        profile = RESUME_CACHE.get(resume_id)
+        if not profile:
+            raise HTTPException(status_code=404, detail="Unknown resume_id; upload the resume again")
+        return profile
+    if resume_text and resume_text.strip():
+        return RESUME_CACHE.put(resume_text)
+    raise HTTPException(status_code=400, detail="Provide resume_id or resume_text")
+
+
+TEXT_SCORER = TextScorer(lambda vocabulary: get_job_corpus().text_stats(vocabulary))
+
+
+def skill_match(job: JobPosting, resume: ResumeProfile) -> Tuple[List[str], List[str], List[str]]:
+    """(required, matched, missing) skills of a job against the resume; no I/O."""
     required = job.required_skills or extract_skills(job.description)
-    matched = sorted({skill for skill in required if skill in resume_skills})
-    missing = sorted({skill for skill in required if skill not in resume_skills})
+    matched = sorted({skill for skill in required if skill in resume.skill_set})
+    missing = sorted({skill for skill in required if skill not in resume.skill_set})
+    return required, matched, missing
+
+
+def compute_fit(job: JobPosting, resume: ResumeProfile, text_similarity: Optional[float] = None) -> JobAnalysis:
+    """
+    Skill-match ratio blended with BM25 text similarity; pass `text_similarity` when scored in a batch.
+    Partial postings get matched/missing skills from their title but no scores: a title is no basis for a
+    number compared against parsed postings. Text scoring queries SQLite, so async callers run this in a
+    thread.
+    """
+    required, matched, missing = skill_match(job, resume)
+    if job.partial:
+        return JobAnalysis(job=job, matched_skills=matched, missing_skills=missing)
     total = len(required) or 1
-    fit_score = round((len(matched) / total) * 100)
+    skill_ratio = len(matched) / total
+    if text_similarity is None:
+        with metrics.stage("scoring"):
+            text_similarity = TEXT_SCORER.score(resume.term_counts, [terms(job.description)])[0]
+    fit_score = round(blend(skill_ratio, text_similarity) * 100)
     logger.info(
         "Job skills for %s -> required=%s matched=%s missing=%s",
         job.url,
@@ -613,11 +505,39 @@ def compute_fit(job: JobPosting, resume_text: str) -> JobAnalysis:
         matched,
         missing,
     )
-    return JobAnalysis(job=job, fit_score=fit_score, matched_skills=matched, missing_skills=missing)
+    return JobAnalysis(
+        job=job,
+        fit_score=fit_score,
+        matched_skills=matched,
+        missing_skills=missing,
+        skill_score=round(skill_ratio * 100),
+        text_score=round(text_similarity * 100),
+    )
+
+
+def compute_fits(jobs: List[JobPosting], resume: ResumeProfile) -> List[JobAnalysis]:
+    """compute_fit for many jobs with one batched similarity pass against the resume."""
+    full = [job for job in jobs if not job.partial]
+    similarities: Dict[str, float] = {}
+    if full:
+        with metrics.stage("scoring"):
+            scores = TEXT_SCORER.score(resume.term_counts, [terms(job.description) for job in full])
+        similarities = {job.id: score for job, score in zip(full, scores)}
+    return [compute_fit(job, resume, similarities.get(job.id)) for job in jobs]
+
+
+def prompt_context(job: JobPosting, resume_text: str, matched_skills: List[str]) -> str:
+    """Job and resume excerpts ranked against the skills and packed into the PROMPT_*_TOKENS budgets."""
+    missing = [skill for skill in job.required_skills if skill not in matched_skills]
+    return (
+        f"Job description:\n{select_excerpts(job.description, PROMPT_JOB_TOKENS, matched_skills, missing)}\n\n"
+        f"Matched skills: {', '.join(matched_skills) if matched_skills else 'None'}\n\n"
+        f"Resume:\n{select_excerpts(resume_text, PROMPT_RESUME_TOKENS, matched_skills, missing)}\n"
+    )
 
 
-def generate_inmail(job: JobPosting, resume_text: str, matched_skills: List[str]) -> str:
-    resume_text = (resume_text or "")[:MAX_INPUT_CHARS]
+async def generate_inmail(job: JobPosting, resume_text: str, matched_skills: List[str], force: bool = False) -> str:
+    resume_text = resume_text or ""
     salutation = get_salutation(job)
     clean_title = clean_job_title(job.title)
     template = load_template(INMAIL_TEMPLATE)
@@ -646,11 +566,9 @@ def generate_inmail(job: JobPosting, resume_text: str, matched_skills: List[str]
                 "strengths that map to the role. Keep bullets crisp. Include the job URL once. "
                 "Return only the final InMail text.\n\n"
                 f"Template (filled with placeholders):\n{filled_template}\n\n"
-                f"Job description:\n{job.description}\n\n"
-                f"Matched skills: {', '.join(matched_skills) if matched_skills else 'None'}\n\n"
-                f"Resume:\n{resume_text}\n"
+                f"{prompt_context(job, resume_text, matched_skills)}"
             )
-            text = call_openai(prompt, max_tokens=800)
+            text = await cached_generation("inmail", filled_template, job, resume_text, matched_skills, prompt, 800, force)
             if text:
                 return text
         except Exception as exc:  # pragma: no cover
@@ -659,8 +577,10 @@ def generate_inmail(job: JobPosting, resume_text: str, matched_skills: List[str]
     return filled_template
 
 
-def generate_cover_letter(job: JobPosting, resume_text: str, matched_skills: List[str]) -> str:
-    resume_text = (resume_text or "")[:MAX_INPUT_CHARS]
+async def generate_cover_letter(
+    job: JobPosting, resume_text: str, matched_skills: List[str], force: bool = False
+) -> str:
+    resume_text = resume_text or ""
     clean_title = clean_job_title(job.title)
     template = load_template(COVER_TEMPLATE)
     today = datetime.now().strftime("%B %d, %Y")
@@ -688,11 +608,9 @@ def generate_cover_letter(job: JobPosting, resume_text: str, matched_skills: Lis
                 "Use the resume and job description to select the 3-5 strongest, most relevant bullets. "
                 "Keep the tone warm but professional. Return only the final cover letter text.\n\n"
                 f"Template (filled with placeholders):\n{filled_template}\n\n"
-                f"Job description:\n{job.description}\n\n"
-                f"Matched skills: {', '.join(matched_skills) if matched_skills else 'None'}\n\n"
-                f"Resume:\n{resume_text}\n"
+                f"{prompt_context(job, resume_text, matched_skills)}"
             )
-            text = call_openai(prompt, max_tokens=900)
+            text = await cached_generation("cover", filled_template, job, resume_text, matched_skills, prompt, 900, force)
             if text:
                 return text
         except Exception as exc:  # pragma: no cover
@@ -706,39 +624,87 @@ def startup_event() -> None:
     init_db()
 
 
+@app.on_event("startup")
+async def start_batch_runner() -> None:
+    await get_batch_runner().start()
+
+
+@app.on_event("shutdown")
+async def shutdown_event() -> None:
+    await get_batch_runner().stop()
+    await close_fetcher()
+    await close_llm_client()
+    close_parse_pool()
+
+
 @app.post("/upload/resume")
 async def upload_resume(file: UploadFile = File(...)) -> dict:
     contents = await file.read()
-    text = normalize_text(contents, file.filename)
-    detected_skills = extract_skills(text)
+    text = await normalize_text(contents, file.filename)
+    profile = RESUME_CACHE.put(text)
+    detected_skills = profile.skills
     try:
         # Write normalized text for legibility
         Path("resume_extracted.txt").write_text(text, encoding="utf-8", errors="ignore")
     except Exception as exc:  # pragma: no cover
         logger.warning("Failed to persist extracted resume text: %s", exc)
     logger.info("Resume skills extracted: %s", detected_skills)
-    return {"text": text, "skills": detected_skills}
+    return {"resume_id": profile.id, "text": text, "skills": detected_skills}
 
 
 @app.post("/upload/csv")
 async def upload_csv(file: UploadFile = File(...)) -> dict:
-    contents = await file.read()
-    rows = parse_csv(contents)
-    meta = {row["url"]: {"benefits": row.get("benefits"), "workplace_type": row.get("workplace_type")} for row in rows}
-    urls = [row["url"] for row in rows]
-    return {"urls": urls, "meta": meta}
+    # Decode incrementally from the spooled upload instead of reading it into memory whole.
+    stream = io.TextIOWrapper(file.file, encoding="utf-8-sig", errors="ignore", newline="")
+    try:
+        with metrics.stage("csv_parse"):
+            rows, report = await asyncio.to_thread(parse_csv, stream)
+    finally:
+        stream.detach()
+    if report["duplicates"] or report["invalid"]:
+        logger.info("CSV upload: %d rows, %d duplicates, %d invalid", report["rows"], report["duplicates"], report["invalid"])
+    # Partial postings are built by /jobs/process/metadata; the columns in `meta` are all it needs.
+    meta = {row["url"]: {key: value for key, value in row.items() if key != "url"} for row in rows}
+    return {"urls": [row["url"] for row in rows], "meta": meta, "report": report}
 
 
-@app.post("/jobs/process")
-async def process_jobs(
-    resume_text: str = Form(...),
-    urls: str = Form(...),
-    url_meta: Optional[str] = Form(None),
-) -> dict:
-    url_list = [u.strip() for u in urls.split(",") if u.strip()]
+def ndjson(payload: dict) -> str:
+    return json.dumps(payload) + "\n"
+
+
+def parse_url_list(urls: str) -> List[str]:
+    # Canonical, de-duplicated URLs so the same posting is never fetched twice in one batch.
+    canonical = (canonical_job_url(u) for u in urls.split(",") if u.strip())
+    url_list = list(dict.fromkeys(url for url in canonical if url))
     if not url_list:
         raise HTTPException(status_code=400, detail="No URLs provided")
+    return url_list
+
+
+def parse_url_meta(url_meta: Optional[str]) -> dict:
+    if not url_meta:
+        return {}
+    try:
+        meta_map = json.loads(url_meta)
+    except json.JSONDecodeError:
+        return {}
+    if not isinstance(meta_map, dict):
+        return {}
+    return {canonical_job_url(url) or url: meta for url, meta in meta_map.items()}
+
+
+def parse_job_meta(meta: Optional[str]) -> dict:
+    # One job's CSV columns (benefits, workplace_type, ...), not a URL -> meta map.
+    if not meta:
+        return {}
+    try:
+        meta_data = json.loads(meta)
+    except json.JSONDecodeError:
+        return {}
+    return meta_data if isinstance(meta_data, dict) else {}
+
 
+def clear_fetched_pages() -> None:
     # Clear previously fetched pages to avoid stale debugging artifacts
     if FETCHED_DIR.exists():
         for path in FETCHED_DIR.iterdir():
@@ -748,54 +714,166 @@ async def process_jobs(
                 except Exception as exc:  # pragma: no cover - best effort cleanup
                     logger.warning("Could not delete fetched file %s: %s", path, exc)
 
-    meta_map = {}
-    if url_meta:
-        try:
-            meta_map = json.loads(url_meta)
-        except json.JSONDecodeError:
-            meta_map = {}
+
+async def analyze_job_url(url: str, meta: dict, resume: ResumeProfile, strict: bool = False) -> JobAnalysis:
+    job = await get_job_async(
+        url,
+        salary_override=meta.get("benefits") or None,
+        workplace_override=meta.get("workplace_type") or None,
+        strict=strict,
+    )
+    analysis = await asyncio.to_thread(compute_fit, job, resume)
+    await record_fits(resume, [analysis])
+    logger.info(
+        "Fit score for %s -> %s%%; missing skills: %s",
+        url,
+        analysis.fit_score,
+        analysis.missing_skills,
+    )
+    return analysis
+
+
+async def iter_job_analyses(
+    url_list: List[str],
+    meta_map: dict,
+    resume: ResumeProfile,
+) -> AsyncIterator[Tuple[int, str, Optional[JobAnalysis], Optional[Exception]]]:
+    """
+    Yield (index, url, analysis, error) in completion order.
+
+    A fixed pool of workers pulls URLs and a bounded queue applies backpressure, so memory stays flat
+    however long the list is and an abandoned stream cancels the remaining work.
+    """
+    concurrency = min(get_fetcher().concurrency, len(url_list))
+    results: asyncio.Queue = asyncio.Queue(maxsize=concurrency)
+    pending = iter(enumerate(url_list))
+
+    async def worker() -> None:
+        for index, url in pending:
+            meta = meta_map.get(url) or {}
+            try:
+                await results.put((index, url, await analyze_job_url(url, meta, resume), None))
+            except Exception as exc:
+                logger.warning("Analysis failed for %s: %s", url, exc)
+                await results.put((index, url, None, exc))
+
+    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+    try:
+        for _ in url_list:
+            yield await results.get()
+    finally:
+        for task in workers:
+            task.cancel()
+
+
+@app.post("/jobs/process")
+async def process_jobs(
+    urls: str = Form(...),
+    url_meta: Optional[str] = Form(None),
+    resume_id: Optional[str] = Form(None),
+    resume_text: Optional[str] = Form(None),
+) -> dict:
+    url_list = parse_url_list(urls)
+    resume = resolve_resume(resume_id, resume_text)
+    clear_fetched_pages()
+    meta_map = parse_url_meta(url_meta)
 
     logger.info("Processing %d job URLs", len(url_list))
-    analyses: List[JobAnalysis] = []
-    for url in url_list:
-        meta = meta_map.get(url, {}) if isinstance(meta_map, dict) else {}
-        job = get_job(
-            url,
-            salary_override=meta.get("benefits") or None,
-            workplace_override=meta.get("workplace_type") or None,
-        )
-        analysis = compute_fit(job, resume_text)
-        logger.info(
-            "Fit score for %s -> %s%%; missing skills: %s",
-            url,
-            analysis.fit_score,
-            analysis.missing_skills,
+    # The shared fetcher bounds concurrency and per-host rate; gather keeps input order.
+    jobs: List[JobPosting] = await asyncio.gather(
+        *(
+            get_job_async(
+                url,
+                salary_override=(meta_map.get(url) or {}).get("benefits") or None,
+                workplace_override=(meta_map.get(url) or {}).get("workplace_type") or None,
+            )
+            for url in url_list
         )
-        analyses.append(analysis)
+    )
+    analyses = await asyncio.to_thread(compute_fits, jobs, resume)
+    await record_fits(resume, analyses)
 
     return {
         "jobs": [analysis.model_dump() for analysis in analyses],
     }
 
 
+@app.post("/jobs/process/stream")
+async def process_jobs_stream(
+    urls: str = Form(...),
+    url_meta: Optional[str] = Form(None),
+    resume_id: Optional[str] = Form(None),
+    resume_text: Optional[str] = Form(None),
+) -> StreamingResponse:
+    """
+    Same inputs as /jobs/process, streamed as NDJSON in completion order:
+    start -> job | error (one per URL, with running done/total) -> done.
+    """
+    url_list = parse_url_list(urls)
+    resume = resolve_resume(resume_id, resume_text)
+    clear_fetched_pages()
+    meta_map = parse_url_meta(url_meta)
+    total = len(url_list)
+    logger.info("Streaming analysis of %d job URLs", total)
+
+    async def events() -> AsyncIterator[str]:
+        yield ndjson({"event": "start", "total": total})
+        done = failed = 0
+        async for index, url, analysis, error in iter_job_analyses(url_list, meta_map, resume):
+            done += 1
+            if analysis is None:
+                failed += 1
+                yield ndjson(
+                    {"event": "error", "index": index, "url": url, "detail": str(error), "done": done, "total": total}
+                )
+            else:
+                yield ndjson(
+                    {"event": "job", "index": index, "url": url, "job": analysis.model_dump(), "done": done, "total": total}
+                )
+        yield ndjson({"event": "done", "total": total, "failed": failed})
+
+    return StreamingResponse(events(), media_type="application/x-ndjson")
+
+
+@app.post("/jobs/process/metadata")
+async def process_jobs_metadata(
+    urls: str = Form(...),
+    url_meta: Optional[str] = Form(None),
+    resume_id: Optional[str] = Form(None),
+    resume_text: Optional[str] = Form(None),
+) -> dict:
+    """
+    Metadata-first variant of /jobs/process: nothing is fetched. Jobs parsed earlier come from the corpus;
+    the rest are partial postings built from the CSV columns (`partial: true`), left unscored.
+    Enrich one with /jobs/process_one when the user opens or shortlists it.
+    """
+    url_list = parse_url_list(urls)
+    resume = resolve_resume(resume_id, resume_text)
+    meta_map = parse_url_meta(url_meta)
+    known = await asyncio.to_thread(get_job_corpus().get_many, [stable_job_id(url) for url in url_list])
+    jobs = [known.get(stable_job_id(url)) or csv_job(url, meta_map.get(url) or {}) for url in url_list]
+    logger.info("Metadata-first load of %d jobs (%d already parsed)", len(jobs), len(known))
+    analyses = await asyncio.to_thread(compute_fits, jobs, resume)
+    return {"jobs": [analysis.model_dump() for analysis in analyses]}
+
+
 @app.post("/jobs/process_one")
 async def process_job_single(
-    resume_text: str = Form(...),
     url: str = Form(...),
     meta: Optional[str] = Form(None),
+    resume_id: Optional[str] = Form(None),
+    resume_text: Optional[str] = Form(None),
 ) -> dict:
-    meta_data = {}
-    if meta:
-        try:
-            meta_data = json.loads(meta)
-        except json.JSONDecodeError:
-            meta_data = {}
-    job = get_job(
+    url = canonical_job_url(url) or url
+    resume = resolve_resume(resume_id, resume_text)
+    meta_data = parse_job_meta(meta)
+    job = await get_job_async(
         url,
         salary_override=meta_data.get("benefits"),
         workplace_override=meta_data.get("workplace_type"),
     )
-    analysis = compute_fit(job, resume_text)
+    analysis = await asyncio.to_thread(compute_fit, job, resume)
+    await record_fits(resume, [analysis])
     return {"job": analysis.model_dump()}
 
 
@@ -804,26 +882,35 @@ async def generate_ai_text(
     kind: str = Body(..., embed=True),
     job: JobPosting = Body(...),
     resume_text: str = Body(""),
+    resume_id: Optional[str] = Body(None),
     matched_skills: Optional[List[str]] = Body(None),
+    force: bool = Body(False),
 ) -> dict:
     """
     Unified AI generation endpoint. Accepts kind=inmail|cover to generate text server-side.
+    Results are cached per job/resume/template; force=true regenerates.
     """
     if kind not in {"inmail", "cover"}:
         raise HTTPException(status_code=400, detail="Invalid kind; expected 'inmail' or 'cover'")
     matched = matched_skills or []
+    if resume_id:
+        resume_text = resolve_resume(resume_id, None).text
     if kind == "inmail":
-        return {"text": generate_inmail(job, resume_text, matched)}
-    return {"text": generate_cover_letter(job, resume_text, matched)}
+        return {"text": await generate_inmail(job, resume_text, matched, force)}
+    return {"text": await generate_cover_letter(job, resume_text, matched, force)}
 
 
 @app.post("/generate/inmail")
 async def generate_inmail_endpoint(
     job: JobPosting = Body(...),
     resume_text: str = Body(""),
+    resume_id: Optional[str] = Body(None),
     matched_skills: Optional[List[str]] = Body(None),
+    force: bool = Body(False),
 ) -> dict:
-    content = generate_inmail(job, resume_text, matched_skills or [])
+    if resume_id:
+        resume_text = resolve_resume(resume_id, None).text
+    content = await generate_inmail(job, resume_text, matched_skills or [], force)
     return {"inmail": content}
 
 
@@ -831,55 +918,476 @@ async def generate_inmail_endpoint(
 async def generate_cover_letter_endpoint(
     job: JobPosting = Body(...),
     resume_text: str = Body(""),
+    resume_id: Optional[str] = Body(None),
     matched_skills: Optional[List[str]] = Body(None),
+    force: bool = Body(False),
 ) -> dict:
-    content = generate_cover_letter(job, resume_text, matched_skills or [])
+    if resume_id:
+        resume_text = resolve_resume(resume_id, None).text
+    content = await generate_cover_letter(job, resume_text, matched_skills or [], force)
     return {"cover_letter": content}
 
 
-def read_saved() -> List[SavedRecord]:
-    init_db()
-    with DB_PATH.open("r", encoding="utf-8") as f:
-        entries = json.load(f)
-        hydrated = []
-        for entry in entries:
-            if "has_generated" not in entry:
-                entry["has_generated"] = bool(entry.get("generated"))
-            hydrated.append(SavedRecord.model_validate(entry))
-        return hydrated
+@app.post("/generate/materials", response_model=GeneratedMaterials)
+async def generate_materials_endpoint(
+    job: JobPosting = Body(...),
+    resume_text: str = Body(""),
+    resume_id: Optional[str] = Body(None),
+    matched_skills: Optional[List[str]] = Body(None),
+    force: bool = Body(False),
+) -> GeneratedMaterials:
+    """InMail and cover letter in one request; both generations run concurrently on the pooled client."""
+    if resume_id:
+        resume_text = resolve_resume(resume_id, None).text
+    matched = matched_skills or []
+    inmail, cover_letter = await asyncio.gather(
+        generate_inmail(job, resume_text, matched, force),
+        generate_cover_letter(job, resume_text, matched, force),
+    )
+    return GeneratedMaterials(inmail=inmail, cover_letter=cover_letter)
+
+
+_run_store: Optional[RunStore] = None
+_batch_runner: Optional[BatchRunner] = None
+
+
+def get_run_store() -> RunStore:
+    global _run_store
+    if _run_store is None:
+        _run_store = RunStore(SAVED_DB_PATH)
+    return _run_store
+
+
+async def analyze_run_item(item: RunItem) -> JobAnalysis:
+    # An unknown resume fails the item outright (LookupError); a failed fetch raises so the runner retries
+    # it with backoff instead of checkpointing a mock posting as done.
+    resume = RESUME_CACHE.get(item.resume_id)
+    if resume is None:
+        raise LookupError(f"Unknown resume_id {item.resume_id}")
+    return await analyze_job_url(item.url, item.meta, resume, strict=True)
+
 
+def get_batch_runner() -> BatchRunner:
+    global _batch_runner
+    if _batch_runner is None:
+        _batch_runner = BatchRunner(get_run_store(), analyze_run_item)
+    return _batch_runner
 
-def write_saved(records: List[SavedRecord]) -> None:
-    with DB_PATH.open("w", encoding="utf-8") as f:
-        json.dump([record.model_dump() for record in records], f, indent=2)
+
+def get_run_or_404(run_id: str) -> RunStatus:
+    status = get_run_store().status(run_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail="Unknown run_id")
+    return status
+
+
+@app.post("/runs", response_model=RunStatus)
+async def create_run(
+    urls: str = Form(...),
+    url_meta: Optional[str] = Form(None),
+    resume_id: Optional[str] = Form(None),
+    resume_text: Optional[str] = Form(None),
+) -> RunStatus:
+    """
+    Queue a background batch run. Items are checkpointed in SQLite as they finish, so a run survives
+    client disconnects and server restarts; poll /runs/{id} or follow /runs/{id}/stream.
+    """
+    url_list = parse_url_list(urls)
+    resume = resolve_resume(resume_id, resume_text)
+    meta_map = parse_url_meta(url_meta)
+    store = get_run_store()
+    run_id = await asyncio.to_thread(store.create, resume.id, url_list, meta_map)
+    logger.info("Queued run %s with %d job URLs", run_id, len(url_list))
+    get_batch_runner().notify()
+    return store.status(run_id)
+
+
+@app.get("/runs/{run_id}", response_model=RunStatus)
+def get_run(run_id: str) -> RunStatus:
+    return get_run_or_404(run_id)
+
+
+@app.get("/runs/{run_id}/results", response_model=List[RunItemResult])
+def get_run_results(
+    run_id: str,
+    after: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+) -> List[RunItemResult]:
+    """Finished items in completion order; pass the last `seq` seen as `after` to page forward."""
+    get_run_or_404(run_id)
+    return get_run_store().results(run_id, after=after, limit=limit)
+
+
+@app.post("/runs/{run_id}/cancel", response_model=RunStatus)
+def cancel_run(run_id: str) -> RunStatus:
+    get_run_or_404(run_id)
+    get_run_store().cancel(run_id)
+    return get_run_or_404(run_id)
+
+
+@app.get("/runs/{run_id}/stream")
+async def stream_run(run_id: str, after: int = Query(0, ge=0)) -> StreamingResponse:
+    """
+    NDJSON feed of a run: status -> item (one per finished URL) -> done. Reconnect with `after` set to the
+    last item `seq` to resume without duplicates.
+    """
+    store = get_run_store()
+    get_run_or_404(run_id)
+
+    async def events() -> AsyncIterator[str]:
+        cursor = after
+        status = await asyncio.to_thread(store.status, run_id)
+        yield ndjson({"event": "status", **status.model_dump()})
+        while True:
+            # Status is read before results so a run that finishes in between still flushes its last items.
+            status = await asyncio.to_thread(store.status, run_id)
+            items = await asyncio.to_thread(store.results, run_id, cursor, 100)
+            for item in items:
+                cursor = item.seq
+                yield ndjson({"event": "item", **item.model_dump()})
+            if items:
+                continue
+            if status.status != "running":
+                yield ndjson({"event": "done", **status.model_dump()})
+                return
+            await asyncio.sleep(0.5)
+
+    return StreamingResponse(events(), media_type="application/x-ndjson")
+
+
+async def iter_generations(
+    jobs: List[JobPosting],
+    resume: ResumeProfile,
+    force: bool = False,
+) -> AsyncIterator[Tuple[int, JobPosting, Optional[GeneratedMaterials], Optional[Exception]]]:
+    """
+    Yield (index, job, materials, error) in completion order, InMail and cover letter per job.
+
+    Workers are capped at OPENAI_CONCURRENCY jobs; the shared LLM client enforces the request limit and
+    tokens-per-minute budget across everything else generating at the same time.
+    """
+    concurrency = min(OPENAI_CONCURRENCY, len(jobs))
+    results: asyncio.Queue = asyncio.Queue(maxsize=concurrency)
+    pending = iter(enumerate(jobs))
+
+    async def worker() -> None:
+        for index, job in pending:
+            try:
+                _, matched, _ = skill_match(job, resume)
+                inmail, cover_letter = await asyncio.gather(
+                    generate_inmail(job, resume.text, matched, force),
+                    generate_cover_letter(job, resume.text, matched, force),
+                )
+                await results.put((index, job, GeneratedMaterials(inmail=inmail, cover_letter=cover_letter), None))
+            except Exception as exc:
+                logger.warning("Generation failed for %s: %s", job.url, exc)
+                await results.put((index, job, None, exc))
+
+    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+    try:
+        for _ in jobs:
+            yield await results.get()
+    finally:
+        for task in workers:
+            task.cancel()
+
+
+@app.post("/generate/batch")
+async def generate_batch(
+    resume_id: str = Body(...),
+    job_ids: List[str] = Body([]),
+    jobs: Optional[List[JobPosting]] = Body(None),
+    force: bool = Body(False),
+) -> StreamingResponse:
+    """
+    InMail + cover letter for many jobs, streamed as NDJSON in completion order:
+    start -> materials | error (one per job, with running done/total) -> done.
+
+    `job_ids` are looked up in the job index (any posting parsed or imported here); `jobs` carries postings that were never parsed here.
+    """
+    resume = resolve_resume(resume_id, None)
+    batch: List[JobPosting] = list(jobs or [])
+    job_ids = list(dict.fromkeys(job_ids))
+    known = await asyncio.to_thread(get_job_corpus().get_many, job_ids)
+    batch.extend(known[job_id] for job_id in job_ids if job_id in known)
+    missing = [job_id for job_id in job_ids if job_id not in known]
+    if not batch and not missing:
+        raise HTTPException(status_code=400, detail="No jobs provided")
+    total = len(batch) + len(missing)
+    logger.info("Generating materials for %d jobs", total)
+
+    async def events() -> AsyncIterator[str]:
+        yield ndjson({"event": "start", "total": total})
+        done = failed = 0
+        for job_id in missing:
+            done += 1
+            failed += 1
+            yield ndjson({"event": "error", "job_id": job_id, "detail": "Unknown job_id", "done": done, "total": total})
+        if batch:
+            async for _, job, materials, error in iter_generations(batch, resume, force):
+                done += 1
+                if materials is None:
+                    failed += 1
+                    yield ndjson({"event": "error", "job_id": job.id, "detail": str(error), "done": done, "total": total})
+                else:
+                    yield ndjson(
+                        {"event": "materials", "job_id": job.id, **materials.model_dump(), "done": done, "total": total}
+                    )
+        yield ndjson({"event": "done", "total": total, "failed": failed})
+
+    return StreamingResponse(events(), media_type="application/x-ndjson")
+
+
+_job_corpus: Optional[JobCorpus] = None
+
+
+def get_job_corpus() -> JobCorpus:
+    global _job_corpus
+    if _job_corpus is None:
+        _job_corpus = JobCorpus(SAVED_DB_PATH)
+    return _job_corpus
+
+
+async def record_fits(resume: ResumeProfile, analyses: List[JobAnalysis]) -> None:
+    try:
+        with metrics.stage("db_write"):
+            await asyncio.to_thread(get_job_corpus().record_fits, resume.id, TAXONOMY_VERSION, analyses)
+    except Exception as exc:  # pragma: no cover - best effort
+        logger.warning("Failed to record fit scores: %s", exc)
+
+
+def refresh_required_skills(job: JobPosting) -> JobPosting:
+    """Re-derive skills under the current taxonomy from the stored description (the raw page is not kept)."""
+    skills = set(extract_skills(job.description)) | {skill for skill in job.required_skills if skill in SKILL_SET}
+    return job.model_copy(update={"required_skills": sorted(skills)})
+
+
+@app.post("/jobs/rescore", response_model=RescoreResult)
+def rescore_jobs(
+    resume_id: str = Body(...),
+    base_resume_id: Optional[str] = Body(None),
+    job_ids: Optional[List[str]] = Body(None),
+) -> RescoreResult:
+    """
+    Recompute fit for already-parsed postings without refetching, against `resume_id`, and report what
+    changed relative to the scores last recorded for `base_resume_id` (default: the same resume, which
+    picks up SKILL_KEYWORDS changes).
+
+    Matching is redone only for jobs scored under an older taxonomy or whose required skills intersect
+    the skills that differ between the two resumes; text similarity is one batched pass.
+    """
+    resume = resolve_resume(resume_id, None)
+    base = resolve_resume(base_resume_id, None) if base_resume_id else resume
+    corpus = get_job_corpus()
+    previous = corpus.fits(base.id)
+    ids = list(dict.fromkeys(job_ids)) if job_ids else list(previous)
+    jobs = corpus.get_many(ids)
+    missing = [job_id for job_id in ids if job_id not in jobs]
+    present = [job_id for job_id in ids if job_id in jobs]
+    changed_skills = base.skill_set ^ resume.skill_set
+
+    similarities = {}
+    if base.id != resume.id:
+        scores = TEXT_SCORER.score(resume.term_counts, [terms(jobs[job_id].description) for job_id in present])
+        similarities = dict(zip(present, scores))
+
+    analyses: List[JobAnalysis] = []
+    changes: List[RescoreChange] = []
+    refreshed: List[JobPosting] = []
+    recomputed = 0
+    for job_id in present:
+        job = jobs[job_id]
+        taxonomy, before = previous.get(job_id, (None, None))
+        if before is not None and taxonomy != TAXONOMY_VERSION:
+            job = refresh_required_skills(job)
+            refreshed.append(job)
+        similarity = similarities.get(job_id)
+        if similarity is None and before and before.get("text_score") is not None:
+            similarity = before["text_score"] / 100
+        stale = (
+            before is None
+            or taxonomy != TAXONOMY_VERSION
+            or before.get("skill_score") is None
+            or similarity is None
+            or bool(changed_skills.intersection(job.required_skills))
+        )
+        if stale:
+            analysis = compute_fit(job, resume, similarity)
+            recomputed += 1
+        elif job_id not in similarities:
+            # Same resume, taxonomy and skills: nothing to recompute, and re-blending the stored (rounded)
+            # scores would drift by a point.
+            analysis = JobAnalysis(job=job, **before)
+        else:
+            # Matches are unchanged, so the exact skill ratio follows from the stored lists.
+            matched_count = len(before["matched_skills"])
+            total = len(job.required_skills) or matched_count + len(before["missing_skills"]) or 1
+            analysis = JobAnalysis(
+                job=job,
+                fit_score=round(blend(matched_count / total, similarity) * 100),
+                matched_skills=before["matched_skills"],
+                missing_skills=before["missing_skills"],
+                skill_score=before["skill_score"],
+                text_score=round(similarity * 100),
+            )
+        old_score = before["fit_score"] if before else None
+        old_matched = set(before["matched_skills"]) if before else set()
+        if base.id != resume.id or taxonomy != TAXONOMY_VERSION or analysis.model_dump(exclude={"job"}) != before:
+            analyses.append(analysis)
+        if old_score != analysis.fit_score or old_matched != set(analysis.matched_skills):
+            changes.append(
+                RescoreChange(
+                    job_id=job_id,
+                    title=job.title,
+                    company=job.company,
+                    old_score=old_score,
+                    new_score=analysis.fit_score,
+                    delta=None if old_score is None else analysis.fit_score - old_score,
+                    gained_skills=sorted(set(analysis.matched_skills) - old_matched),
+                    lost_skills=sorted(old_matched - set(analysis.matched_skills)),
+                )
+            )
+
+    for job in refreshed:
+        corpus.upsert(job)
+    if analyses:
+        corpus.record_fits(resume.id, TAXONOMY_VERSION, analyses)
+    changes.sort(key=lambda change: -abs(change.delta if change.delta is not None else change.new_score))
+    logger.info("Rescored %d jobs (%d recomputed, %d changed)", len(present), recomputed, len(changes))
+    return RescoreResult(
+        resume_id=resume.id,
+        base_resume_id=base.id,
+        total=len(present),
+        recomputed=recomputed,
+        unchanged=len(present) - len(changes),
+        missing=missing,
+        changes=changes,
+    )
+
+
+@app.get("/jobs/search", response_model=List[JobPosting])
+def search_jobs(
+    response: Response,
+    q: str = Query(""),
+    company: Optional[str] = Query(None),
+    location: Optional[str] = Query(None),
+    work_type: Optional[str] = Query(None),
+    skill: Optional[str] = Query(None),
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+) -> List[JobPosting]:
+    """Ranked full-text search over every posting parsed so far; filters narrow by column."""
+    total, jobs = get_job_corpus().search(
+        q, company=company, location=location, work_type=work_type, skill=skill, limit=limit, offset=offset
+    )
+    response.headers["X-Total-Count"] = str(total)
+    return jobs
+
+
+_saved_store: Optional[SavedStore] = None
+
+
+def get_saved_store() -> SavedStore:
+    global _saved_store
+    if _saved_store is None:
+        _saved_store = SavedStore(SAVED_DB_PATH)
+        _saved_store.migrate_json(DB_PATH)
+    return _saved_store
 
 
 @app.get("/saved", response_model=List[SavedRecord])
-async def get_saved() -> List[SavedRecord]:
-    return read_saved()
+def get_saved(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+) -> List[SavedRecord]:
+    store = get_saved_store()
+    response.headers["X-Total-Count"] = str(store.count())
+    return store.page(limit=limit, offset=offset)
 
 
 @app.post("/save", response_model=SavedRecord)
-async def save_application(payload: SavePayload) -> SavedRecord:
-    records = read_saved()
+def save_application(payload: SavePayload) -> SavedRecord:
     has_generated = payload.generated is not None
     new_record = SavedRecord(id=str(uuid.uuid4()), has_generated=has_generated, **payload.model_dump())
-    records.append(new_record)
-    write_saved(records)
-    return new_record
+    with metrics.stage("db_write"):
+        return get_saved_store().append(new_record)
+
+
+def export_bound(value: Optional[str], name: str, end: bool = False) -> Optional[str]:
+    """
+    ISO date/datetime query value -> UTC string comparable with saved timestamps (`toISOString()` format).
+    A bare date as the end of a range includes that whole day.
+    """
+    if not value:
+        return None
+    try:
+        if len(value) == 10:
+            day = date.fromisoformat(value)
+            return (day + timedelta(days=1) if end else day).isoformat()
+        moment = datetime.fromisoformat(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"'{name}' must be an ISO date or datetime")
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return moment.isoformat(timespec="milliseconds")
 
 
 @app.get("/saved/export")
-async def export_saved() -> dict:
-    records = read_saved()
-    csv_lines = ["job_title,company,fit_score,missing_skills,linkedin_url,timestamp,has_generated"]
-    for record in records:
-        csv_lines.append(
-            f"\"{record.job.title}\",\"{record.job.company}\",{record.fit_score},"
-            f"\"{'|'.join(record.missing_skills)}\",\"{record.job.url}\",\"{record.timestamp}\",{record.has_generated}"
+async def export_saved(
+    format: str = Query("csv", pattern="^(csv|parquet|arrow)$"),
+    columns: str = Query("", description=f"Comma-separated, from: {', '.join(EXPORT_COLUMNS)}"),
+    since: Optional[str] = Query(None, description="Saved at or after this ISO date/datetime"),
+    until: Optional[str] = Query(None, description="Saved before this datetime, or on/before this date"),
+    min_fit: Optional[float] = Query(None, ge=0, le=100),
+) -> Response:
+    """
+    Saved applications as a CSV download, streamed from SQLite in batches. `format=parquet|arrow` writes a
+    columnar file for analysis tools instead (needs pyarrow).
+    """
+    try:
+        selected = parse_columns(columns)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    records = get_saved_store().iter_filtered(
+        since=export_bound(since, "since"), before=export_bound(until, "until", end=True), min_fit=min_fit
+    )
+    filename = "hiresignal_applications"
+    if format == "csv":
+        return StreamingResponse(
+            iter_csv(records, selected),
+            media_type="text/csv; charset=utf-8",
+            headers={"Content-Disposition": f'attachment; filename="{filename}.csv"'},
         )
-    csv_content = "\n".join(csv_lines)
-    return {"csv": csv_content}
+
+    suffix = COLUMNAR_FORMATS[format]
+    fd, path = tempfile.mkstemp(prefix="hiresignal-export-", suffix=suffix)
+    os.close(fd)
+    try:
+        await asyncio.to_thread(write_columnar, records, selected, format, path)
+    except ExportUnavailable as exc:
+        os.unlink(path)
+        raise HTTPException(status_code=501, detail=str(exc))
+    except Exception:
+        os.unlink(path)
+        raise
+    media_type = "application/vnd.apache.parquet" if format == "parquet" else "application/vnd.apache.arrow.file"
+    return FileResponse(path, media_type=media_type, filename=filename + suffix, background=BackgroundTask(os.unlink, path))
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def get_metrics() -> PlainTextResponse:
+    """Stage timings, cache hit rates, fetch statuses and LLM token usage in the Prometheus text format."""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+@app.get("/profiles/{profile_id}")
+def get_profile(profile_id: str) -> FileResponse:
+    """Speedscope profile recorded for a request sent with `X-Profile: 1` or `?profile=1` (PROFILING=1 only)."""
+    path = profile_path(profile_id)
+    if not PROFILING or not PROFILE_ID_RE.match(profile_id) or not path.exists():
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return FileResponse(path, media_type="application/json", filename=path.name)
 
 
 @app.get("/sample/csv")
@@ -0,0 +1,164 @@
+"""
+In-process counters and histograms, rendered in the Prometheus text exposition format on /metrics.
+
+Recording is a perf_counter read plus a short locked update; scraping formats the current values and
+touches nothing else. Work done in parse-pool processes is timed under `capture()` and the timings are
+shipped back with the result, because each worker process has its own copy of this module.
+"""
+
+import bisect
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_REGISTRY: List["_Metric"] = []
+_local = threading.local()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class _Metric(ABC):
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help_text
+        self.labels = tuple(labels)
+        self._lock = threading.Lock()
+        _REGISTRY.append(self)
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(label, "")) for label in self.labels)
+
+    def _label_text(self, key: Tuple[str, ...], extra: str = "") -> str:
+        pairs = [f'{label}="{_escape(value)}"' for label, value in zip(self.labels, key)]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    @abstractmethod
+    def samples(self) -> List[str]:
+        """Sample lines for the current values, without the HELP/TYPE header."""
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}", *self.samples()]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = ()) -> None:
+        super().__init__(name, help_text, labels)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{self._label_text(key)} {_format_value(value)}" for key, value in values]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self, name: str, help_text: str, labels: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> None:
+        super().__init__(name, help_text, labels)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [per-bucket counts (non-cumulative, last one is +Inf), sum, count]
+        self._values: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            entry[0][index] += 1
+            entry[1] += value
+            entry[2] += 1
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = sorted((key, (list(counts), total, count)) for key, (counts, total, count) in self._values.items())
+        lines = []
+        for key, (counts, total, count) in values:
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, None), counts):
+                cumulative += bucket_count
+                le = 'le="+Inf"' if bound is None else f'le="{bound!r}"'
+                lines.append(f"{self.name}_bucket{self._label_text(key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{self._label_text(key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{self._label_text(key)} {count}")
+        return lines
+
+
+STAGE_SECONDS = Histogram(
+    "hiresignal_stage_seconds",
+    "Time spent in each pipeline stage (csv_parse, fetch, extract, clean, skills, scoring, llm, db_write).",
+    ("stage",),
+)
+CACHE_LOOKUPS = Counter(
+    "hiresignal_cache_lookups_total", "Cache lookups by cache (page, parsed_job, generation) and result.", ("cache", "result")
+)
+FETCH_RESPONSES = Counter(
+    "hiresignal_fetch_responses_total", "Job page fetches by HTTP status code, or 'error' for transport failures.", ("status",)
+)
+LLM_REQUESTS = Counter(
+    "hiresignal_llm_requests_total", "Chat completion attempts by HTTP status code, or 'error' for transport failures.", ("status",)
+)
+LLM_TOKENS = Counter("hiresignal_llm_tokens_total", "Tokens reported by the chat completions API.", ("kind",))
+
+
+def observe_stage(name: str, seconds: float) -> None:
+    captured: Optional[list] = getattr(_local, "captured", None)
+    if captured is not None:
+        captured.append((name, seconds))
+    else:
+        STAGE_SECONDS.observe(seconds, stage=name)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe_stage(name, time.perf_counter() - start)
+
+
+@contextmanager
+def capture() -> Iterator[List[Tuple[str, float]]]:
+    """Collect stage timings on this thread into a list instead of recording them (see `record_stages`)."""
+    previous = getattr(_local, "captured", None)
+    _local.captured = captured = []
+    try:
+        yield captured
+    finally:
+        _local.captured = previous
+
+
+def record_stages(timings: Sequence[Tuple[str, float]]) -> None:
+    for name, seconds in timings:
+        observe_stage(name, seconds)
+
+
+def render() -> str:
+    return "\n".join(line for metric in _REGISTRY for line in metric.render()) + "\n"
@@ -0,0 +1,89 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class JobPosting(BaseModel):
+    id: str
+    url: str
+    title: str
+    company: str
+    description: str
+    required_skills: List[str]
+    location: Optional[str] = None
+    salary: Optional[str] = None
+    work_type: Optional[str] = None
+    contact_person: Optional[str] = None
+    posted_at: Optional[str] = None
+    applicants: Optional[str] = None
+    partial: bool = False  # built from CSV metadata only; the page has not been fetched yet
+
+
+class JobAnalysis(BaseModel):
+    job: JobPosting
+    fit_score: Optional[float] = None  # None for partial postings: scored once the page is parsed
+    matched_skills: List[str]
+    missing_skills: List[str]
+    skill_score: Optional[float] = None
+    text_score: Optional[float] = None
+
+
+class GeneratedMaterials(BaseModel):
+    inmail: str
+    cover_letter: str
+
+
+class SavePayload(BaseModel):
+    job: JobPosting
+    fit_score: float
+    missing_skills: List[str]
+    generated: Optional[GeneratedMaterials] = None
+    timestamp: str
+
+
+class SavedRecord(SavePayload):
+    id: str
+    has_generated: bool = False
+
+
+class RunStatus(BaseModel):
+    id: str
+    status: str
+    resume_id: str
+    total: int
+    done: int
+    failed: int
+    pending: int
+    created_at: str
+    updated_at: str
+
+
+class RunItemResult(BaseModel):
+    seq: int
+    index: int
+    url: str
+    status: str
+    attempts: int
+    job: Optional[JobAnalysis] = None
+    error: Optional[str] = None
+
+
+class RescoreChange(BaseModel):
+    job_id: str
+    title: str
+    company: str
+    old_score: Optional[float] = None
+    new_score: float
+    delta: Optional[float] = None
+    gained_skills: List[str]
+    lost_skills: List[str]
+
+
+class RescoreResult(BaseModel):
+    resume_id: str
+    base_resume_id: str
+    total: int
+    recomputed: int
+    unchanged: int
+    missing: List[str]
+    changes: List[RescoreChange]
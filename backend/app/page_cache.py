@@ -0,0 +1,145 @@
+import gzip
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Tuple
+
+from pydantic import BaseModel
+
+
+PAGE_CACHE_DIR = Path(os.getenv("PAGE_CACHE_DIR", Path(__file__).resolve().parent.parent / "page_cache"))
+PAGE_CACHE_TTL = float(os.getenv("PAGE_CACHE_TTL", str(6 * 3600)))  # seconds before a page is revalidated
+PAGE_CACHE_MAX_MB = float(os.getenv("PAGE_CACHE_MAX_MB", "256"))
+
+logger = logging.getLogger("hiresignal")
+
+
+class CachedPage(BaseModel):
+    key: str
+    url: str
+    digest: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float
+    size: int
+
+
+class PageCache:
+    """
+    Gzip-compressed page store on local disk, one `<key>.html.gz` + `<key>.json` pair per page.
+
+    Entries older than `ttl` are still returned but reported stale so the caller can revalidate them with
+    ETag/Last-Modified. Total compressed size is bounded; least recently used pages are evicted first.
+    """
+
+    def __init__(self, directory: Path = PAGE_CACHE_DIR, ttl: float = PAGE_CACHE_TTL, max_mb: float = PAGE_CACHE_MAX_MB):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self._lock = threading.Lock()
+        self._sizes: "OrderedDict[str, int]" = OrderedDict()
+        self._total = 0
+        self._load_index()
+
+    def _body_path(self, key: str) -> Path:
+        return self.directory / f"{key}.html.gz"
+
+    def _meta_path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _load_index(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        bodies = sorted(self.directory.glob("*.html.gz"), key=lambda path: path.stat().st_mtime)
+        for body in bodies:
+            key = body.name[: -len(".html.gz")]
+            size = body.stat().st_size
+            self._sizes[key] = size
+            self._total += size
+
+    def is_fresh(self, page: CachedPage) -> bool:
+        return time.time() - page.fetched_at < self.ttl
+
+    def get(self, key: str) -> Optional[Tuple[CachedPage, str]]:
+        try:
+            page = CachedPage.model_validate_json(self._meta_path(key).read_text(encoding="utf-8"))
+            html = gzip.decompress(self._body_path(key).read_bytes()).decode("utf-8")
+        except FileNotFoundError:
+            return None
+        except Exception as exc:
+            logger.warning("Dropping unreadable cached page %s: %s", key, exc)
+            self._remove(key)
+            return None
+        with self._lock:
+            if key in self._sizes:
+                self._sizes.move_to_end(key)
+        try:
+            # mtime doubles as the LRU clock so eviction order survives restarts.
+            os.utime(self._body_path(key))
+        except OSError:
+            pass
+        return page, html
+
+    def put(self, key: str, url: str, html: str, etag: Optional[str] = None, last_modified: Optional[str] = None) -> CachedPage:
+        raw = html.encode("utf-8")
+        body = gzip.compress(raw, compresslevel=6)
+        page = CachedPage(
+            key=key,
+            url=url,
+            digest=hashlib.sha256(raw).hexdigest(),
+            etag=etag,
+            last_modified=last_modified,
+            fetched_at=time.time(),
+            size=len(body),
+        )
+        tmp = self.directory / f"{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+        tmp.write_bytes(body)
+        os.replace(tmp, self._body_path(key))
+        self._meta_path(key).write_text(page.model_dump_json(), encoding="utf-8")
+        with self._lock:
+            self._total += len(body) - self._sizes.pop(key, 0)
+            self._sizes[key] = len(body)
+            evict = []
+            while self._total > self.max_bytes and len(self._sizes) > 1:
+                old_key, old_size = self._sizes.popitem(last=False)
+                self._total -= old_size
+                evict.append(old_key)
+        for old_key in evict:
+            self._delete_files(old_key)
+        return page
+
+    def refresh(self, page: CachedPage) -> CachedPage:
+        """Mark a page as revalidated (HTTP 304) without rewriting its body."""
+        page = page.model_copy(update={"fetched_at": time.time()})
+        self._meta_path(page.key).write_text(page.model_dump_json(), encoding="utf-8")
+        return page
+
+    def _remove(self, key: str) -> None:
+        with self._lock:
+            self._total -= self._sizes.pop(key, 0)
+        self._delete_files(key)
+
+    def _delete_files(self, key: str) -> None:
+        for path in (self._body_path(key), self._meta_path(key)):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def conditional_headers(self, page: CachedPage) -> dict:
+        headers = {}
+        if page.etag:
+            headers["If-None-Match"] = page.etag
+        if page.last_modified:
+            headers["If-Modified-Since"] = page.last_modified
+        return headers
+
+
+def page_key(job_id: Optional[str], url: str) -> str:
+    if job_id:
+        return f"job-{job_id}"
+    return "url-" + hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+
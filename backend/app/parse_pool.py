@@ -0,0 +1,85 @@
+import asyncio
+import contextvars
+import functools
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional, TypeVar
+
+
+PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", str(min(4, os.cpu_count() or 1))))  # 0 parses in threads instead
+
+T = TypeVar("T")
+
+# Set by the request profiler: parse in a thread of this process so the sampler can see it.
+parse_inline: contextvars.ContextVar[bool] = contextvars.ContextVar("parse_inline", default=False)
+
+logger = logging.getLogger("hiresignal")
+
+
+class ParsePool:
+    """
+    Process pool for CPU-bound parsing (job page extraction, PDF/DOCX decoding).
+
+    Threads cannot help here: regex extraction holds the GIL, so a large page stalls the event loop and a
+    batch only ever uses one core. Callers pass a module-level function plus picklable arguments (raw
+    HTML/bytes in, JobPosting/str out). Workers are spawned lazily, never forked from the threaded
+    server. A crashed worker breaks the pool; it is rebuilt for the next call and the failing call raises.
+    With `workers=0` calls run in a thread.
+    """
+
+    def __init__(self, workers: int = PARSE_WORKERS) -> None:
+        self.workers = max(0, workers)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._executor
+
+    def _reset(self, broken: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._executor is broken:
+                self._executor = None
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        if not self.workers or parse_inline.get():
+            return await asyncio.to_thread(fn, *args, **kwargs)
+        pool = self._pool()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(pool, functools.partial(fn, *args, **kwargs))
+        except BrokenProcessPool:
+            logger.warning("Parse worker died running %s; restarting the pool", fn.__name__)
+            self._reset(pool)
+            raise
+
+    def close(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+_parse_pool: Optional[ParsePool] = None
+
+
+def get_parse_pool() -> ParsePool:
+    global _parse_pool
+    if _parse_pool is None:
+        _parse_pool = ParsePool()
+    return _parse_pool
+
+
+def close_parse_pool() -> None:
+    global _parse_pool
+    if _parse_pool is not None:
+        _parse_pool.close()
+        _parse_pool = None
@@ -0,0 +1,316 @@
+"""
+Pure parsing functions: job page -> JobPosting, uploaded resume -> text, and the skill taxonomy they use.
+
+These are the parse pool's entry points. A spawned worker imports only this module and its leaf dependencies
+(extractor, skills, models, metrics): it builds the skill matcher, but never the FastAPI app or the caches
+and stores that `main` sets up at import.
+"""
+
+import io
+import logging
+import re
+import uuid
+from typing import List, Optional, Tuple
+
+from . import metrics
+from .extractor import extract_job_fields
+from .models import JobPosting
+from .skills import SkillMatcher
+
+
+_JOB_ID_RE = re.compile(r"/jobs/view/(?:[^/?#]*?-)?(\d{6,})|[?&]currentJobId=(\d{6,})")
+
+logger = logging.getLogger("hiresignal")
+
+# Simple keyword list for the MVP; extend in later iterations.
+SKILL_KEYWORDS = [
+    "python",
+    "javascript",
+    "typescript",
+    "react",
+    "node",
+    "fastapi",
+    "aws",
+    "gcp",
+    "azure",
+    "sql",
+    "postgres",
+    "docker",
+    "kubernetes",
+    "ci",
+    "cd",
+    "ml",
+    "ai",
+    "llm",
+    "nlp",
+    "data",
+    "analytics",
+    "django",
+    "flask",
+    "tailwind",
+    "css",
+    "html",
+    "api",
+    "graphql",
+    "devops",
+    "governance",
+    "audit",
+    "lifecycle management",
+    "modeling",
+    "taxonomy",
+    "chatbot",
+    "voice assistant",
+    "agentic system",
+    "agent",
+    "ux",
+    "consulting",
+    "prompting",
+    "prompt engineering",
+    "workflow design",
+    "risk management",
+    "business intelligence",
+    "advanced analytics",
+    "data science",
+    "team building",
+    "project management",
+    "data visualization",
+    "data model",
+    "etl",
+    "data lake",
+    "data warehouse",
+    "data quality",
+    "data management",
+    "process engineering",
+    "automation",
+    "solution design",
+    "change management",
+    "lean operations",
+    "agile",
+    "finance",
+    "financial reporting",
+    "dashboard",
+    "product strategy",
+    "product management",
+    "customer engagement",
+    "research",
+    "vendor",
+    "statistics",
+    "hugging face",
+    "anthropic",
+    "langchain",
+    "tableau",
+    "power bi",
+    "looker",
+    "gcp",
+    "google cloud",
+    "aws",
+    "bigquery",
+    "vertex ai",
+    "airflow",
+    "snowflake",
+    "plotly",
+    "qlik",
+    "dbeaver",
+    "elastic",
+    "mongo",
+    "apache",
+    "spark",
+    "azure",
+    "git",
+    "jira",
+    "saas",
+    "databricks",
+    "streamlit",
+    "loveable",
+    "deep learning",
+    "credit lending",
+    "marketing strategy",
+    "customer analytics",
+    "site reliability engineering",
+    "sagemaker",
+    "RAG",
+    "compliance",
+    "orchestration"
+]
+
+# Other spellings reported as the keyword they map to; word-boundary matching no longer finds them as substrings.
+SKILL_ALIASES = {
+    "postgres": ["postgresql"],
+    "mongo": ["mongodb"],
+    "node": ["node.js", "nodejs"],
+    "kubernetes": ["k8s"],
+    "elastic": ["elasticsearch"],
+    "git": ["github", "gitlab"],
+    "data model": ["data modeling", "data modelling"],
+}
+
+# Compiled once at import; extract_skills is a single word-boundary pass over the text.
+SKILL_MATCHER = SkillMatcher(SKILL_KEYWORDS, SKILL_ALIASES)
+
+
+def extract_resume_text(raw: bytes, filename: str) -> str:
+    """Plain text of an uploaded PDF/DOCX/TXT with whitespace collapsed; empty if nothing could be read."""
+    name_lower = filename.lower()
+    text: Optional[str] = None
+
+    # PDF extraction
+    if name_lower.endswith(".pdf"):
+        try:
+            import PyPDF2  # type: ignore
+
+            reader = PyPDF2.PdfReader(io.BytesIO(raw))
+            pages = [page.extract_text() or "" for page in reader.pages]
+            text = "\n".join(pages)
+        except Exception as exc:
+            logger.warning("PDF parse failed for %s: %s", filename, exc)
+
+    # DOCX extraction
+    if text is None and name_lower.endswith(".docx"):
+        try:
+            import docx  # type: ignore
+
+            doc = docx.Document(io.BytesIO(raw))
+            text = "\n".join(paragraph.text for paragraph in doc.paragraphs)
+        except Exception as exc:
+            logger.warning("DOCX parse failed for %s: %s", filename, exc)
+
+    # Fallback to plain decode
+    if text is None:
+        text = raw.decode(errors="ignore")
+
+    # Basic cleanup to trim noisy whitespace
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def extract_skills(text: str) -> List[str]:
+    with metrics.stage("skills"):
+        return sorted(SKILL_MATCHER.find(text))
+
+
+def format_salary_to_k(value: str) -> str:
+    """
+    Attempt to normalize salary strings like "$265,000.00/yr" or "$265,000 - $275,000/yr" to "$265K/yr".
+    If parsing fails, return the original string.
+    """
+    try:
+        # Space-grouped thousands ("$3 600", often a narrow no-break space) read as one number.
+        grouped = re.sub(r"(?<=\d)[\s\u00a0\u202f](?=\d{3}(?!\d))", "", value)
+        numbers = re.findall(r"\$?\s*([0-9][0-9,\.]+)\s*([kK])?", grouped)
+        if not numbers:
+            return value
+
+        def fmt(match: tuple) -> str:
+            num_str, thousands = match
+            num = float(num_str.replace(",", ""))
+            k_val = int(round(num if thousands else num / 1000))
+            return f"${k_val}K"
+
+        suffix_part = "/yr" if "yr" in value.lower() else ""
+        if len(numbers) >= 2:
+            first, second = fmt(numbers[0]), fmt(numbers[1])
+            return f"{first}{suffix_part} - {second}{suffix_part}"
+        else:
+            return f"{fmt(numbers[0])}{suffix_part}"
+    except Exception:
+        return value
+
+
+def sanitize_description(text: str) -> str:
+    # Remove noisy "Posted HH:MM:SS AM/PM" and LinkedIn boilerplate.
+    with metrics.stage("clean"):
+        text = re.sub(r"Posted\s+\d{1,2}:\d{2}:\d{2}\s+(AM|PM)\.?\s*", "", text, flags=re.IGNORECASE)
+        text = re.sub(r"See this and similar jobs on LinkedIn\.?", "", text, flags=re.IGNORECASE)
+        return text.strip()
+
+
+def parse_job_timed(
+    url: str,
+    html: str,
+    salary_override: Optional[str],
+    workplace_override: Optional[str],
+) -> Tuple[Optional[JobPosting], List[Tuple[str, float]]]:
+    # Runs in the parse pool: stage timings travel back with the result since worker metrics are not shared.
+    with metrics.capture() as timings:
+        job = parse_job_html(url, html, salary_override=salary_override, workplace_override=workplace_override)
+    return job, timings
+
+
+def job_id_from_url(url: str) -> Optional[str]:
+    """Numeric LinkedIn job ID from /jobs/view/<id>/ or a currentJobId=<id> query parameter."""
+    match = _JOB_ID_RE.search(url)
+    return (match.group(1) or match.group(2)) if match else None
+
+
+def stable_job_id(url: str) -> str:
+    # Same posting -> same id across requests, so the frontend and saved records can dedupe.
+    job_id = job_id_from_url(url)
+    if job_id:
+        return f"li-{job_id}"
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, url))
+
+
+def parse_job_html(
+    url: str,
+    html: str,
+    salary_override: Optional[str] = None,
+    workplace_override: Optional[str] = None,
+) -> Optional[JobPosting]:
+    with metrics.stage("extract"):
+        fields = extract_job_fields(html)
+
+    title = fields.title
+    if title and "|" in title:
+        title = title.split("|")[0].strip()
+
+    company = fields.company
+    if not company and fields.title:
+        company_tag = re.search(r"at\s+([^|<]+)\|", fields.title, flags=re.IGNORECASE)
+        if company_tag:
+            company = company_tag.group(1).strip()
+
+    if not title or not company:
+        logger.info("Missing parsed title/company for %s; falling back to mock", url)
+        return None
+
+    description = sanitize_description(fields.description or fields.page_text)
+
+    # Extract skills from both the description and the visible page text to avoid missing context.
+    required_skills = sorted(set(extract_skills(description)) | set(extract_skills(fields.page_text)))
+
+    # Salary: prefer the "$... - $...yr" range found on the page; else the CSV override, else unavailable
+    raw_salary = fields.salary or salary_override or "Unavailable"
+    salary = format_salary_to_k(raw_salary) if raw_salary.lower() != "unavailable" else "Unavailable"
+
+    # Work type: prefer override from CSV, else what the page reports, else unavailable
+    raw_work_type = fields.work_type
+    if workplace_override:
+        normalized_work_type = workplace_override.capitalize()
+    elif raw_work_type:
+        normalized_work_type = raw_work_type.capitalize()
+    else:
+        normalized_work_type = "Unavailable"
+
+    logger.info(
+        "Parsed LinkedIn job for %s -> %s @ %s | location=%r salary=%r work_type_raw=%r work_type=%r",
+        url,
+        title,
+        company,
+        fields.location,
+        salary,
+        raw_work_type,
+        normalized_work_type,
+    )
+    return JobPosting(
+        id=stable_job_id(url),
+        url=url,
+        title=title,
+        company=company,
+        description=description,
+        required_skills=required_skills,
+        location=fields.location,
+        salary=salary,
+        work_type=normalized_work_type,
+        contact_person=fields.contact_person,
+        posted_at=fields.posted_at,
+        applicants=fields.applicants,
+    )
@@ -0,0 +1,178 @@
+"""
+Opt-in sampling profiler for slow requests, with no dependencies.
+
+A background thread snapshots every thread's Python stack (`sys._current_frames`) at a fixed interval.
+The samples are written as a speedscope profile (https://www.speedscope.app), one lane per thread.
+Event-loop waits show up as time in `select`, regex backtracking under `extract_job_fields`, and model
+validation under pydantic. Samples cover the whole process, so requests running at the same time show
+up too.
+
+Requests are profiled only when PROFILING=1, and then only if they send `X-Profile: 1` or `?profile=1`.
+The response carries `X-Profile-Id`; the profile lands in PROFILE_DIR and is served by GET /profiles/{id}.
+"""
+
+import asyncio
+import json
+import os
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .parse_pool import parse_inline
+
+
+PROFILING = os.getenv("PROFILING", "0") == "1"
+PROFILE_INTERVAL = float(os.getenv("PROFILE_INTERVAL", "0.002"))  # seconds between stack samples
+PROFILE_DIR = Path(os.getenv("PROFILE_DIR", Path(__file__).resolve().parent.parent / "profiles"))
+
+PROFILE_ID_RE = re.compile(r"^[0-9]{8}-[0-9]{6}-[0-9a-f]{8}$")
+
+Frame = Tuple[str, str, int]  # (qualified name, file, first line)
+
+
+class SamplingProfiler:
+    """Samples all threads but its own every `interval` seconds between start() and stop()."""
+
+    def __init__(self, interval: float = PROFILE_INTERVAL) -> None:
+        self.interval = interval
+        self.frames: List[Frame] = []
+        self._frame_index: Dict[Frame, int] = {}
+        self._samples: Dict[int, List[Tuple[List[int], float]]] = {}  # thread id -> [(root..leaf, weight)]
+        self._names: Dict[int, str] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.started = self.stopped = 0.0
+
+    def __enter__(self) -> "SamplingProfiler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        self.started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+        self.stopped = time.perf_counter()
+
+    def _intern(self, code) -> int:
+        frame = (getattr(code, "co_qualname", code.co_name), code.co_filename, code.co_firstlineno)
+        index = self._frame_index.get(frame)
+        if index is None:
+            index = self._frame_index[frame] = len(self.frames)
+            self.frames.append(frame)
+        return index
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        last = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            now = time.perf_counter()
+            weight, last = now - last, now
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(self._intern(frame.f_code))
+                    frame = frame.f_back
+                stack.reverse()
+                self._samples.setdefault(thread_id, []).append((stack, weight))
+        self._names.update({thread.ident: thread.name for thread in threading.enumerate() if thread.ident})
+
+    def top(self, limit: int = 20) -> List[Tuple[Frame, float, float]]:
+        """(frame, self seconds, total seconds) for the hottest frames by self time, across all threads."""
+        own: Counter = Counter()
+        total: Counter = Counter()
+        for samples in self._samples.values():
+            for stack, weight in samples:
+                if stack:
+                    own[stack[-1]] += weight
+                for index in set(stack):
+                    total[index] += weight
+        return [(self.frames[index], seconds, total[index]) for index, seconds in own.most_common(limit)]
+
+    def speedscope(self, name: str) -> dict:
+        duration = (self.stopped or time.perf_counter()) - self.started
+        profiles = []
+        for thread_id, samples in sorted(self._samples.items(), key=lambda item: -len(item[1])):
+            profiles.append(
+                {
+                    "type": "sampled",
+                    "name": f"{self._names.get(thread_id, 'thread')} ({thread_id})",
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": duration,
+                    "samples": [stack for stack, _ in samples],
+                    "weights": [weight for _, weight in samples],
+                }
+            )
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "hiresignal",
+            "activeProfileIndex": 0,
+            "shared": {"frames": [{"name": fn, "file": file, "line": line} for fn, file, line in self.frames]},
+            "profiles": profiles,
+        }
+
+    def save(self, path: Path, name: str) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.speedscope(name)), encoding="utf-8")
+
+
+def profile_path(profile_id: str) -> Path:
+    return PROFILE_DIR / f"{profile_id}.speedscope.json"
+
+
+def _wants_profile(scope: dict) -> bool:
+    if scope["type"] != "http":
+        return False
+    headers = dict(scope.get("headers") or [])
+    if headers.get(b"x-profile", b"").strip() in (b"1", b"true"):
+        return True
+    return re.search(rb"(?:^|&)profile=(?:1|true)(?:&|$)", scope.get("query_string") or b"") is not None
+
+
+class ProfileMiddleware:
+    """
+    ASGI middleware that runs flagged requests under a SamplingProfiler until the last body chunk is
+    sent (so streamed responses are covered). Page parsing for the request stays in-process rather than in
+    the parse pool, so it shows up in the samples.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if not _wants_profile(scope):
+            await self.app(scope, receive, send)
+            return
+        profile_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+
+        async def send_with_id(message: dict) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", []), (b"x-profile-id", profile_id.encode())]
+            await send(message)
+
+        token = parse_inline.set(True)
+        profiler = SamplingProfiler()
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            profiler.stop()
+            parse_inline.reset(token)
+            name = f"{scope['method']} {scope['path']}"
+            await asyncio.to_thread(profiler.save, profile_path(profile_id), name)
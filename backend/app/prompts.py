@@ -0,0 +1,77 @@
+import os
+import re
+from typing import Iterable, Iterator, List, Tuple
+
+from .llm import estimate_tokens
+from .skills import SkillMatcher
+
+
+PROMPT_RESUME_TOKENS = int(os.getenv("PROMPT_RESUME_TOKENS", "1200"))
+PROMPT_JOB_TOKENS = int(os.getenv("PROMPT_JOB_TOKENS", "900"))
+SEGMENT_TOKENS = 120  # soft cap per section so one long block cannot crowd out the rest
+
+# Resume and job text arrive whitespace-collapsed, so line structure is gone; sections are built from
+# sentences, bullet glyphs that survived the collapse, and any newlines a raw `resume_text` still carries.
+_BOUNDARY_RE = re.compile(r"(?<=[.!?;])\s+|\s+(?=[•▪●]\s)|\s*\n\s*")
+
+
+def _pieces(text: str) -> Iterator[Tuple[str, int]]:
+    # (piece, estimated tokens); a run-on piece with no boundary inside is cut into word windows.
+    for piece in _BOUNDARY_RE.split(text):
+        piece = piece.strip()
+        tokens = estimate_tokens(piece)
+        if tokens <= SEGMENT_TOKENS:
+            if piece:
+                yield piece, tokens
+            continue
+        words = piece.split()
+        step = max(1, len(words) * SEGMENT_TOKENS // tokens)
+        for start in range(0, len(words), step):
+            window = " ".join(words[start:start + step])
+            yield window, estimate_tokens(window)
+
+
+def segment(text: str) -> List[str]:
+    """Split resume or job text into sections of consecutive sentences/bullets, capped near SEGMENT_TOKENS."""
+    segments: List[str] = []
+    current: List[str] = []
+    size = 0
+    for piece, tokens in _pieces(text):
+        if current and size + tokens > SEGMENT_TOKENS:
+            segments.append(" ".join(current))
+            current, size = [], 0
+        current.append(piece)
+        size += tokens
+    if current:
+        segments.append(" ".join(current))
+    return segments
+
+
+def select_excerpts(text: str, budget: int, matched: Iterable[str], missing: Iterable[str] = ()) -> str:
+    """
+    Pack the most relevant sections of `text` into roughly `budget` tokens, kept in their original order.
+
+    Sections score by the matched skills they mention (weighted highest), then missing skills; the first
+    section (name/summary, or the role overview) gets a small boost. Text that already fits is returned as is.
+    """
+    text = (text or "").strip()
+    if estimate_tokens(text) <= budget:
+        return text
+    matched = list(matched)
+    missing = list(missing)
+    matched_set = {skill.lower() for skill in matched}
+    matcher = SkillMatcher(matched + missing)
+    scored = []
+    for index, section in enumerate(segment(text)):
+        found = {skill.lower() for skill in matcher.find(section)}
+        score = 3 * len(found & matched_set) + 2 * len(found - matched_set) + (1 if index == 0 else 0)
+        scored.append((score, index, section))
+    chosen = []
+    used = 0
+    for score, index, section in sorted(scored, key=lambda item: (-item[0], item[1])):
+        tokens = estimate_tokens(section)
+        if used + tokens > budget:
+            continue
+        chosen.append((index, section))
+        used += tokens
+    return "\n\n".join(section for _, section in sorted(chosen))
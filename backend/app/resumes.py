@@ -0,0 +1,81 @@
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, FrozenSet, List, Optional
+
+from pydantic import BaseModel
+
+
+RESUME_CACHE_SIZE = int(os.getenv("RESUME_CACHE_SIZE", "32"))
+
+logger = logging.getLogger("hiresignal")
+
+
+class ResumeProfile(BaseModel):
+    id: str
+    text: str
+    skills: List[str]
+    skill_set: FrozenSet[str]
+    term_counts: Dict[str, int]
+
+
+def resume_handle(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:32]
+
+
+class ResumeCache:
+    """
+    Resume profiles keyed by content hash.
+
+    Profiles live in a small in-memory LRU; the normalized text is also written to `directory` so a handle
+    issued before a restart can be rebuilt on first use.
+    """
+
+    def __init__(self, directory: Path, builder: Callable[[str], ResumeProfile], max_entries: int = RESUME_CACHE_SIZE):
+        self.directory = directory
+        self.builder = builder
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[str, ResumeProfile]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _path(self, resume_id: str) -> Path:
+        return self.directory / f"{resume_id}.txt"
+
+    def _remember(self, profile: ResumeProfile) -> None:
+        with self._lock:
+            self._entries[profile.id] = profile
+            self._entries.move_to_end(profile.id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def put(self, text: str) -> ResumeProfile:
+        resume_id = resume_handle(text)
+        cached = self.get(resume_id)
+        if cached:
+            return cached
+        profile = self.builder(text)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._path(resume_id).write_text(text, encoding="utf-8")
+        except Exception as exc:  # pragma: no cover - best effort
+            logger.warning("Failed to persist resume %s: %s", resume_id, exc)
+        self._remember(profile)
+        return profile
+
+    def get(self, resume_id: str) -> Optional[ResumeProfile]:
+        if not resume_id.isalnum():
+            return None
+        with self._lock:
+            profile = self._entries.get(resume_id)
+            if profile:
+                self._entries.move_to_end(resume_id)
+                return profile
+        path = self._path(resume_id)
+        if not path.exists():
+            return None
+        profile = self.builder(path.read_text(encoding="utf-8"))
+        self._remember(profile)
+        return profile
@@ -0,0 +1,277 @@
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Awaitable, Callable, List, Optional, Tuple, Type
+
+from .models import JobAnalysis, RunItemResult, RunStatus
+
+
+RUN_WORKERS = int(os.getenv("RUN_WORKERS", "4"))
+RUN_MAX_ATTEMPTS = int(os.getenv("RUN_MAX_ATTEMPTS", "3"))
+RUN_RETRY_BACKOFF = float(os.getenv("RUN_RETRY_BACKOFF", "2"))  # seconds, doubled per attempt
+
+logger = logging.getLogger("hiresignal")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id TEXT PRIMARY KEY,
+    resume_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS run_items (
+    run_id TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    url TEXT NOT NULL,
+    meta TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    not_before REAL NOT NULL DEFAULT 0,
+    finished_seq INTEGER,
+    result TEXT,
+    error TEXT,
+    PRIMARY KEY (run_id, idx)
+);
+CREATE INDEX IF NOT EXISTS idx_run_items_status ON run_items (status, not_before);
+CREATE INDEX IF NOT EXISTS idx_run_items_finished ON run_items (run_id, finished_seq);
+"""
+
+# Item states: pending -> running -> done | failed (pending again between retries).
+_FINISHED = ("done", "failed")
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class RunItem:
+    def __init__(self, run_id: str, index: int, url: str, meta: dict, resume_id: str, attempts: int):
+        self.run_id = run_id
+        self.index = index
+        self.url = url
+        self.meta = meta
+        self.resume_id = resume_id
+        self.attempts = attempts
+
+
+class RunStore:
+    """SQLite checkpoint store for batch runs; every finished item is committed as it completes."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._conn().executescript(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def create(self, resume_id: str, urls: List[str], meta_map: dict) -> str:
+        run_id = uuid.uuid4().hex
+        now = _now()
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "INSERT INTO runs (id, resume_id, status, created_at, updated_at) VALUES (?, ?, 'running', ?, ?)",
+                (run_id, resume_id, now, now),
+            )
+            conn.executemany(
+                "INSERT INTO run_items (run_id, idx, url, meta, status) VALUES (?, ?, ?, ?, 'pending')",
+                [(run_id, idx, url, json.dumps(meta_map.get(url) or {})) for idx, url in enumerate(urls)],
+            )
+        return run_id
+
+    def requeue_interrupted(self) -> int:
+        """Items left `running` by a crash or restart go back to the queue."""
+        conn = self._conn()
+        with conn:
+            cursor = conn.execute("UPDATE run_items SET status = 'pending' WHERE status = 'running'")
+        return cursor.rowcount
+
+    def claim_next(self) -> Optional[RunItem]:
+        conn = self._conn()
+        with self._write_lock, conn:
+            row = conn.execute(
+                "SELECT i.run_id, i.idx, i.url, i.meta, r.resume_id, i.attempts FROM run_items i "
+                "JOIN runs r ON r.id = i.run_id "
+                "WHERE i.status = 'pending' AND i.not_before <= ? AND r.status = 'running' "
+                "ORDER BY r.created_at, i.idx LIMIT 1",
+                (time.time(),),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE run_items SET status = 'running', attempts = attempts + 1 WHERE run_id = ? AND idx = ?",
+                (row[0], row[1]),
+            )
+        return RunItem(row[0], row[1], row[2], json.loads(row[3]), row[4], row[5] + 1)
+
+    def _finish(self, item: RunItem, status: str, result: Optional[str], error: Optional[str]) -> None:
+        conn = self._conn()
+        with self._write_lock, conn:
+            seq = conn.execute(
+                "SELECT COALESCE(MAX(finished_seq), 0) + 1 FROM run_items WHERE run_id = ?", (item.run_id,)
+            ).fetchone()[0]
+            conn.execute(
+                "UPDATE run_items SET status = ?, finished_seq = ?, result = ?, error = ? WHERE run_id = ? AND idx = ?",
+                (status, seq, result, error, item.run_id, item.index),
+            )
+            remaining = conn.execute(
+                "SELECT COUNT(*) FROM run_items WHERE run_id = ? AND status NOT IN ('done', 'failed')", (item.run_id,)
+            ).fetchone()[0]
+            conn.execute(
+                "UPDATE runs SET updated_at = ?, status = CASE WHEN ? = 0 AND status = 'running' "
+                "THEN 'completed' ELSE status END WHERE id = ?",
+                (_now(), remaining, item.run_id),
+            )
+
+    def complete(self, item: RunItem, analysis: JobAnalysis) -> None:
+        self._finish(item, "done", analysis.model_dump_json(), None)
+
+    def fail(self, item: RunItem, error: str) -> None:
+        self._finish(item, "failed", None, error)
+
+    def retry_later(self, item: RunItem, error: str, delay: float) -> None:
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "UPDATE run_items SET status = 'pending', not_before = ?, error = ? WHERE run_id = ? AND idx = ?",
+                (time.time() + delay, error, item.run_id, item.index),
+            )
+
+    def cancel(self, run_id: str) -> bool:
+        conn = self._conn()
+        with conn:
+            cursor = conn.execute(
+                "UPDATE runs SET status = 'cancelled', updated_at = ? WHERE id = ? AND status = 'running'",
+                (_now(), run_id),
+            )
+        return cursor.rowcount > 0
+
+    def status(self, run_id: str) -> Optional[RunStatus]:
+        conn = self._conn()
+        run = conn.execute(
+            "SELECT id, status, resume_id, created_at, updated_at FROM runs WHERE id = ?", (run_id,)
+        ).fetchone()
+        if run is None:
+            return None
+        counts = dict(
+            conn.execute("SELECT status, COUNT(*) FROM run_items WHERE run_id = ? GROUP BY status", (run_id,)).fetchall()
+        )
+        total = sum(counts.values())
+        return RunStatus(
+            id=run[0],
+            status=run[1],
+            resume_id=run[2],
+            total=total,
+            done=counts.get("done", 0),
+            failed=counts.get("failed", 0),
+            pending=total - sum(counts.get(state, 0) for state in _FINISHED),
+            created_at=run[3],
+            updated_at=run[4],
+        )
+
+    def results(self, run_id: str, after: int = 0, limit: int = 100) -> List[RunItemResult]:
+        rows = self._conn().execute(
+            "SELECT finished_seq, idx, url, status, attempts, result, error FROM run_items "
+            "WHERE run_id = ? AND finished_seq > ? ORDER BY finished_seq LIMIT ?",
+            (run_id, after, limit),
+        )
+        return [
+            RunItemResult(
+                seq=row[0],
+                index=row[1],
+                url=row[2],
+                status=row[3],
+                attempts=row[4],
+                job=JobAnalysis.model_validate_json(row[5]) if row[5] else None,
+                error=row[6],
+            )
+            for row in rows
+        ]
+
+
+class BatchRunner:
+    """
+    Asyncio worker pool that drains pending run items from the RunStore.
+
+    Work is claimed from the database rather than an in-memory queue, so runs interrupted by a restart are
+    picked up again on the next startup. Failures are retried with exponential backoff, except `permanent`
+    exception types, which fail the item on the first attempt.
+    """
+
+    def __init__(
+        self,
+        store: RunStore,
+        analyze: Callable[[RunItem], Awaitable[JobAnalysis]],
+        workers: int = RUN_WORKERS,
+        max_attempts: int = RUN_MAX_ATTEMPTS,
+        backoff: float = RUN_RETRY_BACKOFF,
+        permanent: Tuple[Type[Exception], ...] = (LookupError,),
+    ):
+        self.store = store
+        self.analyze = analyze
+        self.workers = max(1, workers)
+        self.max_attempts = max(1, max_attempts)
+        self.backoff = backoff
+        self.permanent = permanent
+        self._tasks: List[asyncio.Task] = []
+        self._wake = asyncio.Event()
+
+    async def start(self) -> None:
+        requeued = await asyncio.to_thread(self.store.requeue_interrupted)
+        if requeued:
+            logger.info("Resuming %d interrupted batch items", requeued)
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def notify(self) -> None:
+        self._wake.set()
+
+    async def _worker(self) -> None:
+        while True:
+            item = await asyncio.to_thread(self.store.claim_next)
+            if item is None:
+                self._wake.clear()
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=1.0)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            try:
+                analysis = await self.analyze(item)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                error = f"{type(exc).__name__}: {exc}"
+                if item.attempts < self.max_attempts and not isinstance(exc, self.permanent):
+                    delay = self.backoff * (2 ** (item.attempts - 1))
+                    logger.warning("Batch item %s#%d failed (attempt %d), retrying in %.1fs: %s",
+                                   item.run_id, item.index, item.attempts, delay, error)
+                    await asyncio.to_thread(self.store.retry_later, item, error, delay)
+                else:
+                    logger.warning("Batch item %s#%d failed after %d attempt(s): %s",
+                                   item.run_id, item.index, item.attempts, error)
+                    await asyncio.to_thread(self.store.fail, item, error)
+                continue
+            await asyncio.to_thread(self.store.complete, item, analysis)
@@ -0,0 +1,101 @@
+import math
+import os
+from collections import Counter
+from typing import Callable, Dict, Iterable, List, Mapping, NamedTuple, Sequence, Set
+
+from .skills import tokenize
+
+
+SCORE_TEXT_WEIGHT = float(os.getenv("SCORE_TEXT_WEIGHT", "0.3"))  # share of fit_score from text similarity
+# Cosine at or above which the resume counts as a full text match.
+SCORE_TEXT_FULL = float(os.getenv("SCORE_TEXT_FULL", "0.4"))
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_STOPWORDS = frozenset(
+    """
+    a about above after all also am an and any are as at be been being below both but by can could did do
+    does doing down during each few for from further had has have having he her here hers him his how i if
+    in into is it its just me more most my no nor not now of off on once only or other our ours out over own
+    same she should so some such than that the their them then there these they this those through to too
+    under until up very was we were what when where which while who whom why will with would you your yours
+    role team work working job company including experience ability strong years using within across new
+    """.split()
+)
+
+
+def terms(text: str) -> Counter:
+    return Counter(token for token in tokenize(text) if token not in _STOPWORDS and len(token) > 1)
+
+
+class CorpusStats(NamedTuple):
+    docs: int
+    avg_length: float
+    df: Mapping[str, int]  # document frequency; terms not listed occur in no indexed description
+
+
+class TextScorer:
+    """
+    BM25-weighted cosine similarity between a resume and job descriptions, pure Python and offline.
+
+    IDF and average length come from `stats(vocabulary)`, the persisted job index (JobCorpus.text_stats),
+    so a job and resume score the same after a restart or a different request history. The resume side
+    keeps only terms that occur in indexed descriptions: a term no job uses has df=0 and the highest IDF,
+    so it would swell the resume's norm without ever matching. A resume shares only part of a posting's
+    wording, so the cosine is scaled to count `full` or more as a complete match. Documents are sparse
+    term->weight dicts and each dot product walks the smaller side.
+    """
+
+    def __init__(
+        self,
+        stats: Callable[[Set[str]], CorpusStats],
+        k1: float = BM25_K1,
+        b: float = BM25_B,
+        full: float = SCORE_TEXT_FULL,
+    ) -> None:
+        self.stats = stats
+        self.k1 = k1
+        self.b = b
+        self.full = full
+
+    def _weights(self, counts: Mapping[str, int], avg_length: float, idf: Dict[str, float]) -> Dict[str, float]:
+        length = sum(counts.values())
+        norm = self.k1 * (1 - self.b + self.b * length / avg_length) if avg_length else self.k1
+        return {term: idf[term] * tf * (self.k1 + 1) / (tf + norm) for term, tf in counts.items()}
+
+    def score(self, resume_counts: Mapping[str, int], docs: Sequence[Mapping[str, int]]) -> List[float]:
+        """Text similarity in [0, 1] of the resume against each document's term counts, in input order."""
+        vocabulary = set(resume_counts)
+        for counts in docs:
+            vocabulary.update(counts)
+        stats = self.stats(vocabulary)
+        n = max(stats.docs, 1)
+        idf = {}
+        for term in vocabulary:
+            df = min(stats.df.get(term, 0), n)
+            idf[term] = math.log(1 + (n - df + 0.5) / (df + 0.5))
+        indexed = {term: tf for term, tf in resume_counts.items() if stats.df.get(term)}
+        query = self._weights(indexed, stats.avg_length, idf)
+        query_norm = _norm(query.values())
+        full = self.full if self.full > 0 else 1.0
+        scores = []
+        for counts in docs:
+            doc = self._weights(counts, stats.avg_length, idf)
+            denominator = query_norm * _norm(doc.values())
+            if not denominator:
+                scores.append(0.0)
+                continue
+            # Iterate the smaller side: only shared terms contribute to the dot product.
+            small, large = (doc, query) if len(doc) < len(query) else (query, doc)
+            dot = sum(weight * large.get(term, 0.0) for term, weight in small.items())
+            scores.append(min(1.0, dot / denominator / full))
+        return scores
+
+
+def _norm(values: Iterable[float]) -> float:
+    return math.sqrt(sum(value * value for value in values))
+
+
+def blend(skill_ratio: float, text_similarity: float, weight: float = SCORE_TEXT_WEIGHT) -> float:
+    weight = min(max(weight, 0.0), 1.0)
+    return (1 - weight) * skill_ratio + weight * text_similarity
@@ -0,0 +1,84 @@
+import re
+from functools import lru_cache
+from itertools import product
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Set
+
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_RAW_TOKEN_RE = re.compile(r"[a-z0-9.+#]*[a-z0-9+#]")  # keyword tokens with their symbols: "c++", "c#", ".net"
+_SYMBOLS = frozenset(".+#")
+_END = ""  # trie key marking a complete skill phrase
+
+
+def token_variants(token: str) -> List[str]:
+    # Plurals are folded at build time ("dashboard" also indexes "dashboards") so matching stays a plain lookup.
+    if token.endswith("s") or len(token) < 3 or _SYMBOLS.intersection(token):
+        return [token]
+    return [token, token + "s"]
+
+
+def symbol_tokens(keywords: Iterable[str]) -> FrozenSet[str]:
+    """Tokens of `keywords` that carry `+`, `#` or `.` and must match whole ("c++" is not "c")."""
+    return frozenset(
+        token
+        for keyword in keywords
+        for token in _RAW_TOKEN_RE.findall(keyword.lower())
+        if _SYMBOLS.intersection(token) and _TOKEN_RE.search(token)
+    )
+
+
+@lru_cache(maxsize=16)
+def _token_re(keep: FrozenSet[str]) -> "re.Pattern[str]":
+    symbols = "|".join(re.escape(token) for token in sorted(keep, key=len, reverse=True))
+    return re.compile(rf"(?:{symbols})(?![a-z0-9])|[a-z0-9]+")
+
+
+def tokenize(text: str, keep: FrozenSet[str] = frozenset()) -> List[str]:
+    """
+    Lowercase alphanumeric tokens. Symbol tokens listed in `keep` stay whole; any other "c++" or "node.js"
+    splits into its alphanumeric parts.
+    """
+    return (_token_re(keep) if keep else _TOKEN_RE).findall(text.lower())
+
+
+class SkillMatcher:
+    """
+    Word-boundary skill matcher over a token trie built once from the taxonomy.
+
+    Matching is a single pass over the text's tokens; at each position the trie is walked only as far as
+    the longest skill phrase, so cost grows with text length rather than taxonomy size. `aliases` maps a
+    keyword to other spellings ("postgres" -> "postgresql"); a match on any of them reports the keyword.
+    """
+
+    def __init__(self, keywords: Iterable[str], aliases: Optional[Mapping[str, Iterable[str]]] = None) -> None:
+        self.trie: Dict[str, dict] = {}
+        keywords = list(keywords)
+        spellings = [(keyword, keyword) for keyword in keywords]
+        spellings += [(alias, keyword) for keyword, names in (aliases or {}).items() for alias in names]
+        self.keep = symbol_tokens(spelling for spelling, _ in spellings)
+        for spelling, keyword in spellings:
+            tokens = tokenize(spelling, self.keep)
+            if not tokens:
+                continue
+            for phrase in product(*(token_variants(token) for token in tokens)):
+                node = self.trie
+                for token in phrase:
+                    node = node.setdefault(token, {})
+                node.setdefault(_END, keyword)
+
+    def find(self, text: str) -> Set[str]:
+        tokens = tokenize(text, self.keep)
+        found: Set[str] = set()
+        root = self.trie
+        for start, token in enumerate(tokens):
+            node = root.get(token)
+            position = start + 1
+            while node is not None:
+                skill = node.get(_END)
+                if skill is not None:
+                    found.add(skill)
+                if position >= len(tokens):
+                    break
+                node = node.get(tokens[position])
+                position += 1
+        return found
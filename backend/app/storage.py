@@ -0,0 +1,147 @@
+import json
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+from .models import SavedRecord
+
+
+logger = logging.getLogger("hiresignal")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS saved (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL UNIQUE,
+    job_url TEXT NOT NULL,
+    company TEXT NOT NULL,
+    title TEXT NOT NULL,
+    fit_score REAL NOT NULL,
+    timestamp TEXT NOT NULL,
+    has_generated INTEGER NOT NULL DEFAULT 0,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_saved_job_url ON saved (job_url);
+CREATE INDEX IF NOT EXISTS idx_saved_company ON saved (company);
+CREATE INDEX IF NOT EXISTS idx_saved_timestamp ON saved (timestamp);
+"""
+
+
+class SavedStore:
+    """
+    SQLite (WAL) store for saved applications.
+
+    Each save is a single indexed INSERT; the full record is kept as JSON next to the indexed columns.
+    Connections are per thread because FastAPI runs sync endpoints on a worker pool.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._local = threading.local()
+        conn = self._conn()
+        conn.executescript(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def append(self, record: SavedRecord) -> SavedRecord:
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "INSERT INTO saved (id, job_url, company, title, fit_score, timestamp, has_generated, record) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                _row(record),
+            )
+        return record
+
+    def count(self) -> int:
+        return self._conn().execute("SELECT COUNT(*) FROM saved").fetchone()[0]
+
+    def page(self, limit: Optional[int] = None, offset: int = 0) -> List[SavedRecord]:
+        rows = self._conn().execute(
+            "SELECT record FROM saved ORDER BY seq LIMIT ? OFFSET ?",
+            (-1 if limit is None else limit, offset),
+        )
+        return [SavedRecord.model_validate_json(row[0]) for row in rows]
+
+    def iter_all(self) -> Iterator[SavedRecord]:
+        for row in self._conn().execute("SELECT record FROM saved ORDER BY seq"):
+            yield SavedRecord.model_validate_json(row[0])
+
+    def iter_filtered(
+        self,
+        since: Optional[str] = None,
+        before: Optional[str] = None,
+        min_fit: Optional[float] = None,
+        batch: int = 500,
+    ) -> Iterator[SavedRecord]:
+        """
+        Records with `since <= timestamp < before` and `fit_score >= min_fit`, in save order. Reads in
+        keyset batches on a fresh cursor each time, so memory stays flat and a streaming response may
+        resume it from a different worker thread.
+        """
+        clauses, params = ["seq > ?"], []
+        if since:
+            clauses.append("timestamp >= ?")
+            params.append(since)
+        if before:
+            clauses.append("timestamp < ?")
+            params.append(before)
+        if min_fit is not None:
+            clauses.append("fit_score >= ?")
+            params.append(min_fit)
+        sql = f"SELECT seq, record FROM saved WHERE {' AND '.join(clauses)} ORDER BY seq LIMIT ?"
+        last = 0
+        while True:
+            rows = self._conn().execute(sql, (last, *params, batch)).fetchall()
+            for seq, record in rows:
+                last = seq
+                yield SavedRecord.model_validate_json(record)
+            if len(rows) < batch:
+                return
+
+    def migrate_json(self, json_path: Path) -> int:
+        """One-time import of the legacy db.json; the file is renamed afterwards so it never re-imports."""
+        if not json_path.exists():
+            return 0
+        try:
+            entries = json.loads(json_path.read_text(encoding="utf-8") or "[]")
+        except json.JSONDecodeError as exc:
+            logger.warning("Skipping migration of unreadable %s: %s", json_path, exc)
+            return 0
+        records = []
+        for entry in entries:
+            if "has_generated" not in entry:
+                entry["has_generated"] = bool(entry.get("generated"))
+            records.append(SavedRecord.model_validate(entry))
+        conn = self._conn()
+        with conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO saved (id, job_url, company, title, fit_score, timestamp, has_generated, record) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [_row(record) for record in records],
+            )
+        json_path.rename(json_path.with_name(json_path.name + ".migrated"))
+        logger.info("Migrated %d saved records from %s", len(records), json_path)
+        return len(records)
+
+
+def _row(record: SavedRecord) -> tuple:
+    return (
+        record.id,
+        record.job.url,
+        record.job.company,
+        record.job.title,
+        record.fit_score,
+        record.timestamp,
+        int(record.has_generated),
+        record.model_dump_json(),
+    )
@@ -0,0 +1,163 @@
+"""
+Offline extraction benchmark and regression check over saved LinkedIn pages.
+
+Each page goes through the same parse `fetch_job_from_linkedin_async` runs once the HTML is in hand
+(`parse_job_html`), with no network and no caches. Reported per page: median time for each stage
+(regex extraction, description cleanup, skills, salary) and the whole parse, plus peak memory of one parse.
+The footer gives throughput in pages/sec.
+
+Golden outputs live next to the fixtures as `golden/<page>.json`. `--check` compares every field and exits
+non-zero on any difference; `--update-golden` rewrites them after an intended change. `--check` also replays
+each page through the fetcher's PageReader in STREAM_CHUNK reads with FETCH_STOP_EARLY on, and requires the
+part it keeps to parse the same as the whole page (guest pages stop after the job criteria list).
+
+Run from the backend directory:
+    python -m benchmarks.bench_extractor [--repeat N] [--check | --update-golden] [PAGES_DIR]
+"""
+
+import argparse
+import codecs
+import hashlib
+import json
+import logging
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from app.extractor import extract_job_fields
+from app.fetcher import PageReader
+from app.models import JobPosting
+from app.parsing import extract_skills, format_salary_to_k, parse_job_html, sanitize_description
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+ROOT_DIR = BASE_DIR.parent
+STAGES = ("extract", "clean", "skills", "salary", "parse")
+STREAM_CHUNK = 16 * 1024  # bytes per simulated network read
+
+
+def timed(fn: Callable[[], object], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def stage_times(url: str, html: str, repeat: int) -> Dict[str, float]:
+    fields = extract_job_fields(html)
+    description = sanitize_description(fields.description or fields.page_text)
+    raw_salary = fields.salary or "Unavailable"
+    return {
+        "extract": timed(lambda: extract_job_fields(html), repeat),
+        "clean": timed(lambda: sanitize_description(fields.description or fields.page_text), repeat),
+        "skills": timed(lambda: (extract_skills(description), extract_skills(fields.page_text)), repeat),
+        "salary": timed(lambda: format_salary_to_k(raw_salary), repeat),
+        "parse": timed(lambda: parse_job_html(url, html), repeat),
+    }
+
+
+def peak_memory(url: str, html: str) -> int:
+    tracemalloc.start()
+    try:
+        parse_job_html(url, html)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def streamed_prefix(url: str, html: str) -> str:
+    """What a fetch with FETCH_STOP_EARLY keeps of `html`: the page fed to PageReader in STREAM_CHUNK reads."""
+    data = html.encode("utf-8")
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    reader = PageReader(max_bytes=0, stop_early=True)
+    downloaded, stopped = 0, False
+    while downloaded < len(data) and not stopped:
+        chunk = data[downloaded:downloaded + STREAM_CHUNK]
+        downloaded += len(chunk)
+        stopped = reader.feed(decoder.decode(chunk), downloaded)
+    return reader.finish(url, downloaded, stopped)
+
+
+def snapshot(job: JobPosting) -> dict:
+    """Golden view of a parsed posting: every field except the URL-derived ones, description by hash."""
+    fields = job.model_dump(exclude={"id", "url", "description"})
+    fields["description_sha256"] = hashlib.sha256(job.description.encode("utf-8")).hexdigest()
+    fields["description_chars"] = len(job.description)
+    return fields
+
+
+def diff(expected: dict, actual: dict) -> List[str]:
+    return [
+        f"{key}: expected {expected.get(key)!r}, got {actual.get(key)!r}"
+        for key in sorted(set(expected) | set(actual))
+        if expected.get(key) != actual.get(key)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pages_dir", nargs="?", default=str(ROOT_DIR / "samples"))
+    parser.add_argument("--repeat", type=int, default=20)
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--check", action="store_true", help="compare parsed fields with golden outputs")
+    mode.add_argument("--update-golden", action="store_true", help="rewrite golden outputs from the current parser")
+    args = parser.parse_args()
+    logging.getLogger("hiresignal").setLevel(logging.WARNING)
+
+    pages_dir = Path(args.pages_dir)
+    golden_dir = pages_dir / "golden"
+    pages = sorted(pages_dir.glob("*.html"))
+    if not pages:
+        raise SystemExit(f"No .html pages found in {args.pages_dir}")
+
+    header = "".join(f"{stage + ' ms':>11}" for stage in STAGES)
+    print(f"{'page':<28}{'size':>8}{header}{'peak MB':>9}  title @ company")
+    failures = 0
+    total_parse = 0.0
+    for path in pages:
+        html = path.read_text(encoding="utf-8", errors="ignore")
+        url = path.as_uri()
+        times = stage_times(url, html, args.repeat)
+        total_parse += times["parse"]
+        job = parse_job_html(url, html)
+        label = f"{job.title} @ {job.company}" if job else "(no job parsed)"
+        columns = "".join(f"{times[stage] * 1000:>11.2f}" for stage in STAGES)
+        print(f"{path.name:<28}{len(html) / 1024:>6.0f}KB{columns}{peak_memory(url, html) / 2**20:>9.1f}  {label}")
+
+        golden_path = golden_dir / f"{path.stem}.json"
+        actual = snapshot(job) if job else {}
+        if args.update_golden:
+            golden_dir.mkdir(parents=True, exist_ok=True)
+            golden_path.write_text(json.dumps(actual, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        elif args.check:
+            if not golden_path.exists():
+                print(f"  MISSING golden {golden_path.name}")
+                failures += 1
+                continue
+            problems = diff(json.loads(golden_path.read_text(encoding="utf-8")), actual)
+            for problem in problems:
+                print(f"  MISMATCH {problem}")
+            prefix = streamed_prefix(url, html)
+            early = parse_job_html(url, prefix)
+            early_problems = diff(actual, snapshot(early) if early else {})
+            for problem in early_problems:
+                print(f"  STOP-EARLY MISMATCH {problem}")
+            if len(prefix) < len(html):
+                print(f"  stop early: read {len(prefix) / 1024:.0f}KB of {len(html) / 1024:.0f}KB")
+            failures += bool(problems or early_problems)
+
+    print(f"\n{len(pages)} pages, {len(pages) / total_parse:.1f} pages/sec (median parse)")
+    if args.update_golden:
+        print(f"Golden outputs written to {golden_dir}")
+    elif args.check:
+        print("Golden check:", f"{failures} page(s) differ" if failures else "all fields match")
+        if failures:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
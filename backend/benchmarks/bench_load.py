@@ -0,0 +1,343 @@
+"""
+End-to-end load test: the real app under concurrent users, against local stand-ins for LinkedIn and OpenAI.
+
+Two stub servers run in-process: one serves the fixture job pages for any path, the other answers
+/v1/chat/completions with a canned reply; both sleep a configurable latency (plus jitter) per request.
+The app runs under uvicorn in a subprocess from a scratch copy of `app/`, so every run starts with empty
+caches and a fresh database and nothing under backend/ is touched. Each job URL is unique, so fetches,
+parses and generations are never served from cache.
+
+Virtual users loop over the endpoint mix (/jobs/process, /jobs/process_one, /api/ai, /save) for the
+given duration. A probe requests the cached /openapi.json every 50 ms: its latency is time spent waiting
+for the event loop, so it rises when a handler blocks the loop. Reported per endpoint: requests,
+errors, throughput and p50/p95/p99/max latency.
+
+Run from the backend directory:
+    python -m benchmarks.bench_load [--users N] [--duration S] [--page-latency S] [--llm-latency S]
+                                    [--mix process=1,process_one=4,ai=2,save=2] [--json PATH]
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+ROOT_DIR = BACKEND_DIR.parent
+ENDPOINTS = ("process", "process_one", "ai", "save")
+PROBE_INTERVAL = 0.05
+
+RESUME_TEXT = """Jane Doe
+Senior Data Engineer
+
+Summary:
+Data engineer with eight years building batch and streaming pipelines in Python, SQL and Scala.
+
+Experience:
+- Built Airflow and dbt pipelines on Snowflake and BigQuery serving 40 analysts
+- Ran Kafka and Spark streaming jobs on AWS (EMR, S3, Lambda) with Terraform and Docker
+- Designed REST APIs in FastAPI backed by PostgreSQL; CI/CD with GitHub Actions and Kubernetes
+"""
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, min(len(sorted_values), round(pct / 100 * len(sorted_values) + 0.5)))
+    return sorted_values[rank - 1]
+
+
+def parse_mix(text: str) -> Dict[str, int]:
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        if name.strip() not in ENDPOINTS:
+            raise SystemExit(f"Unknown endpoint {name.strip()!r} in --mix; expected one of {', '.join(ENDPOINTS)}")
+        mix[name.strip()] = int(weight or 1)
+    return {name: weight for name, weight in mix.items() if weight > 0}
+
+
+class StubServer:
+    """ThreadingHTTPServer on a free port in a daemon thread; `respond(handler)` writes each reply."""
+
+    def __init__(self, respond: Callable[[BaseHTTPRequestHandler], None], latency: float, jitter: float) -> None:
+        def delay() -> None:
+            time.sleep(max(0.0, latency + random.uniform(-jitter, jitter)))
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                delay()
+                respond(self)
+
+            do_POST = do_GET
+
+            def log_message(self, *args) -> None:
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", free_port()), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def send(handler: BaseHTTPRequestHandler, status: int, body: bytes, content_type: str) -> None:
+    handler.send_response(status)
+    handler.send_header("Content-Type", content_type)
+    handler.send_header("Content-Length", str(len(body)))
+    handler.end_headers()
+    handler.wfile.write(body)
+
+
+def linkedin_stub(pages: List[bytes], latency: float, jitter: float) -> StubServer:
+    def respond(handler: BaseHTTPRequestHandler) -> None:
+        send(handler, 200, pages[hash(handler.path) % len(pages)], "text/html; charset=utf-8")
+
+    return StubServer(respond, latency, jitter)
+
+
+def openai_stub(latency: float, jitter: float) -> StubServer:
+    def respond(handler: BaseHTTPRequestHandler) -> None:
+        body = json.loads(handler.rfile.read(int(handler.headers.get("Content-Length") or 0)) or b"{}")
+        words = max(1, int(body.get("max_completion_tokens", 200)) * 3 // 4)
+        text = " ".join(itertools.islice(itertools.cycle("Thanks for considering my application".split()), words))
+        payload = {"choices": [{"message": {"role": "assistant", "content": text}}], "usage": {"completion_tokens": words}}
+        send(handler, 200, json.dumps(payload).encode("utf-8"), "application/json")
+
+    return StubServer(respond, latency, jitter)
+
+
+def sandbox_app(directory: Path) -> Path:
+    """Copy of the app in `directory`/backend with the shared templates linked in; returns the backend dir."""
+    backend = directory / "backend"
+    shutil.copytree(BACKEND_DIR / "app", backend / "app", ignore=shutil.ignore_patterns("__pycache__"))
+    (directory / "templates").symlink_to(ROOT_DIR / "templates", target_is_directory=True)
+    return backend
+
+
+def start_app(backend: Path, port: int, env: Dict[str, str], quiet: bool) -> subprocess.Popen:
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--log-level", "warning", "--no-access-log"],
+        cwd=backend,
+        env={**os.environ, **env},
+        stdout=subprocess.DEVNULL if quiet else None,
+        stderr=subprocess.DEVNULL if quiet else None,
+    )
+
+
+async def wait_ready(client: httpx.AsyncClient, proc: subprocess.Popen, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise SystemExit(f"App exited during startup (code {proc.returncode})")
+        try:
+            if (await client.get("/openapi.json")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.2)
+    raise SystemExit("App did not become ready in time")
+
+
+class LoadTest:
+    def __init__(self, client: httpx.AsyncClient, page_url: str, resume_id: str, batch_size: int) -> None:
+        self.client = client
+        self.page_url = page_url
+        self.resume_id = resume_id
+        self.batch_size = batch_size
+        self.latencies: Dict[str, List[float]] = {name: [] for name in (*ENDPOINTS, "probe")}
+        self.errors: Dict[str, int] = {name: 0 for name in (*ENDPOINTS, "probe")}
+        self.jobs: List[dict] = []  # analyses returned so far, reused as /api/ai and /save payloads
+        self._ids = itertools.count(1)
+
+    def next_url(self) -> str:
+        # Not /jobs/view/<id>: the app would canonicalize that to linkedin.com.
+        return f"{self.page_url}/posting/{next(self._ids)}"
+
+    async def timed(self, name: str, send: Callable[[], Awaitable[httpx.Response]]) -> Optional[httpx.Response]:
+        start = time.perf_counter()
+        try:
+            resp = await send()
+        except httpx.HTTPError:
+            resp = None
+        self.latencies[name].append(time.perf_counter() - start)
+        if resp is None or resp.status_code >= 400:
+            self.errors[name] += 1
+            return None
+        return resp
+
+    def analysis(self) -> Optional[dict]:
+        return random.choice(self.jobs) if self.jobs else None
+
+    async def call(self, name: str) -> None:
+        if name == "process":
+            urls = ",".join(self.next_url() for _ in range(self.batch_size))
+            form = {"urls": urls, "resume_id": self.resume_id}
+            resp = await self.timed(name, lambda: self.client.post("/jobs/process", data=form))
+            if resp:
+                self.jobs.extend(resp.json()["jobs"][:1])
+        elif name == "process_one":
+            form = {"url": self.next_url(), "resume_id": self.resume_id}
+            resp = await self.timed(name, lambda: self.client.post("/jobs/process_one", data=form))
+            if resp:
+                self.jobs.append(resp.json()["job"])
+        elif name == "ai":
+            analysis = self.analysis() or await self.seed()
+            body = {
+                "kind": random.choice(("inmail", "cover")),
+                "job": analysis["job"],
+                "resume_id": self.resume_id,
+                "matched_skills": analysis["matched_skills"],
+                "force": True,
+            }
+            await self.timed(name, lambda: self.client.post("/api/ai", json=body))
+        elif name == "save":
+            analysis = self.analysis() or await self.seed()
+            body = {
+                "job": analysis["job"],
+                "fit_score": analysis["fit_score"],
+                "missing_skills": analysis["missing_skills"],
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            }
+            await self.timed(name, lambda: self.client.post("/save", json=body))
+        self.jobs = self.jobs[-200:]
+
+    async def seed(self) -> dict:
+        resp = await self.client.post("/jobs/process_one", data={"url": self.next_url(), "resume_id": self.resume_id})
+        resp.raise_for_status()
+        self.jobs.append(resp.json()["job"])
+        return self.jobs[-1]
+
+    async def user(self, mix: Dict[str, int], deadline: float) -> None:
+        names, weights = zip(*mix.items())
+        while time.monotonic() < deadline:
+            await self.call(random.choices(names, weights)[0])
+
+    async def probe(self, deadline: float) -> None:
+        while time.monotonic() < deadline:
+            await self.timed("probe", lambda: self.client.get("/openapi.json"))
+            await asyncio.sleep(PROBE_INTERVAL)
+
+
+def report(test: LoadTest, elapsed: float) -> Tuple[str, dict]:
+    lines = [f"{'endpoint':<14}{'reqs':>7}{'errors':>8}{'req/s':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}"]
+    summary = {}
+    for name, values in test.latencies.items():
+        if not values:
+            continue
+        values = sorted(values)
+        stats = {
+            "requests": len(values),
+            "errors": test.errors[name],
+            "rps": len(values) / elapsed,
+            **{f"p{pct}_ms": percentile(values, pct) * 1000 for pct in (50, 95, 99)},
+            "max_ms": values[-1] * 1000,
+        }
+        summary[name] = stats
+        lines.append(
+            f"{name:<14}{stats['requests']:>7}{stats['errors']:>8}{stats['rps']:>8.1f}"
+            f"{stats['p50_ms']:>9.1f}{stats['p95_ms']:>9.1f}{stats['p99_ms']:>9.1f}{stats['max_ms']:>9.1f}"
+        )
+    total = sum(len(test.latencies[name]) for name in ENDPOINTS)
+    lines.append(f"\n{total} requests in {elapsed:.1f}s, {total / elapsed:.1f} req/s (probe excluded)")
+    return "\n".join(lines), summary
+
+
+async def run(args: argparse.Namespace) -> None:
+    pages = [path.read_bytes() for path in sorted(Path(args.pages_dir).glob("*.html"))]
+    if not pages:
+        raise SystemExit(f"No .html pages found in {args.pages_dir}")
+    linkedin = linkedin_stub(pages, args.page_latency, args.jitter)
+    openai = openai_stub(args.llm_latency, args.jitter)
+    port = free_port()
+    with tempfile.TemporaryDirectory(prefix="hiresignal-load-") as scratch:
+        backend = sandbox_app(Path(scratch))
+        # Everything the app writes (resume_extracted.txt in its cwd, caches, saved.db, profiles) stays in the
+        # sandbox, even if the caller's environment points the caches elsewhere.
+        env = {
+            "OPENAI_API_KEY": "stub",
+            "OPENAI_BASE_URL": f"{openai.url}/v1",
+            "FETCH_HOST_RATE": str(args.host_rate),
+            "PAGE_CACHE_DIR": str(backend / "page_cache"),
+            "PROFILE_DIR": str(backend / "profiles"),
+        }
+        proc = start_app(backend, port, env, quiet=not args.app_log)
+        limits = httpx.Limits(max_connections=args.users + 1, max_keepalive_connections=args.users + 1)
+        try:
+            async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", timeout=120, limits=limits) as client:
+                await wait_ready(client, proc)
+                files = {"file": ("resume.txt", RESUME_TEXT.encode("utf-8"), "text/plain")}
+                resume = await client.post("/upload/resume", files=files)
+                resume.raise_for_status()
+                test = LoadTest(client, linkedin.url, resume.json()["resume_id"], args.batch_size)
+                print(
+                    f"{args.users} users for {args.duration:.0f}s, mix {args.mix}; "
+                    f"page latency {args.page_latency * 1000:.0f} ms, LLM latency {args.llm_latency * 1000:.0f} ms"
+                )
+                started = time.monotonic()
+                deadline = started + args.duration
+                await asyncio.gather(test.probe(deadline), *(test.user(args.mix, deadline) for _ in range(args.users)))
+                elapsed = time.monotonic() - started
+        finally:
+            proc.terminate()
+            proc.wait(timeout=10)
+            linkedin.close()
+            openai.close()
+
+    table, summary = report(test, elapsed)
+    print(table)
+    if args.json:
+        settings = {key: value for key, value in vars(args).items() if key != "json"}
+        Path(args.json).write_text(json.dumps({"settings": settings, "results": summary}, indent=2) + "\n")
+        print(f"Results written to {args.json}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=16, help="concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=20.0, help="seconds of load")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("process=1,process_one=4,ai=2,save=2"),
+                        help="endpoint=weight pairs")
+    parser.add_argument("--batch-size", type=int, default=5, help="URLs per /jobs/process request")
+    parser.add_argument("--page-latency", type=float, default=0.3, help="seconds the LinkedIn stub waits per page")
+    parser.add_argument("--llm-latency", type=float, default=1.0, help="seconds the OpenAI stub waits per completion")
+    parser.add_argument("--jitter", type=float, default=0.05, help="+/- seconds added to both stub latencies")
+    parser.add_argument("--host-rate", type=float, default=0, help="FETCH_HOST_RATE for the app (0 = unlimited)")
+    parser.add_argument("--pages-dir", default=str(ROOT_DIR / "samples"), help="fixture .html pages to serve")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--app-log", action="store_true", help="show the app's own log output")
+    parser.add_argument("--json", help="also write the results as JSON, for comparing runs")
+    args = parser.parse_args()
+    random.seed(args.seed)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
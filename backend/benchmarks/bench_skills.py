@@ -0,0 +1,78 @@
+"""
+Microbenchmark: compiled SkillMatcher vs the old per-keyword substring scan.
+
+Run from the backend directory:
+    python -m benchmarks.bench_skills [--repeat N] [--taxonomy-size N]
+"""
+
+import argparse
+import logging
+import random
+import string
+import time
+from pathlib import Path
+from typing import Callable, List, Set
+
+from app.extractor import extract_job_fields
+from app.parsing import SKILL_ALIASES, SKILL_KEYWORDS
+from app.skills import SkillMatcher
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+ROOT_DIR = BASE_DIR.parent
+
+
+def substring_skills(keywords: List[str], text: str) -> Set[str]:
+    # The previous extract_skills: one `in` scan per keyword, no word boundaries.
+    lowered = text.lower()
+    return {skill for skill in keywords if skill in lowered}
+
+
+def synthetic_taxonomy(size: int, seed: int = 7) -> List[str]:
+    rng = random.Random(seed)
+    words = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 10))) for _ in range(size)]
+    phrases = [" ".join(rng.sample(words, rng.randint(1, 3))) for _ in range(size)]
+    return SKILL_KEYWORDS + phrases
+
+
+def best_of(fn: Callable[[], object], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--taxonomy-size", type=int, default=20000)
+    args = parser.parse_args()
+    logging.getLogger("hiresignal").setLevel(logging.WARNING)
+
+    texts = {"resume": (BASE_DIR / "resume_extracted.txt").read_text(encoding="utf-8", errors="ignore")}
+    for path in sorted((ROOT_DIR / "samples").glob("*.html")):
+        fields = extract_job_fields(path.read_text(encoding="utf-8", errors="ignore"))
+        texts[path.stem] = fields.description or ""
+
+    for label, keywords in (
+        (f"default taxonomy ({len(SKILL_KEYWORDS)})", SKILL_KEYWORDS),
+        (f"synthetic taxonomy ({len(SKILL_KEYWORDS) + args.taxonomy_size})", synthetic_taxonomy(args.taxonomy_size)),
+    ):
+        start = time.perf_counter()
+        matcher = SkillMatcher(keywords, SKILL_ALIASES)
+        build_ms = (time.perf_counter() - start) * 1000
+        print(f"\n{label}: matcher build {build_ms:.1f} ms")
+        print(f"{'text':<20}{'chars':>8}{'substring ms':>14}{'matcher ms':>12}{'speedup':>9}  dropped by word boundaries")
+        for name, text in texts.items():
+            old_ms = best_of(lambda: substring_skills(keywords, text), args.repeat) * 1000
+            new_ms = best_of(lambda: matcher.find(text), args.repeat) * 1000
+            dropped = sorted(substring_skills(keywords, text) - {s.lower() for s in matcher.find(text)})
+            print(
+                f"{name:<20}{len(text):>8}{old_ms:>14.3f}{new_ms:>12.3f}{old_ms / new_ms:>8.1f}x  "
+                f"{', '.join(dropped[:8]) or '-'}"
+            )
+
+
+if __name__ == "__main__":
+    main()
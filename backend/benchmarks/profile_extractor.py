@@ -0,0 +1,59 @@
+"""
+Profile the extraction pipeline (`parse_job_html`) over saved job pages with the app's sampling profiler.
+
+By default it uses the pages the API last fetched (`backend/fetched_pages/`). It prints the hottest
+functions by self time and writes a speedscope profile you can open at https://www.speedscope.app.
+
+Run from the backend directory:
+    python -m benchmarks.profile_extractor [--repeat N] [--interval S] [--top N] [--out PATH] [PAGES_DIR]
+"""
+
+import argparse
+import logging
+import os
+import time
+from pathlib import Path
+
+from app.parsing import parse_job_html
+from app.profiler import PROFILE_DIR, SamplingProfiler
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+ROOT_DIR = BASE_DIR.parent
+FETCHED_DIR = BASE_DIR / "fetched_pages"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pages_dir", nargs="?", default=str(FETCHED_DIR))
+    parser.add_argument("--repeat", type=int, default=5, help="parses per page")
+    parser.add_argument("--interval", type=float, default=0.001, help="seconds between stack samples")
+    parser.add_argument("--top", type=int, default=25, help="functions to list")
+    parser.add_argument("--out", help="speedscope output path (default: PROFILE_DIR/extract-<time>.speedscope.json)")
+    args = parser.parse_args()
+    logging.getLogger("hiresignal").setLevel(logging.WARNING)
+
+    pages = sorted(Path(args.pages_dir).glob("*.html"))
+    if not pages:
+        raise SystemExit(f"No .html pages found in {args.pages_dir} (try {ROOT_DIR / 'samples'})")
+    documents = [(path.resolve().as_uri(), path.read_text(encoding="utf-8", errors="ignore")) for path in pages]
+
+    with SamplingProfiler(interval=args.interval) as profiler:
+        for _ in range(args.repeat):
+            for url, html in documents:
+                parse_job_html(url, html)
+    elapsed = profiler.stopped - profiler.started
+    parses = len(documents) * args.repeat
+    print(f"{parses} parses of {len(documents)} pages in {elapsed:.2f}s ({elapsed / parses * 1000:.1f} ms/parse)\n")
+
+    print(f"{'self s':>8}{'self %':>8}{'total s':>9}  function")
+    for (name, file, line), own, total in profiler.top(args.top):
+        location = os.path.relpath(file) if file.startswith(os.getcwd()) else Path(file).name
+        print(f"{own:>8.3f}{own / elapsed * 100:>7.1f}%{total:>9.3f}  {name}  ({location}:{line})")
+
+    out = Path(args.out) if args.out else PROFILE_DIR / f"extract-{time.strftime('%Y%m%d-%H%M%S')}.speedscope.json"
+    profiler.save(out, f"parse_job_html x{parses}")
+    print(f"\nSpeedscope profile written to {out}")
+
+
+if __name__ == "__main__":
+    main()
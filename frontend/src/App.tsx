@@ -18,20 +18,42 @@ type JobPosting = {
   contact_person?: string | null
   posted_at?: string | null
   applicants?: string | null
+  partial?: boolean
 }
 
 type CsvMeta = {
   benefits?: string | null
   workplace_type?: string | null
+  title?: string | null
+  company?: string | null
+  location?: string | null
+  insight?: string | null
+  chips?: string | null
+}
+
+type CsvReport = {
+  rows: number
+  accepted: number
+  duplicates: number
+  invalid: number
+  duplicate_rows: { row: number; url: string; duplicate_of: number }[]
+  invalid_rows: { row: number; url: string; reason: string }[]
 }
 
 type JobAnalysis = {
   job: JobPosting
-  fit_score: number
+  // null for partial (CSV-only) postings until the page is fetched and parsed
+  fit_score: number | null
   matched_skills: string[]
   missing_skills: string[]
 }
 
+type ProcessStreamEvent =
+  | { event: 'start'; total: number }
+  | { event: 'job'; index: number; url: string; job: JobAnalysis; done: number; total: number }
+  | { event: 'error'; index: number; url: string; detail: string; done: number; total: number }
+  | { event: 'done'; total: number; failed: number }
+
 type GeneratedMaterials = {
   inmail: string
   cover_letter: string
@@ -81,8 +103,30 @@ async function api<T>(path: string, options?: RequestInit) {
   return res.json() as Promise<T>
 }
 
+// Reads a newline-delimited JSON response, calling onEvent as each line arrives.
+async function streamNdjson<T>(path: string, options: RequestInit, onEvent: (event: T) => void) {
+  const res = await fetch(`${API_BASE}${path}`, options)
+  if (!res.ok || !res.body) {
+    const message = await res.text()
+    throw new Error(message || 'Request failed')
+  }
+  const reader = res.body.getReader()
+  const decoder = new TextDecoder()
+  let buffered = ''
+  for (;;) {
+    const { done, value } = await reader.read()
+    buffered += decoder.decode(value, { stream: !done })
+    const lines = buffered.split('\n')
+    buffered = lines.pop() || ''
+    lines.filter((line) => line.trim()).forEach((line) => onEvent(JSON.parse(line) as T))
+    if (done) break
+  }
+  if (buffered.trim()) onEvent(JSON.parse(buffered) as T)
+}
+
 function App() {
   const [resumeText, setResumeText] = useState('')
+  const [resumeId, setResumeId] = useState('')
   const [resumeSkills, setResumeSkills] = useState<string[]>([])
   const [urls, setUrls] = useState<string[]>([])
   const [urlMeta, setUrlMeta] = useState<Record<string, CsvMeta>>({})
@@ -92,6 +136,8 @@ function App() {
   const [csvInputKey, setCsvInputKey] = useState(() => Date.now() + 1)
   const [singleUrl, setSingleUrl] = useState('')
   const [showCsvUpload, setShowCsvUpload] = useState(true)
+  const [metadataFirst, setMetadataFirst] = useState(false)
+  const [enrichingId, setEnrichingId] = useState<string | null>(null)
   const [jobs, setJobs] = useState<JobAnalysis[]>([])
   const [materials, setMaterials] = useState<Record<string, GeneratedMaterials>>({})
   const [materialsDraft, setMaterialsDraft] = useState<Record<string, GeneratedMaterials>>({})
@@ -126,9 +172,10 @@ function App() {
   }, [])
 
   const fitAverage = useMemo(() => {
-    if (!jobs.length) return 0
-    const total = jobs.reduce((sum, item) => sum + item.fit_score, 0)
-    return Math.round(total / jobs.length)
+    const scores = jobs.flatMap((item) => (item.fit_score === null ? [] : [item.fit_score]))
+    if (!scores.length) return 0
+    const total = scores.reduce((sum, score) => sum + score, 0)
+    return Math.round(total / scores.length)
   }, [jobs])
 
   const updateMessage = (msg: string | null) => {
@@ -144,10 +191,11 @@ function App() {
     try {
       const formData = new FormData()
       formData.append('file', file)
-      const data = await api<{ text: string; skills: string[] }>('/upload/resume', {
+      const data = await api<{ resume_id: string; text: string; skills: string[] }>('/upload/resume', {
         method: 'POST',
         body: formData,
       })
+      setResumeId(data.resume_id)
       setResumeText(data.text)
       setResumeSkills(data.skills || [])
       setResumeFilename(file.name || 'No file chosen')
@@ -165,14 +213,18 @@ function App() {
     try {
       const formData = new FormData()
       formData.append('file', file)
-      const data = await api<{ urls: string[]; meta: Record<string, CsvMeta> }>('/upload/csv', {
+      const data = await api<{ urls: string[]; meta: Record<string, CsvMeta>; report?: CsvReport }>('/upload/csv', {
         method: 'POST',
         body: formData,
       })
       setUrls(data.urls)
       setUrlMeta(data.meta || {})
       setCsvFilename(file.name || 'No file chosen')
-      updateMessage(`Loaded ${data.urls.length} job URLs`)
+      const skipped = [
+        data.report?.duplicates ? `${data.report.duplicates} duplicates` : '',
+        data.report?.invalid ? `${data.report.invalid} invalid rows` : '',
+      ].filter(Boolean)
+      updateMessage(`Loaded ${data.urls.length} job URLs${skipped.length ? ` (skipped ${skipped.join(', ')})` : ''}`)
     } catch (err) {
       setError((err as Error).message)
     } finally {
@@ -196,30 +248,45 @@ function App() {
       setLoading((state) => ({ ...state, process: true }))
       setError(null)
       const savedUrls = new Set(saved.map((s) => s.job.url))
+      const pendingUrls = urls.filter((url) => !savedUrls.has(url))
+      const skipped = totalJobs - pendingUrls.length
       const results: JobAnalysis[] = []
+      let failed = 0
+      setProgress({ visible: true, total: totalJobs, current: skipped })
+      setJobs([])
+      setMaterials({})
       try {
-        for (let idx = 0; idx < urls.length; idx++) {
-          const url = urls[idx]
-          if (savedUrls.has(url)) {
-            const currentCompleted = idx + 1
-            setProgress({ visible: true, total: totalJobs, current: currentCompleted })
-            continue
-          }
+        if (metadataFirst && pendingUrls.length) {
+          // Render straight from the CSV columns; pages are fetched later for the jobs the user opens.
           const formData = new FormData()
-          formData.append('resume_text', resumeText)
-          formData.append('url', url)
-          formData.append('meta', JSON.stringify(urlMeta[url] || {}))
-          const resp = await api<{ job: JobAnalysis }>('/jobs/process_one', {
-            method: 'POST',
-            body: formData,
+          formData.append('resume_id', resumeId)
+          formData.append('urls', pendingUrls.join(','))
+          formData.append('url_meta', JSON.stringify(urlMeta))
+          const data = await api<{ jobs: JobAnalysis[] }>('/jobs/process/metadata', { method: 'POST', body: formData })
+          setJobs(data.jobs)
+          updateMessage('Jobs loaded from CSV; fetch details per job as needed')
+          return
+        }
+        if (pendingUrls.length) {
+          const formData = new FormData()
+          formData.append('resume_id', resumeId)
+          formData.append('urls', pendingUrls.join(','))
+          formData.append('url_meta', JSON.stringify(urlMeta))
+          // Results arrive in completion order; render each one as soon as it lands.
+          await streamNdjson<ProcessStreamEvent>('/jobs/process/stream', { method: 'POST', body: formData }, (event) => {
+            if (event.event === 'job') {
+              if (!results.some((item) => item.job.id === event.job.job.id)) {
+                results.push(event.job)
+                setJobs([...results])
+              }
+              setProgress({ visible: true, total: totalJobs, current: skipped + event.done })
+            } else if (event.event === 'error') {
+              failed += 1
+              setProgress({ visible: true, total: totalJobs, current: skipped + event.done })
+            }
           })
-          results.push(resp.job)
-          const currentCompleted = idx + 1
-          setProgress({ visible: true, total: totalJobs, current: currentCompleted })
         }
-        setJobs(results)
-        setMaterials({})
-        updateMessage('Jobs analyzed')
+        updateMessage(failed ? `Jobs analyzed (${failed} failed)` : 'Jobs analyzed')
       } catch (err) {
         setError((err as Error).message)
       } finally {
@@ -238,13 +305,13 @@ function App() {
     setError(null)
     try {
       const formData = new FormData()
-      formData.append('resume_text', resumeText)
+      formData.append('resume_id', resumeId)
       formData.append('url', trimmed)
       const resp = await api<{ job: JobAnalysis }>('/jobs/process_one', {
         method: 'POST',
         body: formData,
       })
-      setJobs((state) => [resp.job, ...state])
+      setJobs((state) => [resp.job, ...state.filter((item) => item.job.id !== resp.job.id)])
       setMaterials({})
       updateMessage('Job analyzed')
       setSingleUrl('')
@@ -255,36 +322,59 @@ function App() {
     }
   }
 
-  const generateForJob = async (jobId: string) => {
+  // Fetches the full page for a CSV-only (partial) job and swaps the enriched analysis into the list.
+  const enrichJob = async (analysis: JobAnalysis): Promise<JobAnalysis> => {
+    if (!analysis.job.partial) return analysis
+    setEnrichingId(analysis.job.id)
+    try {
+      const formData = new FormData()
+      formData.append('resume_id', resumeId)
+      formData.append('url', analysis.job.url)
+      formData.append('meta', JSON.stringify(urlMeta[analysis.job.url] || {}))
+      const resp = await api<{ job: JobAnalysis }>('/jobs/process_one', { method: 'POST', body: formData })
+      setJobs((state) => state.map((item) => (item.job.id === analysis.job.id ? resp.job : item)))
+      return resp.job
+    } finally {
+      setEnrichingId(null)
+    }
+  }
+
+  const handleEnrich = async (jobId: string) => {
     const analysis = jobs.find((j) => j.job.id === jobId)
     if (!analysis) return
+    setError(null)
+    try {
+      await enrichJob(analysis)
+      setDescriptionOpen((state) => ({ ...state, [jobId]: true }))
+    } catch (err) {
+      setError((err as Error).message)
+    }
+  }
+
+  const generateForJob = async (jobId: string) => {
+    const found = jobs.find((j) => j.job.id === jobId)
+    if (!found) return
     setLoading((state) => ({ ...state, generateId: jobId }))
     setError(null)
     try {
+      const analysis = await enrichJob(found)
       const body = JSON.stringify({
         job: analysis.job,
-        resume_text: resumeText,
+        resume_id: resumeId,
         matched_skills: analysis.matched_skills,
       })
-      const [inmailResp, coverResp] = await Promise.all([
-        api<{ inmail: string }>('/generate/inmail', {
-          method: 'POST',
-          headers: { 'Content-Type': 'application/json' },
-          body,
-        }),
-        api<{ cover_letter: string }>('/generate/coverletter', {
-          method: 'POST',
-          headers: { 'Content-Type': 'application/json' },
-          body,
-        }),
-      ])
+      const generated = await api<GeneratedMaterials>('/generate/materials', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body,
+      })
       setMaterials((state) => ({
         ...state,
-        [jobId]: { inmail: inmailResp.inmail, cover_letter: coverResp.cover_letter },
+        [jobId]: generated,
       }))
       setMaterialsDraft((state) => ({
         ...state,
-        [jobId]: { inmail: inmailResp.inmail, cover_letter: coverResp.cover_letter },
+        [jobId]: generated,
       }))
       setMaterialsOpen((state) => ({ ...state, [jobId]: true }))
       updateMessage('Content generated')
@@ -296,14 +386,15 @@ function App() {
   }
 
   const savePosting = async (jobId: string) => {
-    const analysis = jobs.find((j) => j.job.id === jobId)
-    if (!analysis) return
+    const found = jobs.find((j) => j.job.id === jobId)
+    if (!found) return
 
     const generated = materials[jobId] || null
 
     setLoading((state) => ({ ...state, saveId: jobId }))
     setError(null)
     try {
+      const analysis = await enrichJob(found)
       const payload = {
         job: analysis.job,
         fit_score: analysis.fit_score,
@@ -339,8 +430,9 @@ function App() {
   const exportCsv = async () => {
     setLoading((state) => ({ ...state, exportCsv: true }))
     try {
-      const data = await api<{ csv: string }>('/saved/export')
-      const blob = new Blob([data.csv], { type: 'text/csv' })
+      const res = await fetch(`${API_BASE}/saved/export`)
+      if (!res.ok) throw new Error('CSV export failed')
+      const blob = await res.blob()
       const url = window.URL.createObjectURL(blob)
       const link = document.createElement('a')
       link.href = url
@@ -414,22 +506,15 @@ function App() {
       }
       const body = JSON.stringify({
         job: jobPayload,
-        resume_text: resumeText,
+        resume_id: resumeId,
         matched_skills: resumeSkills,
       })
-      const [inmailResp, coverResp] = await Promise.all([
-        api<{ inmail: string }>('/generate/inmail', {
-          method: 'POST',
-          headers: { 'Content-Type': 'application/json' },
-          body,
-        }),
-        api<{ cover_letter: string }>('/generate/coverletter', {
-          method: 'POST',
-          headers: { 'Content-Type': 'application/json' },
-          body,
-        }),
-      ])
-      setCustomOutput({ inmail: inmailResp.inmail, cover_letter: coverResp.cover_letter })
+      const generated = await api<GeneratedMaterials>('/generate/materials', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body,
+      })
+      setCustomOutput(generated)
       setCustomGenerated(true)
       updateMessage('Custom materials generated')
     } catch (err) {
@@ -527,11 +612,15 @@ const UploadZone = ({
               <span className="rounded-full bg-white/5 px-2 py-1">
                 Work: {displayOrUnavailable(item.job.work_type)}
               </span>
+              {item.job.partial && (
+                <span className="rounded-full bg-amber-500/20 px-2 py-1 text-amber-100">Preview from CSV</span>
+              )}
             </div>
           </div>
           <div className={`rounded-xl bg-gradient-to-br ${gradient} px-3 py-2 text-center text-white`}>
             <p className="text-[10px] uppercase tracking-wide">Fit Score</p>
-            <p className="text-xl font-bold">{item.fit_score}%</p>
+            <p className="text-xl font-bold">{item.fit_score === null ? '—' : `${item.fit_score}%`}</p>
+            {item.fit_score === null && <p className="text-[10px] text-white/80">Fetch details to score</p>}
           </div>
         </div>
         <p
@@ -555,7 +644,7 @@ const UploadZone = ({
         )}
 
         <div className="mt-4 flex flex-wrap gap-2">
-          {item.missing_skills.length ? (
+          {item.job.partial ? null : item.missing_skills.length ? (
             item.missing_skills.map((skill) => (
               <span key={skill} className="rounded-full bg-white/10 px-3 py-1 text-xs font-semibold text-amber-200">
                 Missing: {skill}
@@ -575,6 +664,15 @@ const UploadZone = ({
           >
             View on LinkedIn
           </button>
+          {item.job.partial && (
+            <button
+              onClick={() => handleEnrich(item.job.id)}
+              disabled={enrichingId === item.job.id}
+              className="rounded-xl border border-white/15 px-3 py-2 text-xs font-semibold text-white/80 transition hover:border-indigo-400/60 hover:text-white disabled:cursor-not-allowed disabled:opacity-60"
+            >
+              {enrichingId === item.job.id ? 'Fetching…' : 'Fetch details'}
+            </button>
+          )}
           <button
             onClick={() => generateForJob(item.job.id)}
             disabled={isGenerating}
@@ -821,34 +919,45 @@ const UploadZone = ({
             </div>
             <div className="mt-3">
               {showCsvUpload ? (
-                <UploadZone
-                  label="Choose File"
-                  accept=".csv,text/csv"
-                  inputKey={csvInputKey}
-                  onReset={() => {
-                    const next = csvInputKey + 2
-                    console.info(`[UploadZone] csv reset to key=${next}`)
-                    setCsvInputKey(next)
-                  }}
-                  busy={loading.csv}
-                  helper={
-                    <>
-                      Upload a CSV containing LinkedIn job URLs. 
-                      See{' '}
-                      <button
-                        className="text-indigo-200 underline"
-                        onClick={() => {
-                          const element = document.getElementById('bookmarklet-section')
-                          if (element) element.scrollIntoView({ behavior: 'smooth' })
-                        }}
-                      >
-                        here
-                      </button>{' '}for example.
-                    </>
-                  }
-                  onFile={handleCsvUpload}
-                  filename={csvFilename}
-                />
+                <>
+                  <UploadZone
+                    label="Choose File"
+                    accept=".csv,text/csv"
+                    inputKey={csvInputKey}
+                    onReset={() => {
+                      const next = csvInputKey + 2
+                      console.info(`[UploadZone] csv reset to key=${next}`)
+                      setCsvInputKey(next)
+                    }}
+                    busy={loading.csv}
+                    helper={
+                      <>
+                        Upload a CSV containing LinkedIn job URLs. 
+                        See{' '}
+                        <button
+                          className="text-indigo-200 underline"
+                          onClick={() => {
+                            const element = document.getElementById('bookmarklet-section')
+                            if (element) element.scrollIntoView({ behavior: 'smooth' })
+                          }}
+                        >
+                          here
+                        </button>{' '}for example.
+                      </>
+                    }
+                    onFile={handleCsvUpload}
+                    filename={csvFilename}
+                  />
+                  <label className="mt-3 flex items-center gap-2 text-xs text-white/70">
+                    <input
+                      type="checkbox"
+                      checked={metadataFirst}
+                      onChange={(e) => setMetadataFirst(e.target.checked)}
+                      className="accent-indigo-500"
+                    />
+                    Quick load from CSV columns (fetch job details only when you open, generate or save)
+                  </label>
+                </>
               ) : (
                 <div className="block w-full rounded-2xl border border-white/10 bg-white/5 p-4 text-white transition hover:border-indigo-400/60 hover:bg-white/10">
                   <label className="text-xs text-white/70">Paste LinkedIn Job URL</label>
@@ -988,7 +1097,8 @@ const UploadZone = ({
               </div>
             )}
             {[...jobs]
-              .sort((a, b) => b.fit_score - a.fit_score)
+              // Unscored (partial) postings go last until their page is parsed.
+              .sort((a, b) => (b.fit_score ?? -1) - (a.fit_score ?? -1))
               .map((job, idx) => renderJobCard(job, idx))}
           </div>
         </section>